@@ -45,6 +45,12 @@ const BATTLE_UI = {
         ROWS: 2,
         COLUMN_SPACING: 40,
         ROW_SPACING: 8
+    },
+    ROUND_LOG: {
+        TOP: 90,
+        HEIGHT: 290,
+        MAX_LINES: 12,
+        BUTTON_SPACING: 40
     }
 };
 
@@ -184,7 +190,7 @@ export class BattleRenderer {
             (isBoss ? BATTLE_UI.BOX.ENEMY.BOSS_WIDTH : BATTLE_UI.BOX.ENEMY.WIDTH);
         const boxHeight = isPlayer 
             ? (isActiveTurn && this.game.gameState.input_type !== 'battle_target' 
-                ? BATTLE_UI.BOX.PLAYER.ACTIVE_HEIGHT 
+                ? BATTLE_UI.BOX.PLAYER.ACTIVE_HEIGHT + this.getExtraMenuHeight()
                 : BATTLE_UI.BOX.PLAYER.HEIGHT) 
             : (isBoss ? BATTLE_UI.BOX.ENEMY.BOSS_HEIGHT : BATTLE_UI.BOX.ENEMY.HEIGHT);
 
@@ -288,7 +294,8 @@ export class BattleRenderer {
         const activeCharacterBox = this.characterContainer.children[activeCharacterIndex];
         const options = this.game.gameState.menu_options || [];
         
-        const { COLUMNS, ROWS, COLUMN_SPACING, ROW_SPACING } = BATTLE_UI.MENU;
+        const { COLUMNS, COLUMN_SPACING, ROW_SPACING } = BATTLE_UI.MENU;
+        const ROWS = this.getMenuRows();
         const buttonWidth = LAYOUT.BUTTON.BATTLE_WIDTH;
         const buttonHeight = LAYOUT.BUTTON.HEIGHT;
         
@@ -315,6 +322,64 @@ export class BattleRenderer {
         });
     }
 
+    getMenuRows() {
+        const options = this.game.gameState.menu_options || [];
+        return Math.max(BATTLE_UI.MENU.ROWS, Math.ceil(options.length / BATTLE_UI.MENU.COLUMNS));
+    }
+
+    getExtraMenuHeight() {
+        const extraRows = this.getMenuRows() - BATTLE_UI.MENU.ROWS;
+        return extraRows * (LAYOUT.BUTTON.HEIGHT + BATTLE_UI.MENU.ROW_SPACING);
+    }
+
+    renderBattleRoundState() {
+        this.clearContainers();
+        const { player_party, main_text, sub_text, menu_options } = this.game.gameState;
+        const padding = 20;
+        const width = this.app.screen.width - (padding * 2);
+
+        // Title bar, as in the battle menu
+        const titleBlur = createBlurSprite(width, 45, padding, padding);
+        const titleBorder = createBorder(padding, padding, width, 45);
+        const titleText = createText(main_text || '', SUB_TEXT_STYLE, padding * 2, padding + 10);
+        this.battleMenuContainer.addChild(titleBlur, titleBorder, titleText);
+
+        // The round's log replaces the enemy row; enemy state is part of the log
+        const { TOP, HEIGHT, MAX_LINES, BUTTON_SPACING } = BATTLE_UI.ROUND_LOG;
+        const lines = (sub_text || '').split('\n').filter(line => line.trim() !== '');
+        const logBlur = createBlurSprite(width, HEIGHT, padding, TOP);
+        const logBorder = createBorder(padding, TOP, width, HEIGHT);
+        const logText = createText(
+            lines.slice(-MAX_LINES).join('\n'),
+            { ...CHARACTER_TEXT_STYLE, wordWrap: true, wordWrapWidth: width - (padding * 2) },
+            padding * 2,
+            TOP + padding / 2
+        );
+        this.battleMenuContainer.addChild(logBlur, logBorder, logText);
+
+        if (player_party?.characters) {
+            this.renderParty(player_party.characters, true);
+        }
+
+        // Continue / Stop Auto buttons centered at the bottom of the screen
+        const options = menu_options || [];
+        const buttonWidth = LAYOUT.BUTTON.CENTER_WIDTH;
+        const totalWidth = options.length * buttonWidth + (options.length - 1) * BUTTON_SPACING;
+        options.forEach((option, index) => {
+            const buttonContainer = createButtonContainer(option, buttonWidth);
+            buttonContainer.x = (this.app.screen.width - totalWidth) / 2
+                + index * (buttonWidth + BUTTON_SPACING) + buttonWidth / 2;
+            buttonContainer.y = this.app.screen.height - 60;
+
+            const onClickHandler = () => this.game.handleInput(option);
+            this.attachButtonEvents(buttonContainer, onClickHandler);
+            buttonContainer.onClick = onClickHandler;
+
+            this.menuButtons.push(buttonContainer);
+            this.battleMenuContainer.addChild(buttonContainer);
+        });
+    }
+
     attachCharacterBoxEvents(boxContainer, character) {
         let isPressed = false;
 
@@ -19,6 +19,10 @@ class Communicator {
 
     handleMessage(event) {
         const data = JSON.parse(event.data);
+        if (data.type === 'image_ready') {
+            this.game.handleImageReady(data.url, data.variants);
+            return;
+        }
         this.game.updateGameState(data);
     }
 
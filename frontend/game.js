@@ -1,5 +1,6 @@
 import { Renderer } from './renderer.js';
 import { Communicator } from './communicator.js';
+import { addImagePlaceholders } from './ui_helpers.js';
 
 class Game {
     constructor() {
@@ -32,10 +33,15 @@ class Game {
     }
 
     updateGameState(newState) {
+        addImagePlaceholders(newState.image_placeholders);
         this.gameState = newState;
         this.renderer.setLoading(false);
         this.renderer.updateDisplay();
     }
+
+    handleImageReady(url, variants = []) {
+        this.renderer.reloadImages([url, ...variants]);
+    }
 }
 
 // Ensure the DOM is fully loaded before initializing the game
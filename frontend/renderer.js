@@ -15,6 +15,7 @@ import {
     createSubTextPortrait,
     adjustTextForPortrait,
     resetTextPosition,
+    setSpriteImage,
 } from './ui_helpers.js';
 import { LoadingScreen } from './loading.js';
 import { TitleScreen } from './title.js';
@@ -33,7 +34,6 @@ class Renderer {
         this.menuButtons = [];
         this.isLoading = false;
         this.textInputContainer = null;
-        this.backgroundTextureCache = {};
 
         // Properties for keyboard control
         this.selectedButtonIndex = -1; // No button selected initially
@@ -393,6 +393,9 @@ class Renderer {
             case 'battle_target':
                 this.renderBattleTargetState();
                 break;
+            case 'battle_round':
+                this.renderBattleRoundState();
+                break;
             case 'stats_message':
                 this.renderStatsMessage();
                 break;
@@ -515,20 +518,33 @@ class Renderer {
             return;
         }
 
-        if (this.backgroundTextureCache[url]) {
-            this.applyBackgroundTexture(this.backgroundTextureCache[url]);
-        } else {
-            const texture = PIXI.Texture.from(url);
-            this.backgroundTextureCache[url] = texture;
-            this.applyBackgroundTexture(texture);
+        // PIXI.Texture.from caches textures by URL
+        setSpriteImage(this.backgroundSprite, url);
+        this.resizeBackground();
+    }
+
+    reloadImages(urls) {
+        // The server hands out image URLs before the files exist, so drop
+        // whatever was loaded for them (usually a failed request) and
+        // redraw if the current screen shows one of them
+        urls.forEach(url => {
+            PIXI.Texture.removeFromCache(url);
+            PIXI.BaseTexture.removeFromCache(url);
+        });
+
+        const gameState = this.game.gameState;
+        if (!gameState || this.isLoading || gameState.input_type === 'text') {
+            return;
+        }
+        const stateText = JSON.stringify(gameState);
+        if (urls.some(url => stateText.includes(JSON.stringify(url).slice(1, -1)))) {
+            this.updateDisplay();
         }
     }
 
-    applyBackgroundTexture(texture) {
-        this.backgroundSprite.texture = texture;
+    resizeBackground() {
         this.backgroundSprite.width = this.app.screen.width;
         this.backgroundSprite.height = this.app.screen.height;
-        this.backgroundSprite.texture.baseTexture.scaleMode = PIXI.SCALE_MODES.NEAREST;
     }
 
     renderBattleState() {
@@ -543,6 +559,13 @@ class Renderer {
         this.battleRenderer.renderBattleTargetState();
     }
 
+    renderBattleRoundState() {
+        this.hideMainTexts();
+        this.setSubTextVisibility(false);
+        this.clearMenuOptions();
+        this.battleRenderer.renderBattleRoundState();
+    }
+
     hideMainTexts() {
         this.mainTextBlur.visible = false;
         this.subTextBlur.visible = false;
@@ -7,6 +7,41 @@ import { BUTTON_STYLE, CHARACTER_TEXT_STYLE, LAYOUT, STYLE } from './constants.j
  * @property {boolean} active_turn - Whether it's the character's turn
  */
 
+// Inline previews of images that are still loading, keyed by image URL
+const imagePlaceholders = {};
+
+function addImagePlaceholders(placeholders) {
+    Object.assign(imagePlaceholders, placeholders || {});
+}
+
+/**
+ * Show an image on a sprite, painting its placeholder until the image has loaded.
+ * @param {PIXI.Sprite} sprite - Sprite to update
+ * @param {string} url - Image URL
+ * @param {number} scaleMode - Scale mode for the loaded image
+ * @returns {PIXI.Texture} The texture of the full image
+ */
+function setSpriteImage(sprite, url, scaleMode = PIXI.SCALE_MODES.NEAREST) {
+    const texture = PIXI.Texture.from(url);
+    texture.baseTexture.scaleMode = scaleMode;
+    const placeholder = imagePlaceholders[url];
+    if (texture.baseTexture.valid || !placeholder) {
+        sprite.texture = texture;
+        return texture;
+    }
+
+    // Smooth scaling makes the tiny preview look blurred rather than blocky
+    const preview = PIXI.Texture.from(placeholder);
+    preview.baseTexture.scaleMode = PIXI.SCALE_MODES.LINEAR;
+    sprite.texture = preview;
+    texture.baseTexture.once('loaded', () => {
+        if (!sprite.destroyed && sprite.texture === preview) {
+            sprite.texture = texture;
+        }
+    });
+    return texture;
+}
+
 // Utility functions
 function createBasicGraphics(x, y, width, height, radius, color, alpha = 1) {
     const graphics = new PIXI.Graphics();
@@ -98,10 +133,10 @@ function createPortrait(characterOrUrl, x, y, size = 64, isDead = false) {
         borderRadius, 0x708090, 0.5
     );
 
-    const portrait = PIXI.Sprite.from(imageUrl);
+    const portrait = new PIXI.Sprite();
+    setSpriteImage(portrait, imageUrl);
     portrait.width = size;
     portrait.height = size;
-    portrait.texture.baseTexture.scaleMode = PIXI.SCALE_MODES.NEAREST;
     portrait.roundPixels = true;
 
     // Apply greyscale filter if character is dead
@@ -414,6 +449,8 @@ function resetTextPosition(params) {
 
 // Export all functions at the end of the file
 export {
+    addImagePlaceholders,
+    setSpriteImage,
     createBlurSprite,
     createBorder,
     createText,
@@ -1,9 +1,26 @@
+import base64
+import hashlib
+import itertools
+import json
+import multiprocessing
 import os
+import re
+import threading
+import time
+import httpx
+import numpy as np
 import replicate
 import requests
-from PIL import Image
+import requests.adapters
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from queue import PriorityQueue
+from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from src.utils.utils import load_config
 
 IMAGE_STYLES = {
@@ -22,19 +39,77 @@ JRPG_BOILERPLATE = (
 )
 
 
-def load_image_url(url: str) -> Image.Image:
-    response = requests.get(url)
-    response.raise_for_status()
-    return Image.open(BytesIO(response.content))
+# Seconds to wait for a connection and between received bytes
+IMAGE_CONNECT_TIMEOUT = 10
+IMAGE_READ_TIMEOUT = 60
+
+_replicate_client: Optional[replicate.Client] = None
+_http_session: Optional[requests.Session] = None
+_client_lock = threading.Lock()
+
+
+def get_replicate_client() -> replicate.Client:
+    global _replicate_client
+    with _client_lock:
+        if _replicate_client is None:
+            _replicate_client = replicate.Client(
+                api_token=config.get("image_api_key"),
+                timeout=httpx.Timeout(
+                    IMAGE_READ_TIMEOUT, connect=IMAGE_CONNECT_TIMEOUT
+                ),
+            )
+        return _replicate_client
+
+
+def get_http_session() -> requests.Session:
+    """Keep-alive session shared by the image workers, one connection each."""
+    global _http_session
+    with _client_lock:
+        if _http_session is None:
+            workers = config.get("image_workers", 4)
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=workers, pool_maxsize=workers
+            )
+            _http_session = requests.Session()
+            _http_session.mount("https://", adapter)
+            _http_session.mount("http://", adapter)
+        return _http_session
+
+
+def download_image(url: str, file_path: str) -> str:
+    """
+    Stream an image to a temporary file next to file_path, then move it into
+    place once it is safely on disk.
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    temp_path = f"{file_path}.tmp"
+    try:
+        with get_http_session().get(
+            url, stream=True, timeout=(IMAGE_CONNECT_TIMEOUT, IMAGE_READ_TIMEOUT)
+        ) as response:
+            response.raise_for_status()
+            with open(temp_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return file_path
 
 
 def generate_image_replicate(
     prompt: str,
+    file_path: str,
     aspect_ratio: Optional[str] = None,
     max_retries: int = 3,
     megapixels: float = 1,
-) -> Optional[Image.Image]:
-    client = replicate.Client(api_token=config.get("image_api_key"))
+) -> Optional[str]:
+    """Generate a PNG and save it to file_path, returning the path on success."""
+    client = get_replicate_client()
     for attempt in range(max_retries):
         try:
             output = client.run(
@@ -47,7 +122,8 @@ def generate_image_replicate(
                     "megapixels": str(megapixels),
                 },
             )[0]
-            return load_image_url(output)
+            # Newer clients return file objects instead of plain URLs
+            return download_image(getattr(output, "url", output), file_path)
         except replicate.exceptions.ModelError as e:
             if attempt < max_retries - 1:
                 print(f"Attempt {attempt + 1} failed: {str(e)}. Retrying...")
@@ -59,13 +135,228 @@ def generate_image_replicate(
             return None
 
 
+class ImageBackend(ABC):
+    """Turns a prompt into a PNG file."""
+
+    @property
+    @abstractmethod
+    def identity(self) -> str:
+        """Identifies the images this backend makes, for the image store."""
+
+    @abstractmethod
+    def generate(
+        self, prompt: str, file_path: str, aspect_ratio: str, megapixels: float
+    ) -> Optional[str]:
+        """Write the image to file_path and return it, or None on failure."""
+
+
+class ReplicateBackend(ImageBackend):
+    @property
+    def identity(self) -> str:
+        return config.get("image_model", "black-forest-labs/flux-schnell")
+
+    def generate(
+        self, prompt: str, file_path: str, aspect_ratio: str, megapixels: float
+    ) -> Optional[str]:
+        return generate_image_replicate(
+            prompt, file_path, aspect_ratio=aspect_ratio, megapixels=megapixels
+        )
+
+
+class ProceduralBackend(ImageBackend):
+    """
+    Offline backend drawing gradients, noise and a text label, seeded by the
+    prompt's hash. Images have the size the model would produce, and each
+    one takes a simulated generation time, so whole games can be created and
+    benchmarked without network access.
+    """
+
+    def __init__(self):
+        # Average seconds per image
+        self.latency = config.get("image_backend_latency", 2.0)
+
+    @property
+    def identity(self) -> str:
+        return "procedural"
+
+    @staticmethod
+    def image_size(aspect_ratio: str, megapixels: float) -> Tuple[int, int]:
+        width, height = (int(side) for side in (aspect_ratio or "1:1").split(":"))
+        scale = (megapixels * 1_000_000 / (width * height)) ** 0.5
+        # Sizes are rounded to multiples of 16 like the hosted models do
+        return (
+            max(16, round(width * scale / 16) * 16),
+            max(16, round(height * scale / 16) * 16),
+        )
+
+    def generate(
+        self, prompt: str, file_path: str, aspect_ratio: str, megapixels: float
+    ) -> Optional[str]:
+        seed = int(hashlib.sha256(prompt.encode()).hexdigest()[:16], 16)
+        rng = np.random.default_rng(seed)
+        time.sleep(self.latency * rng.uniform(0.5, 1.5))
+
+        width, height = self.image_size(aspect_ratio, megapixels)
+        top, bottom = rng.integers(0, 256, (2, 3))
+        ramp = np.linspace(0, 1, height)[:, None, None]
+        pixels = np.broadcast_to(top + (bottom - top) * ramp, (height, width, 3))
+        noise = rng.normal(0, rng.uniform(4, 24), (height, width, 3))
+        image = Image.fromarray(np.clip(pixels + noise, 0, 255).astype(np.uint8))
+
+        # Label the image with its subject, e.g. "called Hero, which looks..."
+        label = re.split(r"(?:called|named) ", prompt)[-1]
+        label = re.split(r"[,(]", label)[0].strip()[:40]
+        draw = ImageDraw.Draw(image)
+        font = ImageFont.load_default(size=max(12, height // 16))
+        center = (width // 2, height // 2)
+        draw.text(center, label, fill="white", font=font, anchor="mm")
+
+        directory, filename = os.path.split(file_path)
+        return save_image(image, directory, filename)
+
+
+IMAGE_BACKENDS = {
+    "replicate": ReplicateBackend,
+    "procedural": ProceduralBackend,
+}
+
+_image_backend: Optional[ImageBackend] = None
+
+
+def get_image_backend() -> ImageBackend:
+    global _image_backend
+    if _image_backend is None:
+        name = config.get("image_backend", "replicate")
+        if name not in IMAGE_BACKENDS:
+            raise ValueError(f"Unknown image backend: {name}")
+        _image_backend = IMAGE_BACKENDS[name]()
+    return _image_backend
+
+
 def save_image(image: Image.Image, directory: str, filename: str) -> str:
     os.makedirs(directory, exist_ok=True)
     file_path = os.path.join(directory, filename)
-    image.save(file_path, format="PNG")
+    # Write to a temporary file first, since an existing file counts as a
+    # finished image
+    temp_path = f"{file_path}.tmp"
+    image.save(temp_path, format="PNG")
+    os.replace(temp_path, file_path)
+    return file_path
+
+
+# WebP copies of every stored image, by longest side in pixels (None keeps
+# the original size). Game responses pick one per image slot.
+IMAGE_VARIANTS = {"full": None, "medium": 384, "thumb": 192}
+# Longest side of the inline preview shown while an image loads
+PLACEHOLDER_SIZE = 16
+
+_variant_pool: Optional[ProcessPoolExecutor] = None
+
+
+def make_variants(file_path: str) -> List[str]:
+    """Write the WebP variants of a PNG next to it. Runs in a worker process."""
+    paths = []
+    with Image.open(file_path) as image:
+        image.load()
+        for variant, max_side in IMAGE_VARIANTS.items():
+            resized = image.copy()
+            if max_side:
+                resized.thumbnail((max_side, max_side), Image.LANCZOS)
+            path = variant_path(file_path, variant)
+            temp_path = f"{path}.tmp"
+            resized.save(temp_path, format="WEBP", quality=80, method=4)
+            os.replace(temp_path, path)
+            paths.append(path)
+
+        preview = image.copy()
+        preview.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.LANCZOS)
+        buffer = BytesIO()
+        preview.save(buffer, format="WEBP", quality=50)
+        encoded = base64.b64encode(buffer.getvalue()).decode()
+        path = placeholder_path(file_path)
+        with open(f"{path}.tmp", "w") as f:
+            f.write(f"data:image/webp;base64,{encoded}")
+        os.replace(f"{path}.tmp", path)
+        paths.append(path)
+    return paths
+
+
+def build_variants(file_path: str) -> str:
+    """
+    Encode the variants of an image in the process pool and wait for them.
+    The image itself stays usable when they fail.
+    """
+    global _variant_pool
+    if _variant_pool is None:
+        # Spawned rather than forked, since the parent runs several threads
+        _variant_pool = ProcessPoolExecutor(
+            max_workers=config.get("image_variant_workers", 2),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    try:
+        _variant_pool.submit(make_variants, file_path).result()
+        _variants_built[file_path] = True
+    except Exception as e:
+        print(f"Failed to build image variants for {file_path}: {str(e)}")
     return file_path
 
 
+# Whether the variants of a stored image exist, so responses don't stat them
+_variants_built: Dict[str, bool] = {}
+
+
+def variants_built(file_path: str) -> bool:
+    built = _variants_built.get(file_path)
+    if built is None:
+        # Only images from earlier runs get here; make_variants writes the
+        # placeholder last, so it stands for all of the variants
+        built = os.path.exists(placeholder_path(file_path))
+        _variants_built[file_path] = built
+    return built
+
+
+def variant_path(file_path: str, variant: str) -> str:
+    return f"{os.path.splitext(file_path)[0]}.{variant}.webp"
+
+
+def placeholder_path(file_path: str) -> str:
+    return f"{os.path.splitext(file_path)[0]}.lqip"
+
+
+_placeholders: Dict[str, str] = {}
+
+
+def image_placeholder(url: str) -> Optional[str]:
+    """
+    A tiny data URI preview of a stored image or one of its variants, or
+    None if there is none (yet).
+    """
+    if not url or not url.startswith(ImageStore().directory + "/"):
+        return None
+    directory, filename = os.path.split(url)
+    file_path = os.path.join(directory, filename.split(".")[0] + ".png")
+    if not variants_built(file_path):
+        return None
+    path = placeholder_path(file_path)
+    if path not in _placeholders:
+        with open(path, "r") as f:
+            _placeholders[path] = f.read()
+    return _placeholders[path]
+
+
+def variant_url(url: str, variant: str) -> str:
+    """
+    The URL of a variant of a stored image. Other URLs, and stored images
+    whose variants aren't built (yet), are returned unchanged; the client
+    gets the variants with the image_ready push once they are.
+    """
+    if not url or not url.startswith(ImageStore().directory + "/"):
+        return url
+    if variants_built(url):
+        return variant_path(url, variant)
+    return url
+
+
 def save_dummy_image(
     directory: str, filename: str, size: Tuple[int, int] = (64, 64)
 ) -> str:
@@ -88,6 +379,49 @@ def simple_zoom(image: Image.Image, crop_percentage: float = 0.1) -> Image.Image
     return cropped.resize((width, height), Image.NEAREST)
 
 
+class ImageStore:
+    """
+    Content-addressed image files shared by every dream.
+
+    Files are named by a hash of everything that determines the image, so a
+    prompt that was rendered before is never sent to the model again and
+    entities with the same name in different dreams no longer overwrite each
+    other.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ImageStore, cls).__new__(cls)
+            cls._instance.initialize()
+        return cls._instance
+
+    def initialize(self):
+        self.directory = "images/store"
+
+    @staticmethod
+    def key(
+        prompt: str, aspect_ratio: str, megapixels: float, apply_zoom: float
+    ) -> str:
+        parts = [
+            prompt,
+            IMAGE_STYLE,
+            aspect_ratio,
+            megapixels,
+            apply_zoom,
+            get_image_backend().identity,
+        ]
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:32]
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def set_dream(self, title: str) -> None:
+        """Start on the given dream, whose entities get portraits of their own."""
+        PortraitRegistry().clear()
+
+
 def generate_and_save_image(
     prompt: str,
     directory: str,
@@ -98,19 +432,266 @@ def generate_and_save_image(
     apply_zoom: float = 0,
     megapixels: float = 1,
 ) -> Optional[str]:
+    """
+    Return the URL of the image right away. Images rendered before come from
+    the store as they are; new ones are generated in the background and
+    image listeners are told once the file exists.
+    """
     if use_dummy:
         return save_dummy_image(directory, filename, dummy_size)
 
-    image = generate_image_replicate(
-        prompt, aspect_ratio=aspect_ratio, megapixels=megapixels
-    )
-    if not image:
-        return None
+    store = ImageStore()
+    key = store.key(prompt, aspect_ratio, megapixels, apply_zoom)
+    url = store.path(key)
+    if os.path.exists(url):
+        if not variants_built(url):
+            queue_image(url, lambda: build_variants(url))
+        return url
+
+    def generate() -> Optional[str]:
+        # Images that get zoomed are downloaded to a side file, since only
+        # the finished image may appear under the stored URL
+        path = get_image_backend().generate(
+            prompt,
+            url if apply_zoom <= 0 else f"{url}.raw",
+            aspect_ratio,
+            megapixels,
+        )
+        if not path:
+            return None
+
+        # Only decode the image when it needs post-processing
+        if apply_zoom > 0:
+            with Image.open(path) as image:
+                image = simple_zoom(image, crop_percentage=apply_zoom)
+            save_image(image, store.directory, f"{key}.png")
+            os.remove(path)
+
+        build_variants(url)
+        return url
+
+    return queue_image(url, generate)
+
+
+# Image job priorities, most urgent first
+ON_SCREEN = 0
+NEXT_SCREEN = 1
+PREFETCH = 2
+
+_image_context: ContextVar[Tuple[Optional[str], int]] = ContextVar(
+    "image_context", default=(None, PREFETCH)
+)
+_image_listeners: List[Callable[[str], None]] = []
+
+
+@dataclass
+class ImageJob:
+    url: str
+    generate: Callable[[], Optional[str]]
+    priority: int
+    group: Optional[str]
+    future: Future = field(default_factory=Future)
+    running: bool = False
+
+
+class ImageScheduler:
+    """
+    Runs image jobs on a fixed number of worker threads, most urgent first.
+
+    Jobs are grouped by the location that asked for them. Leaving a location
+    parks its jobs that haven't started; a parked image is queued again as
+    soon as something asks for it or puts it on screen. Failed images are
+    kept aside the same way and retried when they are asked for again.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ImageScheduler, cls).__new__(cls)
+            cls._instance.initialize()
+        return cls._instance
+
+    def initialize(self):
+        self.max_workers = config.get("image_workers", 4)
+        self.queue: PriorityQueue = PriorityQueue()
+        self.jobs: Dict[str, ImageJob] = {}
+        self.parked: Dict[str, ImageJob] = {}
+        self.failed: Dict[str, ImageJob] = {}
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.workers: List[threading.Thread] = []
+
+    def submit(
+        self,
+        url: str,
+        generate: Callable[[], Optional[str]],
+        priority: int = PREFETCH,
+        group: Optional[str] = None,
+    ) -> Future:
+        with self.lock:
+            self.failed.pop(url, None)
+            job = self.jobs.get(url) or self.parked.get(url)
+            if job is None:
+                job = ImageJob(url, generate, priority, group)
+                self._enqueue(job)
+            else:
+                self._raise_priority(job, priority)
+            self._start_workers()
+            return job.future
+
+    def prioritize(self, urls: List[str], priority: int = ON_SCREEN) -> None:
+        with self.lock:
+            for url in urls:
+                if url in self.failed:
+                    self._retry(url, priority)
+                job = self.jobs.get(url) or self.parked.get(url)
+                if job is not None:
+                    self._raise_priority(job, priority)
+
+    def prioritize_group(self, group: str, priority: int) -> None:
+        with self.lock:
+            for job in list(self.jobs.values()) + list(self.parked.values()):
+                if job.group == group:
+                    self._raise_priority(job, priority)
+
+    def cancel_group(self, group: str) -> None:
+        """Park the queued jobs of a group. Running jobs are left to finish."""
+        with self.lock:
+            for url, job in list(self.jobs.items()):
+                if job.group == group and not job.running:
+                    del self.jobs[url]
+                    self.parked[url] = job
+
+    def pending(self, url: str) -> bool:
+        """Whether an image is queued, parked or being generated."""
+        with self.lock:
+            return url in self.jobs or url in self.parked
+
+    def _retry(self, url: str, priority: int) -> None:
+        failed = self.failed.pop(url)
+        self._enqueue(ImageJob(url, failed.generate, priority, failed.group))
+        self._start_workers()
 
-    if apply_zoom > 0:
-        image = simple_zoom(image, crop_percentage=apply_zoom)
+    def _raise_priority(self, job: ImageJob, priority: int) -> None:
+        if job.url in self.parked:
+            del self.parked[job.url]
+            job.priority = min(job.priority, priority)
+            self._enqueue(job)
+        elif priority < job.priority and not job.running:
+            # The old queue entry goes stale and is skipped by the workers
+            job.priority = priority
+            self._enqueue(job)
 
-    return save_image(image, directory, filename)
+    def _enqueue(self, job: ImageJob) -> None:
+        self.jobs[job.url] = job
+        self.queue.put((job.priority, next(self.counter), job))
+
+    def _start_workers(self) -> None:
+        while len(self.workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._work, name=f"images_{len(self.workers)}", daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            priority, _, job = self.queue.get()
+            with self.lock:
+                if (
+                    self.jobs.get(job.url) is not job
+                    or job.running
+                    or priority != job.priority
+                ):
+                    continue
+                job.running = True
+            succeeded = False
+            try:
+                succeeded = job.generate() is not None
+            except Exception as e:
+                print(f"Image generation failed for {job.url}: {str(e)}")
+            finally:
+                with self.lock:
+                    del self.jobs[job.url]
+                    if not succeeded:
+                        self.failed[job.url] = job
+                job.future.set_result(job.url)
+            if succeeded:
+                for listener in _image_listeners:
+                    listener(job.url)
+
+
+class PortraitRegistry:
+    """
+    Portrait URLs of the named entities of the current dream (items,
+    equipment, spellbooks), so constructing, listing or buying the same
+    entity again reuses its art instead of building the prompt and going
+    through the store each time. An entry is dropped when its image failed
+    and is no longer queued, so the next request retries it.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PortraitRegistry, cls).__new__(cls)
+            cls._instance.initialize()
+        return cls._instance
+
+    def initialize(self):
+        self.portraits: Dict[Tuple[str, str], str] = {}
+        self.lock = threading.Lock()
+
+    def get(
+        self, kind: str, name: str, generate: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        """The portrait of an entity, calling generate only the first time."""
+        with self.lock:
+            url = self.portraits.get((kind, name))
+            if url and (os.path.exists(url) or ImageScheduler().pending(url)):
+                return url
+            url = generate()
+            if url:
+                self.portraits[(kind, name)] = url
+            return url
+
+    def clear(self) -> None:
+        with self.lock:
+            self.portraits = {}
+
+
+def add_image_listener(listener: Callable[[str], None]) -> None:
+    """Call listener with the URL of every image once its file is written."""
+    _image_listeners.append(listener)
+
+
+@contextmanager
+def image_group(group: str, priority: int = PREFETCH):
+    """Tag the images requested inside the block with a group and priority."""
+    token = _image_context.set((group, priority))
+    try:
+        yield
+    finally:
+        _image_context.reset(token)
+
+
+def queue_image(url: str, generate: Callable[[], Optional[str]]) -> str:
+    group, priority = _image_context.get()
+    ImageScheduler().submit(url, generate, priority, group)
+    return url
+
+
+def prioritize_images(urls: List[str], priority: int = ON_SCREEN) -> None:
+    ImageScheduler().prioritize([url for url in urls if url], priority)
+
+
+def prioritize_image_group(group: str, priority: int = NEXT_SCREEN) -> None:
+    ImageScheduler().prioritize_group(group, priority)
+
+
+def cancel_image_group(group: str) -> None:
+    ImageScheduler().cancel_group(group)
 
 
 def generate_title_background(
@@ -199,14 +780,27 @@ def generate_item_portrait(
     item_description: str,
     use_dummy: bool = False,
 ) -> Optional[str]:
+    """Items and equipment share one portrait per name."""
     prompt = f"{JRPG_BOILERPLATE} Image of an item called {item_name}, which is described as {item_description}. The item should be centered and rendered as large as possible, taking up the whole image."
-    return generate_and_save_image(
-        prompt=prompt,
-        directory="images/items",
-        filename=f"{item_name.replace(' ', '_')}.png",
-        aspect_ratio="1:1",
-        dummy_size=(64, 64),
-        use_dummy=use_dummy,
-        apply_zoom=0.15,
-        megapixels=0.25,
+    return PortraitRegistry().get(
+        "item",
+        item_name,
+        lambda: generate_and_save_image(
+            prompt=prompt,
+            directory="images/items",
+            filename=f"{item_name.replace(' ', '_')}.png",
+            aspect_ratio="1:1",
+            dummy_size=(64, 64),
+            use_dummy=use_dummy,
+            apply_zoom=0.15,
+            megapixels=0.25,
+        ),
+    )
+
+
+def generate_spellbook_portrait(spell_name: str) -> Optional[str]:
+    """The art of a spell's book, shared by shop listings and bought copies."""
+    return generate_item_portrait(
+        f"Spellbook ({spell_name})",
+        f"A spellbook containing instructions on how to cast the {spell_name} spell.",
     )
@@ -1,5 +1,6 @@
 from functools import wraps
 import json
+import threading
 import yaml
 from pathlib import Path
 from src.api.prompts import Prompts
@@ -9,17 +10,22 @@ from src.api.providers import UniversalProvider
 
 class LLM:
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(LLM, cls).__new__(cls)
-            cls._instance.initialize()
+        # Background threads may ask for the LLM before the game thread does
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super(LLM, cls).__new__(cls)
+                instance.initialize()
+                cls._instance = instance
         return cls._instance
 
     def initialize(self):
         self.cache_file = Path("data/llm_cache.json")
         self.ensure_data_folder()
         self.cache = self.load_cache()
+        self.cache_lock = threading.Lock()
         self.prompts = Prompts()
 
         # Use the shared config loader
@@ -66,12 +72,14 @@ class LLM:
         def wrapper(self, *args, **kwargs):
             cache_key = f"{func.__name__}:{json.dumps(args)}:{json.dumps(kwargs)}"
 
-            if self.use_cache and cache_key in self.cache:
-                return self.cache[cache_key]
+            with self.cache_lock:
+                if self.use_cache and cache_key in self.cache:
+                    return self.cache[cache_key]
 
             result = func(self, *args, **kwargs)
-            self.cache[cache_key] = result
-            self.save_cache()
+            with self.cache_lock:
+                self.cache[cache_key] = result
+                self.save_cache()
             return result
 
         return wrapper
@@ -114,6 +122,23 @@ class LLM:
         )
         return self.generate(prompt)
 
+    @cache_result
+    def generate_enemy_roster(
+        self,
+        enemies,
+        location=None,
+        spells=None,
+        elements=None,
+    ):
+        prompt = self.prompts.get_prompt("character.generate_enemy_roster")(
+            location_name=location["name"],
+            location_description=location["description"],
+            enemies=enemies,
+            spells=spells,
+            elements=elements,
+        )
+        return self.generate(prompt)
+
     @cache_result
     def generate_battle_command(self, battle_context: str) -> str:
         prompt = self.prompts.get_prompt("battle.generate_battle_command")(
@@ -121,6 +146,13 @@ class LLM:
         )
         return self.generate(prompt)
 
+    @cache_result
+    def generate_squad_battle_commands(self, battle_context: str) -> dict:
+        prompt = self.prompts.get_prompt("battle.generate_squad_battle_commands")(
+            battle_context=battle_context,
+        )
+        return self.generate(prompt)
+
     @cache_result
     def generate_action_text(self, action_text):
         prompt = self.prompts.get_prompt("general.generate_action_text")(
@@ -23,3 +23,32 @@ class BattlePrompts:
             "item_name": "string",
         },
     )
+
+    GENERATE_SQUAD_BATTLE_COMMANDS = Prompt(
+        """
+        Given the following battle context, reason through a coordinated plan for every member of the squad:
+        {battle_context}
+
+        Each squad member acts once, in the order given by 'turn_order'.
+        Ensure that every chosen action is valid based on that member's available actions and current status.
+        Coordinate the squad: focus damage on the same target, avoid wasting healing or buffs, and cover each other's weaknesses.
+        Select 'attack' as the default action. Only select other actions if there is a good reason to do so.
+        Avoid simply repeating a member's previous action unless there is a good reason to do so.
+        Ensure that each target is selected based on the list of valid allies and enemies.
+        Provide one entry in 'actions' per squad member, using the member's exact name in 'character'.
+        Provide a short explanation of the overall plan.
+        """,
+        output_template={
+            "explanation": "string",
+            "actions": [
+                {
+                    "character": "string",
+                    "action_type": "string",
+                    "target": "string",
+                    "skill_name": "string",
+                    "spell_name": "string",
+                    "item_name": "string",
+                }
+            ],
+        },
+    )
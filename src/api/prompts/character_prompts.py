@@ -39,6 +39,43 @@ class CharacterPrompts:
         },
     )
 
+    GENERATE_ENEMY_ROSTER = Prompt(
+        """
+        Generate the regular enemies of a location in a JRPG. Use the following information:
+        Location: The enemies are located in {location_name}, which is described as: {location_description}.
+        Enemies (name, description and level of each): {enemies}
+
+        Valid possible spells: {spells}
+        Valid possible elements: {elements}
+
+        For each enemy, in the same order as given, generate:
+        1. A character class (variable: 'job_class')
+        2. A unique attack name (variable: 'attack')
+        3. One to three spell(s) from the possible spells list (list variable: 'spells')
+        4. An element that best fits the enemy (variable: 'element')
+
+        Guidelines:
+        - Keep the name and description of each enemy as given.
+        - Ensure the job class, attack, spells, and element are thematically consistent with the name and description.
+        - Give each enemy a distinct attack, and vary the elements and spells across the roster where it fits.
+        - Only select spells from the provided list. No other spells are valid!
+
+        Return exactly one entry per enemy in the 'enemies' list.
+        """,
+        output_template={
+            "enemies": [
+                {
+                    "name": "string",
+                    "description": "string",
+                    "job_class": "string",
+                    "attack": "string",
+                    "spells": ["string"],
+                    "element": "string",
+                }
+            ]
+        },
+    )
+
     GENERATE_STATS = Prompt(
         """
         Generate stat biases for a character class in a JRPG. 
@@ -0,0 +1,265 @@
+"""
+Vectorized Monte Carlo evaluation of the battle damage formulas.
+
+The functions here mirror Skill.calculate_base_damage, Attack,
+ElementalSpell.calculate_damage, calculate_hit_outcome and
+calculate_elemental_damage, but work on arrays of attackers and defenders so
+millions of exchanges can be sampled at once.
+
+Usage:
+    python -m src.battle.balance --samples 200000 --seed 0 [--json]
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+from src.battle.elements import ELEMENT_LIST, ELEMENT_MULTIPLIERS
+from src.battle.stats import BASE_STATS, BIAS_MULTIPLIERS
+
+STAT_NAMES = list(BASE_STATS)
+LEVEL_BANDS = [(1, 9), (10, 19), (20, 29), (30, 39), (40, 50)]
+
+
+def spell_tier(level: np.ndarray) -> np.ndarray:
+    """Spell tier available around a given level."""
+    return np.clip(np.asarray(level) // 10 + 1, 1, 5)
+
+
+# BASE_STATS[stat] * BIAS_MULTIPLIERS[bias], indexed [stat, bias]
+_BIASED_BASE = np.array(
+    [[BASE_STATS[stat] * m for m in BIAS_MULTIPLIERS] for stat in STAT_NAMES]
+)
+
+
+def generate_stat_arrays(biases: np.ndarray, levels: np.ndarray) -> Dict[str, np.ndarray]:
+    """Vectorized generate_stats: biases is (len(STAT_NAMES), n), levels is (n,)."""
+    half_levels = levels / 2
+    return {
+        stat: (_BIASED_BASE[i][biases[i]] * half_levels).astype(np.int32)
+        for i, stat in enumerate(STAT_NAMES)
+    }
+
+
+def sample_combatants(
+    levels: np.ndarray, rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
+    """Random stat biases and elements for combatants of the given levels."""
+    biases = rng.integers(
+        0, len(BIAS_MULTIPLIERS), (len(STAT_NAMES), levels.size), dtype=np.int8
+    )
+    combatants = generate_stat_arrays(biases, levels)
+    combatants["level"] = levels
+    combatants["element"] = rng.integers(0, len(ELEMENT_LIST), levels.size, np.int8)
+    combatants["spell_element"] = rng.integers(
+        0, len(ELEMENT_LIST), levels.size, np.int8
+    )
+    return combatants
+
+
+class Matchups:
+    """
+    Attacker/defender pairs with the stat-dependent parts of every damage
+    formula precomputed, so each sampled action only draws random numbers.
+    """
+
+    def __init__(self, attacker: Dict[str, np.ndarray], defender: Dict[str, np.ndarray]):
+        # calculate_hit_outcome
+        luck_difference = attacker["luck"] - defender["luck"]
+        self.crit_chance = np.clip(0.05 + luck_difference * 0.005, 0, 1)
+        self.miss_chance = np.clip(0.05 - luck_difference * 0.005, 0, 1)
+        # Skill.calculate_base_damage and calculate_elemental_damage
+        self.physical = attacker["attack"] * (attacker["attack"] / defender["defense"])
+        self.attack_multiplier = ELEMENT_MULTIPLIERS[
+            attacker["element"], defender["element"]
+        ]
+        # ElementalSpell.calculate_damage with a spell of the attacker's tier
+        self.magical = (
+            50 * spell_tier(attacker["level"]) * (attacker["intelligence"] / defender["wisdom"])
+        )
+        self.spell_multiplier = ELEMENT_MULTIPLIERS[
+            attacker["spell_element"], defender["element"]
+        ]
+        self.defender_hp = defender["max_hp"]
+
+    def attack(
+        self, rng: np.random.Generator, index=slice(None)
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Damage of a basic Attack, returning (damage, hit, critical)."""
+        physical = self.physical[index]
+        roll = rng.random(physical.shape)
+        hit = roll >= self.miss_chance[index]
+        critical = hit & (roll > 1 - self.crit_chance[index])
+        damage = (rng.uniform(0.75, 1.25, physical.shape) * physical).astype(np.int64)
+        damage = (damage * self.attack_multiplier[index]).astype(np.int64)
+        return damage * (1 + critical) * hit, hit, critical
+
+    def spell(self, rng: np.random.Generator, index=slice(None)) -> np.ndarray:
+        magical = self.magical[index]
+        damage = (rng.uniform(0.75, 1.25, magical.shape) * magical).astype(np.int64)
+        return (damage * self.spell_multiplier[index]).astype(np.int64)
+
+    def max_attack_damage(self) -> np.ndarray:
+        return (
+            (1.25 * self.physical).astype(np.int64) * self.attack_multiplier
+        ).astype(np.int64) * 2
+
+    def max_spell_damage(self) -> np.ndarray:
+        return ((1.25 * self.magical).astype(np.int64) * self.spell_multiplier).astype(
+            np.int64
+        )
+
+    def subset(self, index: np.ndarray) -> Matchups:
+        subset = object.__new__(Matchups)
+        subset.__dict__ = {key: values[index] for key, values in self.__dict__.items()}
+        return subset
+
+
+def time_to_kill(
+    hp: np.ndarray,
+    damage_fn: Callable[[np.ndarray], np.ndarray],
+    max_damage: np.ndarray,
+    max_actions: int = 100,
+) -> np.ndarray:
+    """
+    Number of repeated actions needed to bring each defender to 0 HP.
+
+    damage_fn receives the indices of pairs still fighting and returns one
+    action's damage for each of them. Pairs that cannot deal damage at all,
+    or survive max_actions, are reported as max_actions.
+    """
+    remaining = hp.astype(np.int64)
+    actions = np.full(hp.shape, max_actions)
+    active = np.flatnonzero(max_damage > 0)
+    for action in range(1, max_actions + 1):
+        remaining[active] -= damage_fn(active)
+        dead = remaining[active] <= 0
+        actions[active[dead]] = action
+        active = active[~dead]
+        if not active.size:
+            break
+    return actions
+
+
+@dataclass
+class BandReport:
+    band: Tuple[int, int]
+    samples: int
+    miss_rate: float
+    crit_rate: float
+    attack_damage: float
+    attack_ttk: Tuple[float, float]
+    spell_damage: float
+    spell_ttk: Tuple[float, float]
+
+    def to_dict(self):
+        return {
+            "band": f"{self.band[0]}-{self.band[1]}",
+            "samples": self.samples,
+            "miss_rate": self.miss_rate,
+            "crit_rate": self.crit_rate,
+            "attack_damage": self.attack_damage,
+            "attack_ttk_p50": self.attack_ttk[0],
+            "attack_ttk_p90": self.attack_ttk[1],
+            "spell_damage": self.spell_damage,
+            "spell_ttk_p50": self.spell_ttk[0],
+            "spell_ttk_p90": self.spell_ttk[1],
+        }
+
+
+def evaluate_band(
+    band: Tuple[int, int],
+    samples: int,
+    rng: np.random.Generator,
+    defender_hp_scale: float = 1.0,
+    ttk_samples: int = 20_000,
+) -> BandReport:
+    low, high = band
+    matchups = Matchups(
+        sample_combatants(rng.integers(low, high + 1, samples), rng),
+        sample_combatants(rng.integers(low, high + 1, samples), rng),
+    )
+    damage, hit, critical = matchups.attack(rng)
+    magic = matchups.spell(rng)
+
+    # Time-to-kill repeats the exchange on a subset of the same pairs
+    duels = matchups.subset(np.arange(min(ttk_samples, samples)))
+    hp = (duels.defender_hp * defender_hp_scale).astype(np.int64).clip(min=1)
+    attack_ttk = time_to_kill(
+        hp, lambda i: duels.attack(rng, i)[0], duels.max_attack_damage()
+    )
+    spell_ttk = time_to_kill(
+        hp, lambda i: duels.spell(rng, i), duels.max_spell_damage()
+    )
+
+    return BandReport(
+        band=band,
+        samples=samples,
+        miss_rate=float(1 - hit.mean()),
+        crit_rate=float(critical.mean()),
+        attack_damage=float(damage.mean()),
+        attack_ttk=tuple(float(p) for p in np.percentile(attack_ttk, [50, 90])),
+        spell_damage=float(magic.mean()),
+        spell_ttk=tuple(float(p) for p in np.percentile(spell_ttk, [50, 90])),
+    )
+
+
+def format_table(reports: List[BandReport]) -> str:
+    header = (
+        f"{'Levels':>8} {'Miss':>6} {'Crit':>6} {'Atk dmg':>9} {'Atk TTK p50/p90':>16}"
+        f" {'Spell dmg':>10} {'Spell TTK p50/p90':>18}"
+    )
+    rows = [header, "-" * len(header)]
+    for r in reports:
+        rows.append(
+            f"{r.band[0]:>3}-{r.band[1]:<4} {r.miss_rate:>6.1%} {r.crit_rate:>6.1%}"
+            f" {r.attack_damage:>9.1f} {r.attack_ttk[0]:>7.0f} / {r.attack_ttk[1]:<6.0f}"
+            f" {r.spell_damage:>10.1f} {r.spell_ttk[0]:>8.0f} / {r.spell_ttk[1]:<7.0f}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo evaluation of the battle damage formulas."
+    )
+    parser.add_argument(
+        "--samples", type=int, default=200_000, help="Exchanges per level band"
+    )
+    parser.add_argument(
+        "--ttk-samples", type=int, default=20_000, help="Duels per level band"
+    )
+    parser.add_argument(
+        "--defender-hp-scale",
+        type=float,
+        default=1.0,
+        help="HP multiplier for defenders (regular enemies have 0.5)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the tables as JSON")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    reports = [
+        evaluate_band(band, args.samples, rng, args.defender_hp_scale, args.ttk_samples)
+        for band in LEVEL_BANDS
+    ]
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps([report.to_dict() for report in reports], indent=2))
+    else:
+        print(format_table(reports))
+        exchanges = args.samples * len(reports)
+        print(
+            f"\n{exchanges:,} exchanges in {elapsed:.2f}s"
+            f" ({exchanges / elapsed:,.0f}/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,31 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, List, Any, Union, Tuple
+import asyncio
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, Union, Tuple
 
 from src.core.items import Item  # Import specific items instead of using *
-import numpy as np
-from src.utils.utils import create_unique_enemy_names
+from src.utils.utils import create_unique_enemy_names, load_config
 from src.core.character import PlayerCharacter, Character
 from src.battle.effects import Defend
-from src.api.llm import get_llm
 from src.battle.battle_log import BattleLog
-from src.battle.controllers import AIController, PlayerController, Controller
+from src.battle.events import (
+    BattleEventSink,
+    HeadlessEventSink,
+    RoundLogSink,
+    UIEventSink,
+    use_event_sink,
+)
+from src.game.response_manager import print_battle_round, poll_player_response
+from src.battle.combat_state import CombatState, use_combat_state
+from src.battle.turn_scheduler import TurnScheduler
+from src.battle.replay import BattleReplay
+from src.utils.rng import RNG, get_rng, use_rng
+from src.battle.controllers import (
+    AIController,
+    PlayerController,
+    Controller,
+    GreedyPolicyController,
+    SquadController,
+)
 
 if TYPE_CHECKING:
     from typing import Dict, List, Any, Union, Tuple
@@ -23,15 +40,50 @@ class Battle:
         enemies: EnemyParty,
         context: str = "",
         background_image_url: str = None,
+        sink: BattleEventSink = None,
+        controller_factory: Callable[[Character], Controller] = None,
+        award_rewards: bool = True,
+        seed: int = None,
+        record_replay: bool = None,
+        fast_forward: bool = False,
+        intro_text: str = None,
     ):
+        # Every random draw of the battle comes from this stream, so the
+        # recorded seed is enough to reproduce it
+        self.rng = RNG(seed) if seed is not None else get_rng().spawn()
+        self.seed = self.rng.seed
+        # Decisions draw from their own stream, so replaying recorded actions
+        # without re-deciding them leaves the combat draws unchanged
+        self.decision_rng = self.rng.spawn()
+        if record_replay is None:
+            record_replay = load_config().get("record_battle_replays", False)
+        self.record_replay = record_replay
+        self.replay: BattleReplay = None
+        self.fast_forward = fast_forward
+        self.intro_text = intro_text
         self.party = party
         self.enemies = self._create_unique_enemy_party(enemies)
+        self.state = CombatState(self.party.characters + self.enemies.characters)
         self.context = context
         self.battle_log = BattleLog(background_image_url)
+        self.sink = sink or UIEventSink()
+        self.award_rewards = award_rewards
         self.ran = False
-        self.time_units: Dict[Character, float] = {}
+        self.turns = 0
+        self.scheduler: TurnScheduler = None
         self.background_image_url = background_image_url
+        self.controller_factory = controller_factory
         self.controllers: Dict[Character, Controller] = self._initialize_controllers()
+        self.squad_controller = SquadController(self.controllers)
+        self.planned_actions: Dict[Character, Dict[str, Any]] = {}
+        # Auto-battle: a local policy plays the player's turns and the log of
+        # each round is streamed as one update
+        self.auto_battle = False
+        self.auto_controllers: Dict[Character, Controller] = {}
+        self.auto_hp_threshold = 0.0
+        self.auto_round_delay = 0.0
+        self.round_log = RoundLogSink()
+        self.round_turns = 0
 
     def _create_unique_enemy_party(self, enemies: EnemyParty) -> EnemyParty:
         unique_names = create_unique_enemy_names(
@@ -42,6 +94,11 @@ class Battle:
         return enemies
 
     def _initialize_controllers(self) -> Dict[Character, Controller]:
+        if self.controller_factory:
+            return {
+                char: self.controller_factory(char)
+                for char in self.party.characters + self.enemies.characters
+            }
         controllers = {}
         for enemy in self.enemies.characters:
             controllers[enemy] = AIController(enemy)
@@ -55,22 +112,156 @@ class Battle:
         return controllers
 
     async def start(self, battle_type: str = "ambush") -> str:
+        if self.fast_forward and await self._is_foregone_victory(battle_type):
+            return await self._resolve_instantly(battle_type)
+        return await self._start(battle_type)
+
+    async def _start(self, battle_type: str) -> str:
+        if self.record_replay:
+            self.replay = BattleReplay.capture(
+                self.seed, battle_type, self.party, self.enemies
+            )
+        with use_event_sink(self.sink), use_combat_state(self.state), use_rng(
+            self.rng
+        ):
+            return await self._run(battle_type)
+
+    async def _run(self, battle_type: str) -> str:
         # Reset SP at battle start
         for char in self.party.characters + self.enemies.characters:
             char.reset_sp()
+        # Party-wide skills such as Rallying Cry act on the user's allies
+        for side in (self.party, self.enemies):
+            for char in side.characters:
+                char.allies = side.characters
+        self.sink.start_battle(self.party, self.enemies)
         await self.battle_log.print_start_text(
-            battle_type, self.context, self.party.characters, self.enemies.characters
+            battle_type,
+            self.context,
+            self.party.characters,
+            self.enemies.characters,
+            self.intro_text,
         )
-        self._initialize_time_units()
+        self._initialize_scheduler()
         battle_over = False
-        while not battle_over:
-            battle_over, outcome = await self._take_turns()
+        try:
+            while not battle_over:
+                battle_over, outcome = await self._take_turns()
+        finally:
+            for char in self.party.characters + self.enemies.characters:
+                char.turn_scheduler = None
+                char.allies = []
+        self.sink.record_outcome(outcome, self.turns)
+        if self.replay:
+            self.replay.outcome, self.replay.turns = outcome, self.turns
+            # Written off the event loop so the websocket isn't held up
+            await asyncio.to_thread(
+                self.replay.save, keep=load_config().get("max_battle_replays", 100)
+            )
         return outcome
 
-    def _initialize_time_units(self) -> None:
-        self.time_units = {
-            char: 0 for char in self.party.characters + self.enemies.characters
+    async def _is_foregone_victory(self, battle_type: str) -> bool:
+        """
+        Simulate the battle headlessly from copies of both sides and report
+        whether the party wins nearly every time. The first simulation uses
+        this battle's own seed, so it is what _resolve_instantly will play
+        out. The simulations run in a worker thread so the websocket is not
+        held up meanwhile.
+        """
+        config = load_config()
+        if not config.get("fast_forward_encounters", True):
+            return False
+        level_gap = config.get("fast_forward_level_gap", 5)
+        enemy_level = max(enemy.level for enemy in self.enemies.characters)
+        if self.party.avg_level < enemy_level + level_gap:
+            return False
+
+        simulations = config.get("fast_forward_simulations", 20)
+        win_rate = config.get("fast_forward_win_rate", 0.95)
+        allowed_losses = int(simulations * (1 - win_rate))
+        snapshot = BattleReplay.capture(
+            self.seed, battle_type, self.party, self.enemies
+        )
+        return await asyncio.to_thread(
+            asyncio.run,
+            self._simulate_victories(snapshot, simulations, allowed_losses),
+        )
+
+    async def _simulate_victories(
+        self, snapshot: BattleReplay, simulations: int, allowed_losses: int
+    ) -> bool:
+        losses = 0
+        for index in range(simulations):
+            party, enemies = snapshot.restore()
+            outcome = await Battle(
+                party,
+                enemies,
+                sink=HeadlessEventSink(),
+                controller_factory=GreedyPolicyController,
+                award_rewards=False,
+                seed=self.seed + index,
+                record_replay=False,
+            ).start(snapshot.battle_type)
+            if outcome != "party_victory":
+                losses += 1
+                if index == 0 or losses > allowed_losses:
+                    return False
+        return True
+
+    async def _resolve_instantly(self, battle_type: str) -> str:
+        """
+        Play the battle out with local policies and show only a summary. If
+        the party doesn't win after all, both sides are put back as they
+        were and the battle is fought normally.
+        """
+        snapshot = BattleReplay.capture(
+            self.seed, battle_type, self.party, self.enemies
+        )
+        ui_sink, controllers = self.sink, self.controllers
+        self.sink = HeadlessEventSink()
+        self.controllers = {
+            char: GreedyPolicyController(char)
+            for char in self.party.characters + self.enemies.characters
         }
+        self.award_rewards = False
+        outcome = await self._start(battle_type)
+        if outcome != "party_victory":
+            self._restore(snapshot)
+            self.sink, self.controllers = ui_sink, controllers
+            self.award_rewards = True
+            return await self._start(battle_type)
+
+        total_currency, total_exp = self._calculate_exp_and_currency()
+        with use_event_sink(ui_sink):
+            await self.battle_log.print_instant_result(
+                self.party, self.enemies, self.turns, total_currency, total_exp
+            )
+            await self._award_experience_and_currency(total_currency, total_exp)
+        return outcome
+
+    def _restore(self, snapshot: BattleReplay) -> None:
+        """Put both sides and the battle's RNG back to their state in snapshot."""
+        party, enemies = snapshot.restore()
+        for side, restored in ((self.party, party), (self.enemies, enemies)):
+            # In place, since the game keeps references to these characters
+            for char, copy in zip(side.characters, restored.characters):
+                char.__dict__.update(copy.__dict__)
+                char.stats.on_death = char.on_death
+                char.stats.on_speed_change = char.on_speed_change
+        self.party.inventory[:] = party.inventory
+        self.rng = RNG(self.seed)
+        self.decision_rng = self.rng.spawn()
+        self.state = CombatState(self.party.characters + self.enemies.characters)
+        self.planned_actions = {}
+        self.turns = 0
+
+    def _initialize_scheduler(self) -> None:
+        combatants = self.party.characters + self.enemies.characters
+        self.scheduler = TurnScheduler(combatants)
+        for char in combatants:
+            # Lets speed changes from status effects reschedule the character
+            char.turn_scheduler = self.scheduler
+            char.stats.on_speed_change = char.on_speed_change
 
     async def _take_turns(self) -> tuple[bool, str]:
         self.predicted_order = self.predict_turn_order()
@@ -78,26 +269,88 @@ class Battle:
         if active_character is None:
             return await self._check_battle_over()
 
-        self.time_units[active_character] = 0
+        self.turns += 1
+        with use_event_sink(self._turn_sink()):
+            if active_character.can_act:
+                await self._process_turn(active_character)
+            else:
+                await self._process_incapacitated_turn(active_character)
 
-        if active_character.can_act:
-            await self._process_turn(active_character)
-        else:
-            await self._process_incapacitated_turn(active_character)
+        if self.auto_battle:
+            self.round_turns += 1
+            combatants = self.party.characters + self.enemies.characters
+            if self.round_turns >= sum(char.stats.alive for char in combatants):
+                await self._stream_round()
 
         return await self._check_battle_over()
 
-    def _get_next_active_character(self) -> Union[Character, None]:
-        alive_characters = {
-            char: tu for char, tu in self.time_units.items() if char.stats.alive
-        }
-        if not alive_characters:
-            return None
+    def _turn_sink(self) -> BattleEventSink:
+        return self.round_log if self.auto_battle else self.sink
+
+    def _start_auto_battle(self) -> None:
+        self.auto_battle = True
+        config = load_config()
+        self.auto_hp_threshold = config.get("auto_battle_hp_threshold", 0.3)
+        self.auto_round_delay = config.get("auto_battle_round_delay", 1.5)
+        self.round_turns = 0
+
+    def _auto_controller(self, character: Character) -> Controller:
+        if character not in self.auto_controllers:
+            self.auto_controllers[character] = GreedyPolicyController(character)
+        return self.auto_controllers[character]
+
+    def _low_hp_characters(self) -> List[Character]:
+        return [
+            char
+            for char in self.party.characters
+            if char.stats.alive
+            and char.stats.hp < self.auto_hp_threshold * char.stats.max_hp
+        ]
+
+    async def _stream_round(self) -> None:
+        """
+        Send the round's log without waiting for input and keep going after a
+        short pause. Pressing Stop Auto meanwhile ends auto-battle before the
+        player's next turn.
+        """
+        self.round_turns = 0
+        round_log = self.round_log.pop_text()
+        if round_log:
+            await print_battle_round(
+                self.party,
+                self.enemies,
+                "Auto-battle",
+                round_log,
+                ["Stop Auto"],
+                self.background_image_url,
+                wait=False,
+            )
+            await asyncio.sleep(self.auto_round_delay)
+        if poll_player_response() == "Stop Auto":
+            self.auto_battle = False
 
-        for character in alive_characters:
-            self.time_units[character] += np.log2(character.stats.speed + 1)
+    async def _show_round(
+        self, title: str, options: List[str], force: bool = False
+    ) -> None:
+        """Show the round's log and wait for the player."""
+        self.round_turns = 0
+        round_log = self.round_log.pop_text()
+        if not round_log and not force:
+            return
+        # A Stop Auto pressed during the last streamed round must not answer
+        # this prompt
+        poll_player_response()
+        await print_battle_round(
+            self.party,
+            self.enemies,
+            title,
+            round_log,
+            options,
+            self.background_image_url,
+        )
 
-        return max(alive_characters, key=self.time_units.get)
+    def _get_next_active_character(self) -> Union[Character, None]:
+        return self.scheduler.next_actor()
 
     async def _process_turn(self, character: Character) -> None:
         character.active_turn = True
@@ -107,12 +360,78 @@ class Battle:
         allies = self.party if character in self.party.characters else self.enemies
         enemies = self.enemies if character in self.party.characters else self.party
 
-        action = await controller.decide_action(
-            allies, enemies, turn_order=self.predicted_order
-        )
-        await self._execute_action(character, action)
+        if isinstance(controller, PlayerController) and self.auto_battle:
+            if low_hp := self._low_hp_characters():
+                self.auto_battle = False
+                names = ", ".join(char.name for char in low_hp)
+                await self._show_round(
+                    f"Auto-battle stopped: {names} low on HP", ["Continue"], force=True
+                )
+
+        with use_rng(self.decision_rng):
+            if isinstance(controller, PlayerController) and self.auto_battle:
+                action = await self._auto_controller(character).decide_action(
+                    allies, enemies
+                )
+            elif isinstance(controller, AIController):
+                action = await self._get_planned_action(character, allies, enemies)
+            else:
+                # Plans made before a player turn may no longer fit the battle
+                self.planned_actions = {}
+                action = None
+
+            if action is None:
+                action = await controller.decide_action(
+                    allies, enemies, turn_order=self.predicted_order
+                )
+            if action["action_type"] == "auto":
+                self._start_auto_battle()
+                action = await self._auto_controller(character).decide_action(
+                    allies, enemies
+                )
+        if self.replay:
+            self.replay.record(character, action)
+        with use_event_sink(self._turn_sink()):
+            await self._execute_action(character, action)
+        self.sink.record_action(character, action)
         character.active_turn = False
 
+    async def _get_planned_action(
+        self, character: Character, allies, enemies
+    ) -> Union[Dict[str, Any], None]:
+        if character not in self.planned_actions:
+            # Plans of other units, including the other side's, stay pending
+            squad = [
+                member
+                for member in self._get_upcoming_squad(character, allies)
+                if member not in self.planned_actions
+            ]
+            self.planned_actions.update(
+                await self.squad_controller.plan_actions(squad, allies, enemies)
+            )
+        action = self.planned_actions.pop(character, None)
+        if action is None:
+            return None
+        return self.controllers[character].accept_planned_action(
+            action, allies, enemies
+        )
+
+    def _get_upcoming_squad(self, character: Character, allies) -> List[Character]:
+        """AI-controlled allies of the character due to act before the next player turn."""
+        squad = [character]
+        for member in self.predicted_order:
+            controller = self.controllers[member]
+            if isinstance(controller, PlayerController):
+                break
+            if (
+                member not in squad
+                and member in allies.characters
+                and member.can_act
+                and isinstance(controller, AIController)
+            ):
+                squad.append(member)
+        return squad
+
     async def _process_incapacitated_turn(self, character: Character) -> None:
         character.active_turn = True
         await self.battle_log.print_cannot_act(character)
@@ -123,13 +442,16 @@ class Battle:
         if self.ran or not self.enemies.check_alive() or not self.party.check_alive():
             for char in self.party.characters + self.enemies.characters:
                 char.reset_sp()
+            await self._show_round("Auto-battle", ["Continue"])
         if self.ran:
             await self.battle_log.print_battle_result(
                 "ran away from", self.party, self.enemies, 0, 0
             )
             return True, "party_ran"
         if not self.enemies.check_alive():
-            total_currency, total_exp = self._calculate_exp_and_currency()
+            total_currency, total_exp = (
+                self._calculate_exp_and_currency() if self.award_rewards else (0, 0)
+            )
             await self.battle_log.print_battle_result(
                 "defeated",
                 self.party,
@@ -137,7 +459,8 @@ class Battle:
                 total_currency,
                 total_exp,
             )
-            await self._award_experience_and_currency(total_currency, total_exp)
+            if self.award_rewards:
+                await self._award_experience_and_currency(total_currency, total_exp)
             return True, "party_victory"
         if not self.party.check_alive():
             await self.battle_log.print_battle_result(
@@ -248,20 +571,19 @@ class Battle:
     def _get_target(
         self, target_info: Union[str, int, List[str]]
     ) -> Union[Character, List[Character], None]:
-        all_targets = self.party.characters + self.enemies.characters
-
         if isinstance(target_info, list):
-            return [char for char in all_targets if char.name in target_info]
+            targets = (self.state.lookup(name) for name in dict.fromkeys(target_info))
+            return [char for char in targets if char is not None]
 
         if isinstance(target_info, str):
             if target_info == "random_enemy":
                 alive_enemies = [e for e in self.enemies.characters if e.stats.alive]
-                return np.random.choice(alive_enemies) if alive_enemies else None
-            return next((c for c in all_targets if c.name == target_info), None)
+                return self.rng.choice(alive_enemies) if alive_enemies else None
+            return self.state.lookup(target_info)
 
         if isinstance(target_info, int):
-            if 0 <= target_info < len(all_targets):
-                return all_targets[target_info]
+            if 0 <= target_info < len(self.state.characters):
+                return self.state.characters[target_info]
             return None
 
         return None
@@ -285,23 +607,5 @@ class Battle:
             await character.gain_xp(total_exp)
         return total_currency, total_exp
 
-    def predict_turn_order(self, num_turns: int = 10) -> List[Tuple[Character, float]]:
-        predicted_order = []
-        simulated_time_units = self.time_units.copy()
-
-        for _ in range(num_turns):
-            alive_characters = {
-                char: tu
-                for char, tu in simulated_time_units.items()
-                if char.stats.alive
-            }
-            if not alive_characters:
-                break
-
-            for character in alive_characters:
-                simulated_time_units[character] += np.log2(character.stats.speed + 1)
-
-            next_character = max(alive_characters, key=simulated_time_units.get)
-            predicted_order.append(next_character)
-            simulated_time_units[next_character] = 0
-        return predicted_order
+    def predict_turn_order(self, num_turns: int = 10) -> List[Character]:
+        return self.scheduler.predict_turn_order(num_turns)
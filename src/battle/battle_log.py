@@ -1,8 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from src.core.items import *
 from src.battle.effects import Sleep
-from src.game.response_manager import ResponseManager, print_event_text
+from src.battle.events import BattleEventSink, get_event_sink
 
 if TYPE_CHECKING:
     from src.core.character import Character
@@ -10,11 +9,14 @@ if TYPE_CHECKING:
 
 class BattleLog:
     def __init__(self, background_image_url):
-        self.llm = get_llm()
-        self.rm = ResponseManager()
         self.background_image_url = background_image_url
 
-    async def print_start_text(self, battle_type, context, party, enemies):
+    @property
+    def sink(self) -> BattleEventSink:
+        return get_event_sink()
+
+    @staticmethod
+    def start_event(battle_type, context, party, enemies) -> str:
         battle_json = {
             "event_type": "battle_start",
             "battle_type": battle_type,
@@ -22,28 +24,59 @@ class BattleLog:
             "party": [f"{char.name} ({char.description})" for char in party],
             "enemies": [f"{char.name} ({char.description})" for char in enemies],
         }
-        battle_str = str(battle_json)
-        battle_text = self.llm.generate_action_text(battle_str)
+        return str(battle_json)
 
-        await print_event_text("Battle Start!", battle_text, self.background_image_url)
+    async def print_start_text(
+        self, battle_type, context, party, enemies, intro_text: str = None
+    ):
+        if intro_text:
+            await self.sink.message(
+                "Battle Start!", intro_text, self.background_image_url
+            )
+            return
+        battle_str = self.start_event(battle_type, context, party, enemies)
+        await self.sink.narrate("Battle Start!", battle_str, self.background_image_url)
 
     async def print_battle_result(
         self, result, party, enemies, total_currency, total_exp
     ):
         battle_text = f"Your party {[f'{char.name} ({char.description})' for char in party.characters]} {result} the {len(enemies.characters)} enemie(s) {[f'{char.name} ({char.description})' for char in enemies.characters]}!"
-        battle_text = self.llm.generate_action_text(battle_text)
-        if result == "defeated":
+        battle_text = self.sink.narration(battle_text)
+        if result == "defeated" and (total_currency or total_exp):
             currency_text = f"\n\nParty earned {total_currency} {party.story_manager.currency_name}!\n\n"
             for character in party.characters:
                 currency_text += f"{character.name} earned {total_exp} experience!\n"
             battle_text += currency_text
-        await print_event_text(
+        await self.sink.message(
             f"You {result} the enemies!",
             battle_text,
             self.background_image_url,
             input_type="message",
         )
 
+    async def print_instant_result(
+        self, party, enemies, turns, total_currency, total_exp
+    ):
+        enemy_names = ", ".join(char.name for char in enemies.characters)
+        battle_text = (
+            f"Your party easily overwhelmed {enemy_names} in {turns} turns.\n\n"
+        )
+        for character in party.characters:
+            battle_text += (
+                f"{character.name}: {character.stats.hp}/{character.stats.max_hp} HP, "
+                f"{character.stats.mp}/{character.stats.max_mp} MP\n"
+            )
+        battle_text += (
+            f"\nParty earned {total_currency} {party.story_manager.currency_name}!\n"
+            f"Each member earned {total_exp} experience!"
+        )
+        await self.sink.message(
+            "Quick Victory!",
+            battle_text,
+            self.background_image_url,
+            input_type="message",
+        )
+
     def get_battle_status(self, party, enemies):
         status_text = "Party\n"
         status_text += str(party)
@@ -53,10 +86,10 @@ class BattleLog:
 
     async def print_status(self, party, enemies):
         status_text = self.get_battle_status(party, enemies)
-        await print_event_text("Battle Status", status_text, self.background_image_url)
+        await self.sink.message("Battle Status", status_text, self.background_image_url)
 
     async def print_no_abilities(self, ability_type, party, enemies, character):
-        await print_event_text(
+        await self.sink.message(
             f"No {ability_type}s to use",
             f"{character.name} does not have any {ability_type}s to use",
             self.background_image_url,
@@ -70,15 +103,14 @@ class BattleLog:
                 action = (
                     f"{character.name} ({character.job_class}) is asleep and cannot act"
                 )
-                fancy_text = self.llm.generate_action_text(action)
-                await print_event_text(
+                await self.sink.narrate(
                     f"{character.name} cannot act",
-                    fancy_text,
+                    action,
                     self.background_image_url,
                 )
                 return
 
-        await print_event_text(
+        await self.sink.message(
             f"{character.name} cannot act",
             "",
             self.background_image_url,
@@ -86,7 +118,7 @@ class BattleLog:
         )
 
     async def print_not_enough_mp(self, character, ability):
-        await print_event_text(
+        await self.sink.message(
             f"{character.name} does not have enough MP to cast {ability.name}",
             "",
             self.background_image_url,
@@ -94,7 +126,7 @@ class BattleLog:
         )
 
     async def print_silenced(self, character):
-        await print_event_text(
+        await self.sink.message(
             f"{character.name} is silenced and cannot cast spells",
             "",
             self.background_image_url,
@@ -102,7 +134,7 @@ class BattleLog:
         )
 
     async def print_run_attempt(self, character):
-        await print_event_text(
+        await self.sink.message(
             "You attempt to run away...",
             "",
             self.background_image_url,
@@ -111,7 +143,7 @@ class BattleLog:
         )
 
     async def print_defend_action(self, character):
-        await print_event_text(
+        await self.sink.message(
             f"{character.name} defends",
             "",
             self.background_image_url,
@@ -120,7 +152,7 @@ class BattleLog:
         )
 
     async def print_pass_action(self, character):
-        await print_event_text(
+        await self.sink.message(
             f"{character.name} passes",
             "",
             self.background_image_url,
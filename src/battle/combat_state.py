@@ -0,0 +1,160 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from src.battle.elements import ELEMENT_EXPLANATIONS, ELEMENT_MULTIPLIERS, element_id
+from src.utils.rng import get_rng
+
+if TYPE_CHECKING:
+    from src.core.character import Character
+
+
+class CombatState:
+    """
+    Struct-of-arrays view of the combatants of a battle.
+
+    Each combatant owns one row of the stat arrays, and names map to rows in
+    a dict so targets resolve without scanning the parties. While a battle
+    runs the state is bound to the combatants' CharacterStats: the arrays are
+    loaded once when the battle starts, and from then on every change to a
+    combatant's hp, mp, alive flag or modifiers is written through to its
+    row, so multi-target skills and spells resolve every target in one
+    vectorized step without re-reading the characters.
+    """
+
+    STATS = (
+        "hp",
+        "max_hp",
+        "mp",
+        "max_mp",
+        "attack",
+        "defense",
+        "intelligence",
+        "wisdom",
+        "luck",
+    )
+
+    def __init__(self, characters: Iterable[Character]):
+        self.characters: List[Character] = list(characters)
+        self.rows: Dict[Character, int] = {
+            char: row for row, char in enumerate(self.characters)
+        }
+        # The first character with a name wins, like a scan of the parties
+        self.names: Dict[str, Character] = {}
+        for char in self.characters:
+            self.names.setdefault(char.name, char)
+        size = len(self.characters)
+        for stat in self.STATS:
+            setattr(self, stat, np.zeros(size, dtype=np.int64))
+        self.alive = np.zeros(size, dtype=bool)
+        self.element = np.zeros(size, dtype=np.int8)
+        self.bound = False
+        self.refresh()
+
+    def __contains__(self, character: Character) -> bool:
+        return character in self.rows
+
+    def lookup(self, name: str) -> Optional[Character]:
+        return self.names.get(name)
+
+    def rows_of(self, characters: List[Character]) -> np.ndarray:
+        return np.array([self.rows[char] for char in characters], dtype=np.intp)
+
+    def refresh(self) -> None:
+        """Pull the current stats of every row from the characters."""
+        for row, char in enumerate(self.characters):
+            for stat in self.STATS:
+                getattr(self, stat)[row] = getattr(char.stats, stat)
+            self.alive[row] = char.stats.alive
+            self.element[row] = element_id(char.get_defense_element())
+
+    def load_stats(self, row: int, effective: Dict[str, int]) -> None:
+        """Copy a bound row's effective stats after its modifiers changed."""
+        for stat in self.STATS:
+            if stat in effective:
+                getattr(self, stat)[row] = effective[stat]
+
+    def bind(self) -> None:
+        """Keep the arrays current with the combatants' stats until unbind."""
+        self.refresh()
+        for row, char in enumerate(self.characters):
+            char.stats.bind(self, row)
+        self.bound = True
+
+    def unbind(self) -> None:
+        for char in self.characters:
+            char.stats.unbind()
+        self.bound = False
+
+    def base_damage(self, user: Character, rows: np.ndarray) -> np.ndarray:
+        """Skill.calculate_base_damage against every row at once."""
+        attack = self.attack[self.rows[user]]
+        damage = attack * (attack / np.maximum(self.defense[rows], 1))
+        return (get_rng().uniform(0.75, 1.25, rows.size) * damage).astype(np.int64)
+
+    def spell_damage(
+        self, caster: Character, rows: np.ndarray, base_damage: int, element
+    ) -> Tuple[np.ndarray, List[str]]:
+        """ElementalSpell.calculate_damage against every row at once."""
+        damage = base_damage * (
+            self.intelligence[self.rows[caster]] / np.maximum(self.wisdom[rows], 1)
+        )
+        damage = (get_rng().uniform(0.75, 1.25, rows.size) * damage).astype(np.int64)
+        attack_element = element_id(element)
+        multipliers = ELEMENT_MULTIPLIERS[attack_element, self.element[rows]]
+        damage = np.where(
+            multipliers == 1, damage, (damage * multipliers).astype(np.int64)
+        )
+        explanations = [
+            ELEMENT_EXPLANATIONS[attack_element][defense]
+            for defense in self.element[rows]
+        ]
+        return damage, explanations
+
+    def change_hp(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Vectorized CharacterStats.hp_change. Death callbacks run right away,
+        before any message is shown.
+        """
+        true_values = np.clip(values, -self.hp[rows], self.max_hp[rows] - self.hp[rows])
+        if not self.bound:
+            # A temporary state only reads the stats, so write them back
+            for row, value in zip(rows, true_values):
+                self.characters[row].stats.hp_change(int(value))
+            return true_values
+        self.hp[rows] += true_values
+        for row in rows:
+            stats = self.characters[row].stats
+            stats._hp = int(self.hp[row])
+            if stats._hp <= 0:
+                stats.check_dead()
+        return true_values
+
+
+_active_state: ContextVar[Optional[CombatState]] = ContextVar(
+    "combat_state", default=None
+)
+
+
+def get_combat_state(characters: List[Character]) -> CombatState:
+    """
+    Return the running battle's state, or a temporary state when the given
+    characters are not part of a battle.
+    """
+    state = _active_state.get()
+    if state is None or not all(char in state for char in characters):
+        return CombatState(characters)
+    return state
+
+
+@contextmanager
+def use_combat_state(state: CombatState):
+    """Bind the combatants to the state for the duration of a battle."""
+    token = _active_state.set(state)
+    state.bind()
+    try:
+        yield state
+    finally:
+        state.unbind()
+        _active_state.reset(token)
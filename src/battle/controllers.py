@@ -1,6 +1,6 @@
 from src.core.character import Character
 from src.core.party import Party
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Iterator, Optional, Tuple
 from src.game.response_manager import (
     choose_battle_target,
     choose_option,
@@ -10,6 +10,10 @@ from src.game.response_manager import (
     print_battle_menu,
 )
 from src.api.llm import get_llm
+from src.battle.decision_cache import AbstractBattleState, get_decision_cache
+from src.core.items import ReviveItem
+from src.core.spells import ElementalSpell, HealingSpell
+from src.utils.rng import get_rng
 import asyncio
 
 import numpy as np
@@ -68,6 +72,7 @@ class AIController(Controller):
     def __init__(self, character: Character):
         super().__init__(character)
         self.llm = get_llm()
+        self.decision_cache = get_decision_cache()
 
     async def decide_action(
         self,
@@ -76,14 +81,46 @@ class AIController(Controller):
         explain: bool = False,
         turn_order: List[str] = None,
     ) -> Dict[str, Any]:
-        prompt = self._generate_prompt(allies, enemies)
-        response = self.llm.generate_battle_command(prompt)
-        if explain:
-            await print_event_text(response["explanation"])
-        action = self._process_action(response, allies, enemies)
+        # The cache only holds actions, so asking for the reasoning skips it
+        action = None if explain else self.cached_action(allies, enemies)
+        if action is None:
+            prompt = self._generate_prompt(allies, enemies)
+            response = self.llm.generate_battle_command(prompt)
+            if explain:
+                await print_event_text(response["explanation"])
+            action = self._process_action(response, allies, enemies)
+            self.remember_action(action, allies, enemies)
         self.previous_action = action
         return action
 
+    def _abstract_state(
+        self, allies: Party, enemies: Party
+    ) -> Tuple[AbstractBattleState, Dict[str, List[str]]]:
+        available_actions = self._get_available_actions(allies)
+        state = AbstractBattleState(self.character, allies, enemies, available_actions)
+        return state, available_actions
+
+    def accept_planned_action(
+        self, action: Dict[str, Any], allies: Party, enemies: Party
+    ) -> Dict[str, Any]:
+        # Plans are made once per round, so their target may have fallen to
+        # an earlier unit's turn; without any living target, decide anew
+        if self._target_error(action, allies, enemies):
+            if not self._retarget(action, allies, enemies):
+                return None
+        self.previous_action = action
+        return action
+
+    def cached_action(self, allies: Party, enemies: Party) -> Optional[Dict[str, Any]]:
+        state, available_actions = self._abstract_state(allies, enemies)
+        return self.decision_cache.get(state, available_actions)
+
+    def remember_action(
+        self, action: Dict[str, Any], allies: Party, enemies: Party
+    ) -> None:
+        state, _ = self._abstract_state(allies, enemies)
+        self.decision_cache.put(state, action)
+
     def _generate_prompt(self, allies: Party, enemies: Party) -> str:
         context = {
             "character": self._character_to_dict(self.character),
@@ -100,15 +137,18 @@ class AIController(Controller):
         action = self._validate_action(response)
         return self._validate_target(action, allies, enemies)
 
-    def _validate_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+    def is_valid_action(
+        self, action: Dict[str, Any], allies: Party, enemies: Party
+    ) -> bool:
+        return (
+            self._action_error(action) is None
+            and self._target_error(action, allies, enemies) is None
+        )
+
+    def _action_error(self, action: Dict[str, Any]) -> Optional[str]:
         valid_action_types = {"attack", "skill", "spell", "item", "defend"}
         if action.get("action_type") not in valid_action_types:
-            print(f"Invalid action type: {action.get('action_type')}")
-            return {"action_type": "attack", "target": "random_enemy"}
-
-        if action["action_type"] != "defend" and "target" not in action:
-            print("No target specified in action")
-            action["target"] = "random_enemy"
+            return f"Invalid action type: {action.get('action_type')}"
 
         required_fields = {
             "skill": "skill_name",
@@ -118,28 +158,146 @@ class AIController(Controller):
 
         if field := required_fields.get(action["action_type"]):
             if field not in action:
-                print(f"{action['action_type'].capitalize()} action without {field}")
-                return {"action_type": "attack", "target": "random_enemy"}
+                return f"{action['action_type'].capitalize()} action without {field}"
 
-        return action
+        return None
 
-    def _validate_target(
+    def _target_error(
         self, action: Dict[str, Any], allies: Party, enemies: Party
-    ) -> Dict[str, Any]:
+    ) -> Optional[str]:
         if action["action_type"] == "defend":
-            return action
+            return None
 
         all_characters = allies.characters + enemies.characters
         target_name = action.get("target")
+        target = next(
+            (char for char in all_characters if char.name == target_name), None
+        )
 
-        if not target_name or not any(
-            char.name == target_name for char in all_characters
-        ):
-            print(f"Invalid target: {target_name}. Choosing a random enemy.")
-            action["target"] = np.random.choice(enemies.characters).name
+        if not target_name or target is None:
+            return f"Invalid target: {target_name}."
+        if not target.stats.alive and not self._revives(action, allies):
+            return f"{target_name} is already down."
+
+        return None
+
+    def _revives(self, action: Dict[str, Any], allies: Party) -> bool:
+        if action["action_type"] == "spell":
+            return any(
+                getattr(spell, "revive", False)
+                for spell in self.character.spells
+                if spell.name == action.get("spell_name")
+            )
+        if action["action_type"] == "item":
+            return any(
+                isinstance(item, ReviveItem)
+                for item in getattr(allies, "inventory", [])
+                if item.name == action.get("item_name")
+            )
+        return False
+
+    def _retarget(self, action: Dict[str, Any], allies: Party, enemies: Party) -> bool:
+        """Aim the action at a random living character on its target's side."""
+        on_allies = any(char.name == action.get("target") for char in allies.characters)
+        side = allies if on_allies else enemies
+        living = [char for char in side.characters if char.stats.alive]
+        if not living:
+            return False
+        action["target"] = get_rng().choice(living).name
+        return True
+
+    def _validate_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        if error := self._action_error(action):
+            print(error)
+            return {"action_type": "attack", "target": "random_enemy"}
+
+        if action["action_type"] != "defend" and "target" not in action:
+            print("No target specified in action")
+            action["target"] = "random_enemy"
 
         return action
 
+    def _validate_target(
+        self, action: Dict[str, Any], allies: Party, enemies: Party
+    ) -> Dict[str, Any]:
+        if error := self._target_error(action, allies, enemies):
+            print(f"{error} Choosing a random target.")
+            if not self._retarget(action, allies, enemies):
+                action["target"] = "random_enemy"
+
+        return action
+
+
+class SquadController:
+    """
+    Plans the actions of several AI-controlled combatants with a single LLM
+    call. Units whose decision is already cached are left out of the prompt,
+    and entries that fail validation are dropped so that the unit falls back
+    to its own AIController when its turn comes.
+    """
+
+    def __init__(self, controllers: Dict[Character, Controller]):
+        self.controllers = controllers
+
+    async def plan_actions(
+        self, squad: List[Character], allies: Party, enemies: Party
+    ) -> Dict[Character, Dict[str, Any]]:
+        plans = {}
+        pending = []
+        for member in squad:
+            action = self.controllers[member].cached_action(allies, enemies)
+            if action is not None:
+                plans[member] = action
+            else:
+                pending.append(member)
+
+        # A single undecided unit is no cheaper to plan as a squad
+        if len(pending) < 2:
+            return plans
+
+        prompt = self._generate_prompt(pending, allies, enemies)
+        response = get_llm().generate_squad_battle_commands(prompt)
+        entries = {
+            entry.get("character"): entry
+            for entry in response.get("actions", [])
+            if isinstance(entry, dict)
+        }
+
+        for member in pending:
+            controller = self.controllers[member]
+            entry = entries.get(member.name)
+            if entry is None or not controller.is_valid_action(entry, allies, enemies):
+                print(f"No valid squad plan for {member.name}, deciding individually")
+                continue
+            controller.remember_action(entry, allies, enemies)
+            plans[member] = entry
+        return plans
+
+    def _generate_prompt(
+        self, squad: List[Character], allies: Party, enemies: Party
+    ) -> str:
+        controller = self.controllers[squad[0]]
+        context = {
+            "squad": [
+                {
+                    **controller._character_to_dict(member),
+                    "available_actions": self.controllers[
+                        member
+                    ]._get_available_actions(allies),
+                    "previous_action": self.controllers[member].previous_action,
+                }
+                for member in squad
+            ],
+            "turn_order": [member.name for member in squad],
+            "allies": [
+                controller._character_to_dict(ally) for ally in allies.characters
+            ],
+            "enemies": [
+                controller._character_to_dict(enemy) for enemy in enemies.characters
+            ],
+        }
+        return json.dumps(context, default=controller._json_serializable)
+
 
 class PlayerController(Controller):
     def __init__(self, character: Character, background_image_url: str = None):
@@ -161,7 +319,7 @@ class PlayerController(Controller):
         turn_order: List[str] = None,
     ) -> Dict[str, Any]:
         while True:
-            actions = ["Attack", "Skill", "Spell", "Defend", "Item", "Run"]
+            actions = ["Attack", "Skill", "Spell", "Defend", "Item", "Run", "Auto"]
             action = await print_battle_menu(
                 allies, enemies, actions, self.background_image_url, turn_order
             )
@@ -188,6 +346,10 @@ class PlayerController(Controller):
             async def run():
                 return {"action_type": "run"}
 
+            async def auto():
+                # The battle hands this and later turns to a local policy
+                return {"action_type": "auto"}
+
             action_map = {
                 "Attack": perform_attack,
                 "Skill": select_skill,
@@ -195,6 +357,7 @@ class PlayerController(Controller):
                 "Defend": defend,
                 "Item": select_item,
                 "Run": run,
+                "Auto": auto,
             }
 
             result = await action_map[action]()
@@ -366,3 +529,178 @@ class PlayerController(Controller):
             if target
             else {"action_type": "pass"}
         )
+
+
+class PolicyController(Controller):
+    """
+    Decides actions locally with a fixed rule set, without the LLM or the UI.
+    Used to drive both sides of headless battle simulations.
+    """
+
+    # Skills that need the UI or a second ability choice to be used
+    EXCLUDED_SKILLS = ("Inspect", "Double Cast", "Spell Echo")
+
+    async def decide_action(
+        self,
+        allies: Party,
+        enemies: Party,
+        explain: bool = False,
+        turn_order: List[str] = None,
+    ) -> Dict[str, Any]:
+        action = self.choose_action(allies, enemies)
+        self.previous_action = action
+        return action
+
+    def choose_action(self, allies: Party, enemies: Party) -> Dict[str, Any]:
+        raise NotImplementedError("Subclasses must implement choose_action")
+
+    def pick_target(self, candidates: List[Character]) -> Character:
+        return get_rng().choice(candidates)
+
+    def usable_skills(self) -> List:
+        return [
+            skill
+            for skill in self.character.skills
+            if skill.name not in self.EXCLUDED_SKILLS
+            and self.character.stats.sp >= skill.cost
+        ]
+
+    def usable_spells(self) -> List:
+        if not self.character.can_cast_spells:
+            return []
+        return [
+            spell
+            for spell in self.character.spells
+            if self.character.stats.mp >= spell.cost
+        ]
+
+    def attack_action(self, enemies: Party) -> Dict[str, Any]:
+        target = self.pick_target(self._alive(enemies))
+        return {"action_type": "attack", "target": target.name}
+
+    def ability_action(
+        self, ability, ability_type: str, allies: Party, enemies: Party
+    ) -> Optional[Dict[str, Any]]:
+        target = self._ability_target(ability.targets, allies, enemies)
+        if target is None:
+            return None
+        return {
+            "action_type": ability_type,
+            f"{ability_type}_name": ability.name,
+            "target": target,
+        }
+
+    def _ability_target(self, targets: str, allies: Party, enemies: Party):
+        # Single targets are passed by name, group targets as a list of names
+        if targets == "self":
+            return self.character.name
+        candidates = self._alive(allies if targets in ("ally", "allies") else enemies)
+        if not candidates:
+            return None
+        if targets in ("allies", "enemies"):
+            return [char.name for char in candidates]
+        if targets in ("ally", "enemy"):
+            return self.pick_target(candidates).name
+        return None
+
+    @staticmethod
+    def _alive(party: Party) -> List[Character]:
+        return [char for char in party.characters if char.stats.alive]
+
+
+class RandomPolicyController(PolicyController):
+    """Picks uniformly among attacking, defending and every usable ability."""
+
+    def choose_action(self, allies: Party, enemies: Party) -> Dict[str, Any]:
+        options = [("attack", None), ("defend", None)]
+        options += [("skill", skill) for skill in self.usable_skills()]
+        options += [("spell", spell) for spell in self.usable_spells()]
+        action_type, ability = get_rng().choice(options)
+        if action_type == "defend":
+            return {"action_type": "defend"}
+        if ability is not None:
+            action = self.ability_action(ability, action_type, allies, enemies)
+            if action is not None:
+                return action
+        return self.attack_action(enemies)
+
+
+class GreedyPolicyController(PolicyController):
+    """
+    Heals a badly hurt ally when possible, otherwise uses the strongest
+    affordable offense and focuses the weakest enemy.
+    """
+
+    HEAL_THRESHOLD = 0.35
+
+    def pick_target(self, candidates: List[Character]) -> Character:
+        return min(
+            candidates, key=lambda char: char.stats.hp / max(char.stats.max_hp, 1)
+        )
+
+    def choose_action(self, allies: Party, enemies: Party) -> Dict[str, Any]:
+        spells = self.usable_spells()
+        hurt = [
+            char
+            for char in self._alive(allies)
+            if char.stats.hp < self.HEAL_THRESHOLD * char.stats.max_hp
+        ]
+        heals = [spell for spell in spells if isinstance(spell, HealingSpell)]
+        if hurt and heals:
+            heal = max(heals, key=lambda spell: spell.heal_amount)
+            action = self.ability_action(heal, "spell", allies, enemies)
+            if action is not None:
+                return action
+
+        stats = self.character.stats
+        attacks = [spell for spell in spells if isinstance(spell, ElementalSpell)]
+        if attacks and stats.intelligence >= stats.attack:
+            spell = max(attacks, key=lambda spell: spell.base_damage)
+            action = self.ability_action(spell, "spell", allies, enemies)
+            if action is not None:
+                return action
+
+        group_skills = [
+            skill for skill in self.usable_skills() if skill.targets == "enemies"
+        ]
+        if group_skills and len(self._alive(enemies)) > 1:
+            skill = max(group_skills, key=lambda skill: skill.cost)
+            action = self.ability_action(skill, "skill", allies, enemies)
+            if action is not None:
+                return action
+
+        return self.attack_action(enemies)
+
+
+class ReplayController(Controller):
+    """
+    Plays back the actions of a recorded battle. All combatants share one
+    iterator over the recorded (name, action) pairs, which must come up in
+    the same turn order as when the battle was recorded.
+    """
+
+    def __init__(self, character: Character, actions: Iterator[Tuple[str, Dict]]):
+        super().__init__(character)
+        self.actions = actions
+
+    async def decide_action(
+        self,
+        allies: Party,
+        enemies: Party,
+        explain: bool = False,
+        turn_order: List[str] = None,
+    ) -> Dict[str, Any]:
+        name, action = next(self.actions, (None, None))
+        if name != self.character.name:
+            raise ValueError(
+                f"Replay expected a turn for {name}, got {self.character.name}"
+            )
+        action = dict(action)
+        self.previous_action = action
+        return action
+
+
+POLICIES = {
+    "random": RandomPolicyController,
+    "greedy": GreedyPolicyController,
+}
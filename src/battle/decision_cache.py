@@ -0,0 +1,169 @@
+from __future__ import annotations
+import json
+import math
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from src.utils.rng import RNG, get_session_rng
+from src.utils.utils import load_config
+
+if TYPE_CHECKING:
+    from src.core.character import Character
+    from src.core.party import Party
+
+
+def quartile(value: float, maximum: float) -> int:
+    """Bucket a resource into 0 (empty) or 1-4 (quarters of the maximum)."""
+    if maximum <= 0 or value <= 0:
+        return 0
+    return min(4, math.ceil(4 * value / maximum))
+
+
+def _roster_entry(character: Character) -> Tuple[str, str, int, int]:
+    return (
+        str(character.job_class),
+        character.element.name,
+        quartile(character.stats.hp, character.stats.max_hp),
+        quartile(character.stats.mp, character.stats.max_mp),
+    )
+
+
+def _sorted_roster(characters: List[Character]) -> List[Tuple[Tuple, Character]]:
+    return sorted(
+        ((_roster_entry(char), char) for char in characters), key=lambda e: e[0]
+    )
+
+
+class AbstractBattleState:
+    """
+    A name-agnostic view of a battle from one character's perspective.
+
+    HP/MP are bucketed into quartiles and both rosters are described by job
+    class and element only, so recurring encounter patterns map to the same
+    key even though names and exact numbers differ from battle to battle.
+    """
+
+    def __init__(
+        self,
+        character: Character,
+        allies: Party,
+        enemies: Party,
+        available_actions: Dict[str, List[str]],
+    ):
+        self.character = character
+        self.allies = _sorted_roster(allies.characters)
+        self.enemies = _sorted_roster(enemies.characters)
+        self.key = json.dumps(
+            {
+                "self": _roster_entry(character),
+                "allies": [entry for entry, _ in self.allies],
+                "enemies": [entry for entry, _ in self.enemies],
+                "actions": sorted(
+                    category
+                    for category, options in available_actions.items()
+                    if options
+                ),
+            }
+        )
+
+    def encode_target(self, target_name: Any) -> Any:
+        """Replace a target name with its side and rank in the sorted roster."""
+        if not isinstance(target_name, str):
+            return None
+        if target_name == self.character.name:
+            return {"side": "self"}
+        for side, roster in (("allies", self.allies), ("enemies", self.enemies)):
+            for rank, (_, char) in enumerate(roster):
+                if char.name == target_name:
+                    return {"side": side, "rank": rank}
+        # Symbolic targets such as "random_enemy" are already name-agnostic
+        return {"side": "literal", "value": target_name}
+
+    def decode_target(self, encoded: Dict[str, Any]) -> Optional[str]:
+        side = encoded.get("side")
+        if side == "self":
+            return self.character.name
+        if side == "literal":
+            return encoded.get("value")
+        roster = self.allies if side == "allies" else self.enemies
+        rank = encoded.get("rank", -1)
+        if 0 <= rank < len(roster):
+            return roster[rank][1].name
+        return None
+
+
+class BattleDecisionCache:
+    """
+    Enemy decisions keyed by abstract battle state, shared by the battles of
+    one session (see get_decision_cache). Holds at most
+    battle_decision_cache_size entries, dropping the least recently used.
+    """
+
+    ABILITY_FIELDS = {"skill": "skill_name", "spell": "spell_name", "item": "item_name"}
+
+    def __init__(self):
+        config = load_config()
+        self.decisions: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self.enabled = config.get("battle_decision_cache", True)
+        self.max_size = config.get("battle_decision_cache_size", 1000)
+
+    def get(
+        self, state: AbstractBattleState, available_actions: Dict[str, List[str]]
+    ) -> Optional[Dict[str, Any]]:
+        if not self.enabled or state.key not in self.decisions:
+            return None
+        self.decisions.move_to_end(state.key)
+        cached = self.decisions[state.key]
+        action = {"action_type": cached["action_type"]}
+
+        field = self.ABILITY_FIELDS.get(cached["action_type"])
+        if field:
+            # Spell options are listed with their MP cost, so match on prefix
+            options = available_actions.get(cached["action_type"], [])
+            if not any(option.split(" (")[0] == cached[field] for option in options):
+                return None
+            action[field] = cached[field]
+
+        if "target" in cached:
+            target = state.decode_target(cached["target"])
+            if target is None:
+                return None
+            action["target"] = target
+        return action
+
+    def put(self, state: AbstractBattleState, action: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        cached = {"action_type": action["action_type"]}
+        field = self.ABILITY_FIELDS.get(action["action_type"])
+        if field:
+            cached[field] = action[field]
+        if "target" in action:
+            encoded = state.encode_target(action["target"])
+            if encoded is None:
+                return
+            cached["target"] = encoded
+        self.decisions[state.key] = cached
+        self.decisions.move_to_end(state.key)
+        while len(self.decisions) > self.max_size:
+            self.decisions.popitem(last=False)
+
+    def clear(self):
+        self.decisions.clear()
+
+
+# Weak keys, so a session's cache goes away with its RNG
+_session_caches: Dict[RNG, BattleDecisionCache] = weakref.WeakKeyDictionary()
+
+
+def get_decision_cache() -> BattleDecisionCache:
+    """
+    The decision cache of the current session. Starting or loading a game
+    seeds a new session RNG, which comes with an empty cache, so decisions
+    never carry over from one session to another.
+    """
+    session = get_session_rng()
+    cache = _session_caches.get(session)
+    if cache is None:
+        cache = _session_caches[session] = BattleDecisionCache()
+    return cache
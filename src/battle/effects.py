@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.core.character import Character
@@ -20,6 +20,20 @@ class StatusEffect:
     async def update(self, character: Character):
         pass
 
+    @property
+    def modifier_source(self) -> str:
+        return f"effect:{self.name}"
+
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Additive and multiplicative stat modifiers held while the effect is active."""
+        return {}, {}
+
+    def apply_stat_changes(self, character: Character):
+        character.stats.set_modifiers(self.modifier_source, *self.stat_changes())
+
+    def remove_stat_changes(self, character: Character):
+        character.stats.remove_modifiers(self.modifier_source)
+
 
 class StatModifier(StatusEffect):
     def __init__(
@@ -32,15 +46,14 @@ class StatModifier(StatusEffect):
         super().__init__(name, duration, is_detrimental)
         self.stat_modifiers = stat_modifiers
 
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        return self.stat_modifiers, {}
+
     async def apply(self, character: Character):
-        for stat, modifier in self.stat_modifiers.items():
-            current_value = getattr(character.stats, stat)
-            setattr(character.stats, stat, current_value + modifier)
+        self.apply_stat_changes(character)
 
     async def remove(self, character: Character):
-        for stat, modifier in self.stat_modifiers.items():
-            current_value = getattr(character.stats, stat)
-            setattr(character.stats, stat, current_value - modifier)
+        self.remove_stat_changes(character)
 
 
 class Poison(StatusEffect):
@@ -74,12 +87,14 @@ class Defend(StatusEffect):
         super().__init__("Defend", duration, is_detrimental=False)
         self.defense_bonus = defense_bonus
 
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        return {"defense": self.defense_bonus}, {}
+
     async def apply(self, character: Character):
-        character.stats.defense += self.defense_bonus
+        self.apply_stat_changes(character)
 
     async def remove(self, character: Character):
-        character.stats.defense -= self.defense_bonus
-        pass
+        self.remove_stat_changes(character)
 
 
 class Sleep(StatusEffect):
@@ -114,11 +129,14 @@ class SlowEffect(StatusEffect):
         super().__init__("Slow", duration, is_detrimental=True)
         self.speed_modifier = 0.5  # Reduce speed by 50%
 
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        return {}, {"speed": self.speed_modifier}
+
     async def apply(self, character: Character):
-        character.stats.speed *= self.speed_modifier
+        self.apply_stat_changes(character)
 
     async def remove(self, character: Character):
-        character.stats.speed /= self.speed_modifier
+        self.remove_stat_changes(character)
 
 
 class HasteEffect(StatusEffect):
@@ -126,11 +144,14 @@ class HasteEffect(StatusEffect):
         super().__init__("Haste", duration, is_detrimental=False)
         self.speed_modifier = 1.5  # Increase speed by 50%
 
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        return {}, {"speed": self.speed_modifier}
+
     async def apply(self, character: Character):
-        character.stats.speed = int(self.speed_modifier * character.stats.speed)
+        self.apply_stat_changes(character)
 
     async def remove(self, character: Character):
-        character.stats.speed = int(character.stats.speed / self.speed_modifier)
+        self.remove_stat_changes(character)
 
 
 class Intimidated(StatusEffect):
@@ -140,24 +161,13 @@ class Intimidated(StatusEffect):
         super().__init__("Intimidated", duration, is_detrimental=True)
         self.stat_reduction = 0.9  # Reduces stats to 90% of original
 
-    async def apply(self, character: Character):
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
         # Reduce all stats by 10%
-        character.stats.attack = int(character.stats.attack * self.stat_reduction)
-        character.stats.defense = int(character.stats.defense * self.stat_reduction)
-        character.stats.intelligence = int(
-            character.stats.intelligence * self.stat_reduction
-        )
-        character.stats.wisdom = int(character.stats.wisdom * self.stat_reduction)
-        character.stats.speed = int(character.stats.speed * self.stat_reduction)
-        character.stats.luck = int(character.stats.luck * self.stat_reduction)
+        stats = ("attack", "defense", "intelligence", "wisdom", "speed", "luck")
+        return {}, {stat: self.stat_reduction for stat in stats}
+
+    async def apply(self, character: Character):
+        self.apply_stat_changes(character)
 
     async def remove(self, character: Character):
-        # Restore stats to original values
-        character.stats.attack = int(character.stats.attack / self.stat_reduction)
-        character.stats.defense = int(character.stats.defense / self.stat_reduction)
-        character.stats.intelligence = int(
-            character.stats.intelligence / self.stat_reduction
-        )
-        character.stats.wisdom = int(character.stats.wisdom / self.stat_reduction)
-        character.stats.speed = int(character.stats.speed / self.stat_reduction)
-        character.stats.luck = int(character.stats.luck / self.stat_reduction)
+        self.remove_stat_changes(character)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Element:
     def __init__(self, name):
         self.name = name
@@ -58,35 +61,71 @@ ELEMENTAL_RESISTANCES = {
 }
 
 
+def elemental_multiplier(attacker_element, defender_element) -> float:
+    """Damage multiplier for an attacking and a defending element."""
+    if attacker_element == NONE or defender_element == NONE:
+        return 1.0
+    if ELEMENTAL_WEAKNESSES.get(defender_element) == attacker_element:
+        return 2.0
+    if ELEMENTAL_RESISTANCES.get(defender_element) == attacker_element:
+        return 0.5
+    if {attacker_element, defender_element} == {LIGHT, DARK}:
+        return 1.5
+    return 1.0
+
+
+def elemental_explanation(attacker_element, defender_element) -> str:
+    if attacker_element == NONE or defender_element == NONE:
+        return "No elemental interaction."
+    multiplier = elemental_multiplier(attacker_element, defender_element)
+    if multiplier == 2.0:
+        return f"{defender_element} is weak against {attacker_element}!"
+    if multiplier == 0.5:
+        return f"{defender_element} resists {attacker_element}!"
+    if multiplier == 1.5:
+        return f"{attacker_element} is strong against {defender_element}!"
+    return "Normal damage."
+
+
+# Element ids index into the [attacker, defender] tables below
+ELEMENT_IDS = {name: index for index, name in enumerate(ELEMENT_LIST)}
+ELEMENT_MULTIPLIERS = np.array(
+    [
+        [
+            elemental_multiplier(ELEMENT_CLASSES[attacker], ELEMENT_CLASSES[defender])
+            for defender in ELEMENT_LIST
+        ]
+        for attacker in ELEMENT_LIST
+    ]
+)
+ELEMENT_EXPLANATIONS = [
+    [
+        elemental_explanation(ELEMENT_CLASSES[attacker], ELEMENT_CLASSES[defender])
+        for defender in ELEMENT_LIST
+    ]
+    for attacker in ELEMENT_LIST
+]
+
+
+def element_id(element) -> int:
+    """Row of an Element, or of an element name as stored on spells."""
+    name = element if isinstance(element, str) else getattr(element, "name", "None")
+    return ELEMENT_IDS.get(str(name).title(), ELEMENT_IDS["None"])
+
+
 def calculate_elemental_damage(base_damage, attacker_element, defender_element):
     """
     Calculate the elemental damage multiplier and provide an explanation.
 
     :param base_damage: The base damage of the attack
-    :param attacker_element: The Element of the attacker or spell
+    :param attacker_element: The Element (or element name) of the attacker or spell
     :param defender_element: The Element of the defender
     :return: A tuple of (damage value, explanation string)
     """
-    # If either element is NONE, return base damage with explanation
-    if attacker_element == NONE or defender_element == NONE:
-        return base_damage, "No elemental interaction."
-
-    if ELEMENTAL_WEAKNESSES.get(defender_element) == attacker_element:
-        damage = int(base_damage * 2)
-        explanation = f"{defender_element} is weak against {attacker_element}!"
-    elif ELEMENTAL_RESISTANCES.get(defender_element) == attacker_element:
-        damage = int(base_damage * 0.5)
-        explanation = f"{defender_element} resists {attacker_element}!"
-    elif (attacker_element == LIGHT and defender_element == DARK) or (
-        attacker_element == DARK and defender_element == LIGHT
-    ):
-        damage = int(base_damage * 1.5)
-        explanation = f"{attacker_element} is strong against {defender_element}!"
-    else:
-        damage = base_damage
-        explanation = "Normal damage."
-
-    return damage, explanation
+    attacker, defender = element_id(attacker_element), element_id(defender_element)
+    multiplier = ELEMENT_MULTIPLIERS[attacker, defender]
+    damage = base_damage if multiplier == 1 else int(base_damage * multiplier)
+    return damage, ELEMENT_EXPLANATIONS[attacker][defender]
 
 
 def get_weakness(element):
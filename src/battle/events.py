@@ -0,0 +1,179 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from src.api.llm import get_llm
+from src.game.response_manager import print_event_text, print_character_info_async
+
+if TYPE_CHECKING:
+    from src.core.character import Character
+    from src.core.party import Party
+
+
+class BattleEventSink:
+    """
+    Receives everything a battle wants to show to the player.
+
+    Skills, spells, items and the battle log never talk to the UI directly;
+    they send their text to the active sink, which decides whether to
+    narrate it with the LLM and push it to the websocket, or just record it.
+    """
+
+    def narration(self, action_text: str) -> str:
+        return action_text
+
+    async def message(
+        self,
+        title: str,
+        text: str = "",
+        background_image_url: str = None,
+        **display,
+    ) -> None:
+        pass
+
+    async def narrate(
+        self,
+        title: str,
+        action_text: str,
+        background_image_url: str = None,
+        **display,
+    ) -> None:
+        await self.message(
+            title, self.narration(action_text), background_image_url, **display
+        )
+
+    async def character_info(self, character_info: Dict[str, Any]) -> None:
+        pass
+
+    def start_battle(self, party: Party, enemies: Party) -> None:
+        pass
+
+    def record_action(self, character: Character, action: Dict[str, Any]) -> None:
+        pass
+
+    def record_outcome(self, outcome: str, turns: int) -> None:
+        pass
+
+
+class UIEventSink(BattleEventSink):
+    """Narrates events with the LLM and shows them through the ResponseManager."""
+
+    def narration(self, action_text: str) -> str:
+        return get_llm().generate_action_text(action_text)
+
+    async def message(
+        self,
+        title: str,
+        text: str = "",
+        background_image_url: str = None,
+        **display,
+    ) -> None:
+        await print_event_text(title, text, background_image_url, **display)
+
+    async def character_info(self, character_info: Dict[str, Any]) -> None:
+        await print_character_info_async(character_info)
+
+
+class HeadlessEventSink(BattleEventSink):
+    """
+    Records battle events without any UI or LLM calls, for batch simulation.
+
+    Damage is measured as the HP lost by the opposing side during each
+    action, so it includes every skill, spell and item without those having
+    to report numbers themselves.
+    """
+
+    def __init__(self, keep_log: bool = False, verbose: bool = False):
+        self.keep_log = keep_log
+        self.verbose = verbose
+        self.log: List[Dict[str, Any]] = []
+        self.outcomes: Counter = Counter()
+        self.turn_counts: List[int] = []
+        self.damage_per_action: List[int] = []
+        self.action_counts: Counter = Counter()
+        self._party: Optional[Party] = None
+        self._enemies: Optional[Party] = None
+        self._hp: Dict[Character, int] = {}
+
+    async def message(
+        self,
+        title: str,
+        text: str = "",
+        background_image_url: str = None,
+        **display,
+    ) -> None:
+        if self.keep_log:
+            self.log.append({"title": title, "text": text})
+        if self.verbose:
+            print(f"{title}\n{text}".strip())
+
+    def start_battle(self, party: Party, enemies: Party) -> None:
+        self._party = party
+        self._enemies = enemies
+        self._hp = self._snapshot_hp()
+
+    def record_action(self, character: Character, action: Dict[str, Any]) -> None:
+        hp = self._snapshot_hp()
+        opponents = (
+            self._enemies.characters
+            if character in self._party.characters
+            else self._party.characters
+        )
+        damage = sum(max(0, self._hp[char] - hp[char]) for char in opponents)
+        self.damage_per_action.append(damage)
+        self.action_counts[action.get("action_type")] += 1
+        self._hp = hp
+
+    def record_outcome(self, outcome: str, turns: int) -> None:
+        self.outcomes[outcome] += 1
+        self.turn_counts.append(turns)
+
+    def _snapshot_hp(self) -> Dict[Character, int]:
+        return {
+            char: char.stats.hp
+            for char in self._party.characters + self._enemies.characters
+        }
+
+
+class RoundLogSink(BattleEventSink):
+    """
+    Collects the messages of auto-battle turns without narrating them, so a
+    whole round can be shown to the player as a single update.
+    """
+
+    def __init__(self):
+        self.entries: List[str] = []
+
+    async def message(
+        self,
+        title: str,
+        text: str = "",
+        background_image_url: str = None,
+        **display,
+    ) -> None:
+        self.entries.append(text or title)
+
+    def pop_text(self) -> str:
+        text = "\n".join(self.entries)
+        self.entries = []
+        return text
+
+
+_active_sink: ContextVar[Optional[BattleEventSink]] = ContextVar(
+    "battle_event_sink", default=None
+)
+
+
+def get_event_sink() -> BattleEventSink:
+    """Return the sink of the running battle, or the UI outside of battles."""
+    return _active_sink.get() or UIEventSink()
+
+
+@contextmanager
+def use_event_sink(sink: BattleEventSink):
+    token = _active_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _active_sink.reset(token)
@@ -0,0 +1,184 @@
+"""
+Compact battle replays and a headless replay runner.
+
+A replay holds the battle's RNG seed, a snapshot of every combatant taken
+before the first turn and the action chosen on each turn. Re-running it
+with ReplayControllers reproduces the battle exactly, without the LLM or
+the websocket, so recorded player sessions double as regression and
+profiling input.
+
+Usage:
+    python -m src.battle.replay data/replays [--profile] [--repeat 10]
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import cProfile
+import gzip
+import os
+import pickle
+import pstats
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from src.battle.events import HeadlessEventSink
+from src.core.party import Party
+
+if TYPE_CHECKING:
+    from src.core.character import Character
+
+REPLAY_DIR = "data/replays"
+
+
+@dataclass
+class BattleReplay:
+    seed: int
+    battle_type: str
+    # Pickled (party characters, inventory, enemy characters) at battle start
+    snapshot: bytes
+    actions: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    outcome: str = ""
+    turns: int = 0
+
+    @classmethod
+    def capture(
+        cls, seed: int, battle_type: str, party: Party, enemies: Party
+    ) -> BattleReplay:
+        snapshot = pickle.dumps(
+            (party.characters, party.inventory, enemies.characters),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        return cls(seed, battle_type, snapshot)
+
+    def record(self, character: Character, action: Dict[str, Any]) -> None:
+        # Actions only hold names and plain values, so a shallow copy of the
+        # dict and its target list is enough to freeze them
+        action = dict(action)
+        if isinstance(action.get("target"), list):
+            action["target"] = list(action["target"])
+        self.actions.append((character.name, action))
+
+    def restore(self) -> Tuple[Party, Party]:
+        """Fresh copies of both sides as they were before the first turn."""
+        from src.core.enemies import EnemyParty
+
+        characters, inventory, enemies = pickle.loads(self.snapshot)
+        return Party(characters, inventory), EnemyParty(enemies)
+
+    def save(self, directory: str = REPLAY_DIR, keep: int = None) -> str:
+        """Write the replay, then delete all but the newest keep replays."""
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filepath = os.path.join(directory, f"battle_{timestamp}.replay")
+        with gzip.open(filepath, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+        if keep is not None:
+            # Timestamped names sort oldest first
+            for old_path in find_replays([directory])[:-keep]:
+                os.remove(old_path)
+        return filepath
+
+    @staticmethod
+    def load(filepath: str) -> BattleReplay:
+        with gzip.open(filepath, "rb") as file:
+            return pickle.load(file)
+
+
+async def run_replay(
+    replay: BattleReplay, sink: HeadlessEventSink = None
+) -> Tuple[str, int]:
+    """Re-run a replay headlessly, returning its outcome and turn count."""
+    from src.battle.battle import Battle
+    from src.battle.controllers import ReplayController
+
+    party, enemies = replay.restore()
+    actions = iter(replay.actions)
+    battle = Battle(
+        party,
+        enemies,
+        sink=sink or HeadlessEventSink(),
+        controller_factory=lambda char: ReplayController(char, actions),
+        award_rewards=False,
+        seed=replay.seed,
+        record_replay=False,
+    )
+    outcome = await battle.start(replay.battle_type)
+    return outcome, battle.turns
+
+
+def find_replays(paths: List[str]) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(
+                os.path.join(path, name)
+                for name in os.listdir(path)
+                if name.endswith(".replay")
+            )
+        else:
+            files.append(path)
+    return files
+
+
+async def run_corpus(
+    replays: List[Tuple[str, BattleReplay]], repeat: int, verbose: bool
+) -> Tuple[int, int]:
+    """Replay every battle, reporting the ones whose result changed."""
+    mismatches = turns = 0
+    for _ in range(repeat):
+        for path, replay in replays:
+            try:
+                outcome, battle_turns = await run_replay(
+                    replay, HeadlessEventSink(verbose=verbose)
+                )
+            except ValueError as e:
+                outcome, battle_turns = f"diverged ({e})", 0
+            turns += battle_turns
+            if (outcome, battle_turns) != (replay.outcome, replay.turns):
+                mismatches += 1
+                print(
+                    f"{path}: recorded {replay.outcome} in {replay.turns} turns,"
+                    f" replayed {outcome} in {battle_turns} turns"
+                )
+    return mismatches, turns
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-run recorded battles headlessly.")
+    parser.add_argument(
+        "paths", nargs="*", default=[REPLAY_DIR], help="Replay files or directories"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per replay")
+    parser.add_argument(
+        "--profile", action="store_true", help="Profile the battle loop with cProfile"
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    replays = [(path, BattleReplay.load(path)) for path in find_replays(args.paths)]
+    if not replays:
+        print("No replays found.")
+        return
+
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    mismatches, turns = asyncio.run(run_corpus(replays, args.repeat, args.verbose))
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    battles = len(replays) * args.repeat
+    print(
+        f"{battles} battles, {turns} turns in {elapsed:.2f}s"
+        f" ({turns / max(elapsed, 1e-9):,.0f} turns/s), {mismatches} mismatches"
+    )
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
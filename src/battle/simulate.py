@@ -0,0 +1,193 @@
+"""
+Headless batch simulation of battles for balance testing.
+
+Both sides are driven by local policy controllers and all battle output goes
+to a HeadlessEventSink, so no LLM, image or websocket calls are made.
+
+Usage:
+    python -m src.battle.simulate --battles 1000 --level 10 --policy greedy
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+import numpy as np
+from src.battle.balance import spell_tier
+from src.battle.battle import Battle
+from src.battle.controllers import POLICIES
+from src.battle.elements import ELEMENT_LIST, deserialize_element
+from src.battle.events import HeadlessEventSink
+from src.battle.skills import EnemySpecial, skill_map
+from src.battle.stats import BASE_STATS
+from src.core.character import Character, PlayerCharacter
+from src.core.enemies import EnemyCharacter, EnemyParty
+from src.core.party import Party
+from src.core.spells import Spell, SpellManager, spell_map
+from src.utils.rng import RNG, get_rng, use_rng
+
+
+def random_biases() -> Dict[str, int]:
+    return {stat: get_rng().randint(0, 4) for stat in BASE_STATS}
+
+
+def make_spells(categories: List[str], level: int) -> List[Spell]:
+    tier = int(spell_tier(level))
+    spell_manager = SpellManager()
+    return [
+        spell_manager.create_spell_class(
+            f"{category.title()} {tier}",
+            f"A tier {tier} {category} spell.",
+            category,
+            tier,
+            element=get_rng().choice(ELEMENT_LIST),
+        )
+        for category in categories
+    ]
+
+
+def make_hero(name: str, level: int) -> PlayerCharacter:
+    """Build a random party member of the given level without any LLM calls."""
+    base_class = get_rng().choice(list(skill_map))
+    hero = PlayerCharacter(
+        name,
+        description=base_class,
+        job_class=base_class.split(" ")[0],
+        level=level,
+        base_class=base_class,
+        portrait="",
+        stat_biases=random_biases(),
+    )
+    hero.spells = make_spells(spell_map[base_class], level)
+    return hero
+
+
+def make_sim_enemy(name: str, level: int, enemy_type: str) -> EnemyCharacter:
+    """Build a random enemy of the given level without any LLM calls."""
+    enemy = EnemyCharacter(
+        name,
+        description="A simulated enemy.",
+        level=level,
+        loot=[],
+        job_class="Monster",
+        enemy_type=enemy_type,
+        element=deserialize_element(get_rng().choice(ELEMENT_LIST)),
+        portrait="",
+        stat_biases=random_biases(),
+    )
+    enemy.spells = make_spells(["elemental"], level)
+    enemy.skills.append(EnemySpecial("Strike"))
+    return enemy
+
+
+async def run_batch(
+    battles: int,
+    level: int,
+    party_size: int,
+    enemy_count: int,
+    party_policy: str,
+    enemy_policy: str,
+    enemy_type: str,
+    seed: int,
+    verbose: bool = False,
+) -> HeadlessEventSink:
+    sink = HeadlessEventSink(verbose=verbose)
+
+    def controller_factory(character: Character):
+        if isinstance(character, PlayerCharacter):
+            return POLICIES[party_policy](character)
+        return POLICIES[enemy_policy](character)
+
+    for index in range(battles):
+        # The battle draws its own seed from this stream, so every battle of
+        # the batch is reproducible from the batch seed alone
+        with use_rng(RNG(seed + index)):
+            party = Party(
+                [make_hero(f"Hero {i + 1}", level) for i in range(party_size)],
+                inventory=[],
+            )
+            enemies = EnemyParty(
+                [
+                    make_sim_enemy(f"Enemy {i + 1}", level, enemy_type)
+                    for i in range(enemy_count)
+                ]
+            )
+            battle = Battle(
+                party,
+                enemies,
+                sink=sink,
+                controller_factory=controller_factory,
+                award_rewards=False,
+                record_replay=False,
+            )
+        await battle.start()
+    return sink
+
+
+def summarize(sink: HeadlessEventSink, elapsed: float) -> str:
+    total = sum(sink.outcomes.values())
+    turns = np.array(sink.turn_counts)
+    damage = np.array(sink.damage_per_action)
+    hits = damage[damage > 0]
+
+    lines = [
+        f"Battles:        {total} ({elapsed:.2f}s, {total / max(elapsed, 1e-9):.1f}/s)",
+        f"Win rate:       {sink.outcomes['party_victory'] / max(total, 1):.1%}",
+        "Outcomes:       "
+        + ", ".join(f"{k}={v}" for k, v in sorted(sink.outcomes.items())),
+        f"Turns:          mean {turns.mean():.1f}, "
+        f"p10/p50/p90 {' / '.join(str(int(p)) for p in np.percentile(turns, [10, 50, 90]))}, "
+        f"max {turns.max()}",
+    ]
+    if hits.size:
+        lines.append(
+            f"Damage/action:  mean {hits.mean():.1f}, "
+            f"p10/p50/p90 {' / '.join(str(int(p)) for p in np.percentile(hits, [10, 50, 90]))}, "
+            f"max {int(hits.max())} ({hits.size / damage.size:.1%} of actions dealt damage)"
+        )
+    actions = sum(sink.action_counts.values())
+    lines.append(
+        "Action mix:     "
+        + ", ".join(
+            f"{action}={count / actions:.1%}"
+            for action, count in sink.action_counts.most_common()
+        )
+    )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run headless battle simulations.")
+    parser.add_argument("--battles", type=int, default=100)
+    parser.add_argument("--level", type=int, default=10)
+    parser.add_argument("--party-size", type=int, default=3)
+    parser.add_argument("--enemies", type=int, default=3)
+    parser.add_argument("--policy", choices=POLICIES, default="greedy")
+    parser.add_argument("--enemy-policy", choices=POLICIES, default="random")
+    parser.add_argument(
+        "--enemy-type", choices=("regular", "boss"), default="regular"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    sink = asyncio.run(
+        run_batch(
+            args.battles,
+            args.level,
+            args.party_size,
+            args.enemies,
+            args.policy,
+            args.enemy_policy,
+            args.enemy_type,
+            args.seed,
+            args.verbose,
+        )
+    )
+    print(summarize(sink, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,9 @@ from __future__ import annotations
 import numpy as np
 from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
-from src.game.response_manager import print_event_text
 from src.utils.utils import calculate_hit_outcome
-from src.api.llm import get_llm
+from src.battle.events import get_event_sink
+from src.battle.combat_state import get_combat_state
 from src.battle.elements import calculate_elemental_damage, NONE
 from src.battle.effects import (
     Sleep,
@@ -17,8 +17,7 @@ from src.battle.effects import (
     SlowEffect,
     Silence,
 )
-from src.game.response_manager import print_character_info_async
-import random
+from src.utils.rng import get_rng
 
 if TYPE_CHECKING:
     from src.core.character import Character
@@ -45,21 +44,31 @@ class Skill(ABC):
     async def fancy_text(
         self, action_text: str, user: Character, target: Character = None
     ):
-        fancy_action_text = get_llm().generate_action_text(action_text)
         # check if target is a list, if so, use the first element
         if isinstance(target, list):
             target = target[0]
-        await print_event_text(
+        await get_event_sink().narrate(
             f"{self.name} used!",
-            fancy_action_text,
+            action_text,
             input_type="battle_message",
             portrait_image_url=user.portrait,
             npc_portrait_url=target.portrait if target else None,
         )
 
     def calculate_base_damage(self, user: Character, target: Character) -> int:
-        damage = user.stats.attack * (user.stats.attack / target.stats.defense)
-        return int(np.random.uniform(0.75, 1.25) * damage)
+        # Debuffs can bring defense down to 0
+        defense = max(target.stats.defense, 1)
+        damage = user.stats.attack * (user.stats.attack / defense)
+        return int(get_rng().uniform(0.75, 1.25) * damage)
+
+    def damage_targets(
+        self, user: Character, targets: list[Character], multiplier: int = 1
+    ) -> np.ndarray:
+        """Deal base damage times multiplier to every target in one vectorized step."""
+        state = get_combat_state([user, *targets])
+        rows = state.rows_of(targets)
+        damage = state.base_damage(user, rows) * multiplier
+        return state.change_hp(rows, -damage)
 
     async def remove_sleep(self, target: Character):
         await target.remove_status_effect(Sleep(10))
@@ -152,7 +161,7 @@ class Inspect(Skill):
             target = target[0]
         action_text = f"{user.name} inspects {target.name}..."
         await self.fancy_text(action_text, user, target)
-        await print_character_info_async(target.to_dict())
+        await get_event_sink().character_info(target.to_dict())
 
 
 class BigSwing(Skill):
@@ -166,17 +175,16 @@ class BigSwing(Skill):
 
     async def _use_effect(self, targets: list[Character], user: Character):
         action_text = f"{user.name} uses {self.name} ({self.description})!"
-        for target in targets:
-            damage = self.calculate_base_damage(user, target) * 3
-            true_damage = target.stats.hp_change(-damage)
+        true_damage = self.damage_targets(user, targets, multiplier=3)
+        for target, damage in zip(targets, true_damage):
             action_text += (
-                f"{user.name} attacks {target.name} for {abs(true_damage)} damage\n"
+                f"{user.name} attacks {target.name} for {abs(damage)} damage\n"
             )
             await self.remove_sleep(target)
             if target.stats.hp == 0:
                 action_text += f"{target.name} has been defeated!\n"
 
-        await self.fancy_text(action_text, user, target)
+        await self.fancy_text(action_text, user, targets[-1])
 
 
 class Prayer(Skill):
@@ -190,7 +198,7 @@ class Prayer(Skill):
 
     async def _use_effect(self, target: Character, user: Character):
         # Base healing scaled by wisdom
-        healing = int(user.stats.wisdom * random.uniform(1.0, 2.0))
+        healing = int(user.stats.wisdom * get_rng().uniform(1.0, 2.0))
         true_hp = user.stats.hp_change(healing)
         true_mp = user.stats.mp_change(healing // 2)  # MP restoration is half of HP
         action_text = (
@@ -217,10 +225,10 @@ class Steal(Skill):
         success_rate = base_rate + (max(0, luck_difference) * luck_rate)
         success_rate = max(base_rate, min(0.99, success_rate))
 
-        if random.random() < success_rate:
+        if get_rng().random() < success_rate:
             # Successfully stole an item
             if target.loot and len(target.loot) > 0:
-                stolen_item = random.choice(target.loot)
+                stolen_item = get_rng().choice(target.loot)
                 target.loot.remove(stolen_item)
                 user.temp_inventory.append(stolen_item)
                 action_text = f"{user.name} successfully steals {stolen_item.name} from {target.name}!"
@@ -438,7 +446,7 @@ class SpellEcho(Skill):
         await spell.cast(target, user)
 
         # 30% chance to echo
-        if random.random() < 0.3:
+        if get_rng().random() < 0.3:
             action_text = f"{user.name} has their spell echo!"
             await self.fancy_text(action_text, user, target)
             # Cast again without MP cost
@@ -486,11 +494,12 @@ class GroupHeal(Skill):
             user.stats.wisdom * 0.8
         )  # Slightly less than Prayer since it hits multiple targets
 
-        for ally in targets:
-            healing = int(
-                base_healing * random.uniform(0.9, 1.1)
-            )  # Small random variation
-            true_healing = ally.stats.hp_change(healing)
+        state = get_combat_state(targets)
+        rows = state.rows_of(targets)
+        healing = (
+            base_healing * get_rng().uniform(0.9, 1.1, rows.size)
+        ).astype(int)  # Small random variation
+        for ally, true_healing in zip(targets, state.change_hp(rows, healing)):
             action_text += f"{ally.name} recovers {abs(true_healing)} HP!\n"
 
         await self.fancy_text(action_text, user, targets[0])
@@ -568,9 +577,9 @@ class Whirlwind(Skill):
     async def _use_effect(self, targets: list[Character], user: Character):
         action_text = f"{user.name} becomes a whirlwind of attacks!\n"
 
-        num_hits = random.randint(3, 5)  # 3-5 random hits
+        num_hits = get_rng().randint(3, 5)  # 3-5 random hits
         for _ in range(num_hits):
-            target = random.choice(targets)
+            target = get_rng().choice(targets)
             damage = int(
                 self.calculate_base_damage(user, target) * 0.5
             )  # Each hit does 50% damage
@@ -604,14 +613,14 @@ class LuckyStrike(Skill):
         action_text = f"{user.name} lands a lucky strike on {target.name} for {abs(true_damage)} damage!\n"
 
         # 40% chance to apply a random status effect
-        if random.random() < 0.4:
+        if get_rng().random() < 0.4:
             possible_effects = [
                 Sleep(2),
                 SlowEffect(2),
                 Poison(2, damage_per_turn=int(user.stats.attack * 0.2)),
                 Silence(2),
             ]
-            effect = random.choice(possible_effects)
+            effect = get_rng().choice(possible_effects)
             await target.add_status_effect(effect)
             action_text += f"Lucky! {target.name} is afflicted with {effect.name}!"
 
@@ -665,14 +674,13 @@ class Requiem(Skill):
 
     async def _use_effect(self, targets: list[Character], user: Character):
         action_text = f"{user.name} uses {self.name} ({self.description})!"
-        for target in targets:
-            damage = self.calculate_base_damage(user, target) * 1000
-            true_damage = target.stats.hp_change(-damage)
+        true_damage = self.damage_targets(user, targets, multiplier=1000)
+        for target, damage in zip(targets, true_damage):
             action_text += (
-                f"{user.name} attacks {target.name} for {abs(true_damage)} damage\n"
+                f"{user.name} attacks {target.name} for {abs(damage)} damage\n"
             )
             await self.remove_sleep(target)
             if target.stats.hp == 0:
                 action_text += f"{target.name} has been defeated!\n"
 
-        await self.fancy_text(action_text, user, target)
+        await self.fancy_text(action_text, user, targets[-1])
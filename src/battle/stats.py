@@ -1,26 +1,162 @@
-from dataclasses import dataclass
 from src.api.llm import get_llm
-from typing import Dict
+import math
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.battle.combat_state import CombatState
+
+
+# Stats that are computed from a base value and the modifier stack
+MODIFIABLE_STATS = (
+    "max_hp",
+    "max_mp",
+    "attack",
+    "defense",
+    "intelligence",
+    "wisdom",
+    "speed",
+    "luck",
+)
+# Stats that are written through to a running battle's CombatState
+BATTLE_STATS = ("hp", "mp", "alive")
 
 
-@dataclass
 class CharacterStats:
-    max_hp: int = 50
-    max_mp: int = 25
-    attack: int = 10
-    defense: int = 10
-    intelligence: int = 10
-    wisdom: int = 10
-    speed: int = 10
-    luck: int = 10
-    alive: bool = True
-    sp: int = 0
-    max_sp: int = 3
-
-    def __post_init__(self):
+    """
+    Base stats plus a stack of modifiers keyed by their source (an equipped
+    item or a status effect). Effective stats are (base + additive) *
+    multiplicative, truncated to int, and are computed lazily and cached until
+    the stack or a base stat changes. Assigning to a stat sets its base value.
+
+    During a battle the stats are bound to a row of the battle's CombatState,
+    and every change to hp, mp, alive or the stack is written through to its
+    arrays, so they never need to be re-read from here.
+    """
+
+    def __init__(
+        self,
+        max_hp: int = 50,
+        max_mp: int = 25,
+        attack: int = 10,
+        defense: int = 10,
+        intelligence: int = 10,
+        wisdom: int = 10,
+        speed: int = 10,
+        luck: int = 10,
+        alive: bool = True,
+        sp: int = 0,
+        max_sp: int = 3,
+    ):
+        self.on_death = None  # Callback function to be set by the Character class
+        self.on_speed_change = None  # Callback function to be set by the Character class
+        self.modifiers: Dict[str, Tuple[Dict[str, float], Dict[str, float]]] = {}
+        self._effective = None
+        self._state: Optional["CombatState"] = None
+        self._row = 0
+        self.base = {
+            "max_hp": max_hp,
+            "max_mp": max_mp,
+            "attack": attack,
+            "defense": defense,
+            "intelligence": intelligence,
+            "wisdom": wisdom,
+            "speed": speed,
+            "luck": luck,
+        }
+        self.alive = alive
+        self.sp = sp
+        self.max_sp = max_sp
         self.hp = self.max_hp
         self.mp = self.max_mp
-        self.on_death = None  # Callback function to be set by the Character class
+
+    @property
+    def effective(self) -> Dict[str, int]:
+        if self._effective is None:
+            effective = {}
+            for stat, value in self.base.items():
+                multiplier = 1.0
+                for additive, multiplicative in self.modifiers.values():
+                    value += additive.get(stat, 0)
+                    multiplier *= multiplicative.get(stat, 1.0)
+                effective[stat] = int(value * multiplier)
+            self._effective = effective
+        return self._effective
+
+    def set_base(self, stat: str, value: int) -> None:
+        self.base[stat] = value
+        self._stack_changed()
+
+    def set_modifiers(
+        self,
+        source: str,
+        additive: Dict[str, float] = None,
+        multiplicative: Dict[str, float] = None,
+    ) -> None:
+        """Add or replace every modifier coming from one source."""
+        self.modifiers[source] = (dict(additive or {}), dict(multiplicative or {}))
+        self._stack_changed()
+
+    def remove_modifiers(self, source: str) -> None:
+        if self.modifiers.pop(source, None) is not None:
+            self._stack_changed()
+
+    def _stack_changed(self) -> None:
+        previous = self._effective
+        self._effective = None
+        if self._state is not None:
+            self._state.load_stats(self._row, self.effective)
+        if self.on_speed_change and (
+            previous is None or previous["speed"] != self.speed
+        ):
+            self.on_speed_change()
+
+    def bind(self, state: "CombatState", row: int) -> None:
+        """Write every later change through to a row of a battle's arrays."""
+        self._state, self._row = state, row
+
+    def unbind(self) -> None:
+        self._state = None
+
+    def unbake_modifiers(
+        self,
+        source: str,
+        additive: Dict[str, float],
+        multiplicative: Dict[str, float],
+    ) -> None:
+        """
+        Move modifiers that older saves applied to the stats in place into
+        the stack, recovering the base values they were applied to.
+        """
+        for stat, multiplier in multiplicative.items():
+            if multiplier:
+                # Smallest base that truncates to the stored value
+                self.base[stat] = math.ceil(self.base[stat] / multiplier - 1e-9)
+        for stat, value in additive.items():
+            self.base[stat] -= value
+        self.modifiers[source] = (dict(additive), dict(multiplicative))
+        self._effective = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_state"] = None
+        state["_effective"] = None
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        if "base" not in state:
+            # Saves from before the modifier stack stored flat stat values
+            state["base"] = {stat: state.pop(stat) for stat in MODIFIABLE_STATS}
+            state["modifiers"] = {}
+            state["needs_unbake"] = True
+        for stat in BATTLE_STATS:
+            if stat in state:
+                state[f"_{stat}"] = state.pop(stat)
+        state["_effective"] = None
+        state.setdefault("_state", None)
+        state.setdefault("_row", 0)
+        state.setdefault("on_speed_change", None)
+        self.__dict__.update(state)
 
     def __str__(self) -> str:
         left_column = 15
@@ -96,6 +232,36 @@ class CharacterStats:
         return stats
 
 
+def _stat_property(stat: str) -> property:
+    def getter(self: CharacterStats) -> int:
+        return self.effective[stat]
+
+    def setter(self: CharacterStats, value: int) -> None:
+        self.set_base(stat, value)
+
+    return property(getter, setter)
+
+
+def _battle_property(stat: str) -> property:
+    attr = f"_{stat}"
+
+    def getter(self: CharacterStats):
+        return getattr(self, attr)
+
+    def setter(self: CharacterStats, value) -> None:
+        setattr(self, attr, value)
+        if self._state is not None:
+            getattr(self._state, stat)[self._row] = value
+
+    return property(getter, setter)
+
+
+for _stat in MODIFIABLE_STATS:
+    setattr(CharacterStats, _stat, _stat_property(_stat))
+for _stat in BATTLE_STATS:
+    setattr(CharacterStats, _stat, _battle_property(_stat))
+
+
 BASE_STATS = {
     "max_hp": 100,
     "max_mp": 50,
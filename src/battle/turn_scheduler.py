@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Optional
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.core.character import Character
+
+
+class TurnScheduler:
+    """
+    Incremental turn scheduler for a battle.
+
+    Every tick, each living character adds its tick rate of log2(speed + 1)
+    to its time units, and the character with the most takes the turn and
+    drops back to zero; ties go to whoever joined the battle first. Dead
+    characters keep their time units until they are revived.
+
+    Tick rates are computed once, when a speed changes, and the predicted
+    order is kept between turns: each turn only plays the next tick and
+    extends the prediction by one, instead of replaying every predicted
+    tick. The prediction is rebuilt when a speed changes or a character
+    dies or is revived.
+    """
+
+    def __init__(self, characters: List[Character]):
+        self.characters = list(characters)
+        self._index: Dict[Character, int] = {
+            character: index for index, character in enumerate(self.characters)
+        }
+        self._rates = [self.tick_rate(character) for character in self.characters]
+        self._time_units = [0.0] * len(self.characters)
+        # Upcoming actors, and the time units once they have all acted
+        self._predicted: List[int] = []
+        self._predicted_units: List[float] = []
+        self._predicted_alive: List[bool] = []
+
+    @staticmethod
+    def tick_rate(character: Character) -> float:
+        return float(np.log2(character.stats.speed + 1))
+
+    def update_speed(self, character: Character) -> None:
+        """Use a character's new speed from the next tick on."""
+        index = self._index.get(character)
+        if index is None:
+            return
+        self._rates[index] = self.tick_rate(character)
+        self._predicted_alive = []
+
+    def next_actor(self) -> Optional[Character]:
+        """Play the next tick and return the character taking the turn."""
+        alive = self._alive()
+        actor = self._tick(self._time_units, alive)
+        if actor is None:
+            return None
+        if alive == self._predicted_alive and self._predicted[:1] == [actor]:
+            self._predicted.pop(0)
+        else:
+            self._predicted_alive = []
+        return self.characters[actor]
+
+    def predict_turn_order(self, num_turns: int = 10) -> List[Character]:
+        alive = self._alive()
+        if alive != self._predicted_alive:
+            self._predicted = []
+            self._predicted_units = list(self._time_units)
+            self._predicted_alive = alive
+        while len(self._predicted) < num_turns:
+            actor = self._tick(self._predicted_units, alive)
+            if actor is None:
+                break
+            self._predicted.append(actor)
+        return [self.characters[index] for index in self._predicted[:num_turns]]
+
+    def _alive(self) -> List[bool]:
+        return [character.stats.alive for character in self.characters]
+
+    def _tick(self, time_units: List[float], alive: List[bool]) -> Optional[int]:
+        """Advance time_units by one tick and return the index of the actor."""
+        actor, best = None, 0.0
+        for index, rate in enumerate(self._rates):
+            if alive[index]:
+                time_units[index] += rate
+                if actor is None or time_units[index] > best:
+                    actor, best = index, time_units[index]
+        if actor is not None:
+            time_units[actor] = 0.0
+        return actor
@@ -40,17 +40,50 @@ class Character:
         appearance: str = None,
         element: Element = NONE,
         portrait: str = None,
+        stat_biases: Dict[str, int] = None,
     ):
+        if stat_biases is None:
+            stat_biases = get_llm().generate_stats(job_class=job_class)
+        if portrait is None:
+            portrait = generate_npc_portrait(name, appearance or description, job_class)
+        self._setup(
+            name,
+            description,
+            job_class,
+            level,
+            element,
+            portrait,
+            stat_biases,
+            CharacterStats(**generate_stats(stat_biases, level)),
+        )
+
+    def _setup(
+        self,
+        name: str,
+        description: str,
+        job_class: str,
+        level: int,
+        element: Element,
+        portrait: str,
+        stat_biases: Dict[str, int],
+        stats: CharacterStats,
+    ):
+        """
+        Set every instance attribute. Shared with EnemyPrototype.spawn, which
+        builds enemies from stored stats instead of calling __init__.
+        """
         self.name = name
         self.job_class = job_class
         self.level = level
         self.spells: List[Spell] = []
         self.attack_skill = Attack()
         self.skills: List[Skill] = []
-        self.stat_biases = get_llm().generate_stats(job_class=job_class)
-        self.stats = CharacterStats(**generate_stats(self.stat_biases, self.level))
+        self.stat_biases = stat_biases
+        self.stats = stats
         self.reset_sp()
         self.stats.on_death = self.on_death  # Set the on_death callback
+        self.stats.on_speed_change = self.on_speed_change
+        self.turn_scheduler = None  # Set by Battle while a battle is running
         self.description = description
         self.status_effects: List[StatusEffect] = []
         self.can_cast_spells = True
@@ -62,16 +95,7 @@ class Character:
             "armor": None,
             "accessory": None,
         }
-        if portrait is None:
-            if appearance:
-                appearance_text = appearance
-            else:
-                appearance_text = description
-            self.portrait = generate_npc_portrait(
-                self.name, appearance_text, self.job_class
-            )
-        else:
-            self.portrait = portrait
+        self.portrait = portrait
         self.next_spell_free = False
 
     async def attack(self, target):
@@ -111,7 +135,33 @@ class Character:
     def on_death(self):
         self.remove_all_status_effects()
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.stats.__dict__.pop("needs_unbake", False):
+            # Older saves applied equipment and effect bonuses to the stats
+            # in place; move them into the modifier stack
+            sources = [item for item in self.equipment.values() if item]
+            sources += self.status_effects
+            # Undo the most recently applied bonuses first
+            for source in reversed(sources):
+                additive, multiplicative = source.stat_changes()
+                if additive or multiplicative:
+                    self.stats.unbake_modifiers(
+                        source.modifier_source, additive, multiplicative
+                    )
+
+    def on_speed_change(self):
+        scheduler = getattr(self, "turn_scheduler", None)
+        if scheduler:
+            scheduler.update_speed(self)
+
     def remove_all_status_effects(self):
+        # Undo what the effects changed while they were active, since their
+        # remove hooks will not run for them any more
+        for effect in self.status_effects:
+            effect.remove_stat_changes(self)
+        self.can_cast_spells = True
+        self.can_act = True
         self.status_effects = []
 
     def get_details_text(self):
@@ -130,7 +180,7 @@ class Character:
         slot = self._get_equipment_slot(item)
         if slot:
             if self.equipment[slot]:
-                self.equipment[slot].remove(self)
+                await self.equipment[slot].remove(self)
             self.equipment[slot] = item
             await item.apply(self)
         else:
@@ -139,7 +189,7 @@ class Character:
     async def unequip(self, slot: str):
         if slot in self.equipment and self.equipment[slot]:
             item = self.equipment[slot]
-            item.remove(self)
+            await item.remove(self)
             await print_event_text(f"{self.name} unequipped {item.name}.")
             self.equipment[slot] = None
         else:
@@ -202,6 +252,7 @@ class PlayerCharacter(Character):
         appearance: str = None,
         base_class: str = None,
         portrait: str = None,
+        stat_biases: Dict[str, int] = None,
     ):
         super().__init__(
             name,
@@ -210,6 +261,7 @@ class PlayerCharacter(Character):
             level,
             appearance=appearance,
             portrait=portrait,
+            stat_biases=stat_biases,
         )
         self.experience = 0
         self.exp_goal = calculate_xp_for_level(self.level + 1)
@@ -21,7 +21,33 @@ async def cutscene(
     conversation_length: str = "short",
     event_timing: str = "during_event",
 ):
-    narrative = get_llm().generate_cutscene(
+    narrative = generate_cutscene(
+        event,
+        location_name,
+        location_description,
+        scene_npcs,
+        past_events=past_events,
+        thematic_style=thematic_style,
+        conversation_length=conversation_length,
+        event_timing=event_timing,
+    )
+    return await run_cutscene(
+        narrative, location_name, location_description, background_image_url
+    )
+
+
+def generate_cutscene(
+    event: StoryEvent,
+    location_name: str,
+    location_description: str,
+    scene_npcs: List[str],
+    past_events: Optional[List[StoryEvent]] = None,
+    thematic_style: Optional[str] = None,
+    conversation_length: str = "short",
+    event_timing: str = "during_event",
+) -> dict:
+    """Write a cutscene without showing it, e.g. ahead of time in the background."""
+    return get_llm().generate_cutscene(
         event_description=event.event_text,
         characters=scene_npcs,
         location_name=location_name,
@@ -32,6 +58,14 @@ async def cutscene(
         conversation_length=conversation_length,
         event_timing=event_timing,
     )
+
+
+async def run_cutscene(
+    narrative: dict,
+    location_name: str,
+    location_description: str,
+    background_image_url: Optional[str] = None,
+):
     # check if any new npcs are in the narrative
     for scene in narrative["scene"]:
         if (
@@ -1,3 +1,6 @@
+from __future__ import annotations
+import copy
+from dataclasses import dataclass
 from src.core.character import Character
 from src.battle.elements import Element, deserialize_element, NONE, ELEMENT_LIST
 from src.core.spells import SpellManager
@@ -5,7 +8,12 @@ from src.battle.skills import EnemySpecial
 from src.api.llm import get_llm
 from src.core.party import Party
 from src.core.items import ItemManager
-import random
+from src.battle.skills import Skill
+from src.battle.stats import CharacterStats
+from src.core.items import Item
+from src.core.spells import Spell
+from src.utils.rng import get_rng
+from typing import Dict, List, Tuple
 
 
 class EnemyCharacter(Character):
@@ -19,22 +27,39 @@ class EnemyCharacter(Character):
         enemy_type: str = None,
         element: Element = NONE,
         portrait: str = None,
+        stat_biases: Dict[str, int] = None,
     ):
         super().__init__(
-            name, description, job_class, level, element, portrait=portrait
+            name,
+            description,
+            job_class,
+            level,
+            element=element,
+            portrait=portrait,
+            stat_biases=stat_biases,
         )
         base_currency = 10 * level
         base_exp = 100 * level
-        self.currency = random.randint(int(base_currency * 0.5), int(base_currency * 2))
-        self.experience = random.randint(int(base_exp * 0.5), int(base_exp * 2))
-        self.loot = loot
-        self.enemy_type = enemy_type
+        self._setup_rewards(
+            enemy_type,
+            get_rng().randint(int(base_currency * 0.5), int(base_currency * 2)),
+            get_rng().randint(int(base_exp * 0.5), int(base_exp * 2)),
+            loot,
+        )
         if self.enemy_type == "regular":
             self.stats.max_hp = int(self.stats.max_hp * 0.5)
             self.stats.hp = self.stats.max_hp
         else:
             self.experience *= 3
 
+    def _setup_rewards(
+        self, enemy_type: str, currency: int, experience: int, loot: List[Item]
+    ):
+        self.enemy_type = enemy_type
+        self.currency = currency
+        self.experience = experience
+        self.loot = loot
+
     def get_details_text(self):
         details = super().get_details_text()
         details += (
@@ -52,6 +77,78 @@ class EnemyCharacter(Character):
         return char_dict
 
 
+@dataclass(frozen=True)
+class EnemyPrototype:
+    """
+    The generated, unchanging part of an enemy type. Locations keep one
+    prototype per enemy type and spawn a fresh EnemyCharacter for every
+    encounter. Spawning skips Character.__init__ (and its LLM calls); spells
+    and skills are shared with the prototype, while each enemy gets fresh
+    stats and its own copy of the loot.
+    """
+
+    name: str
+    description: str
+    job_class: str
+    level: int
+    enemy_type: str
+    element: Element
+    portrait: str
+    stat_biases: Tuple[Tuple[str, int], ...]
+    base_stats: Tuple[Tuple[str, int], ...]
+    max_sp: int
+    currency: int
+    experience: int
+    spells: Tuple[Spell, ...]
+    skills: Tuple[Skill, ...]
+    loot: Tuple[Item, ...]
+
+    @classmethod
+    def from_enemy(cls, enemy: EnemyCharacter) -> EnemyPrototype:
+        return cls(
+            name=enemy.name,
+            description=enemy.description,
+            job_class=enemy.job_class,
+            level=enemy.level,
+            enemy_type=enemy.enemy_type,
+            element=enemy.element,
+            portrait=enemy.portrait,
+            stat_biases=tuple(enemy.stat_biases.items()),
+            base_stats=tuple(enemy.stats.base.items()),
+            max_sp=enemy.stats.max_sp,
+            currency=enemy.currency,
+            experience=enemy.experience,
+            spells=tuple(enemy.spells),
+            skills=tuple(enemy.skills),
+            loot=tuple(enemy.loot or ()),
+        )
+
+    def spawn(self) -> EnemyCharacter:
+        """A new enemy at full health, without running Character.__init__."""
+        enemy = EnemyCharacter.__new__(EnemyCharacter)
+        enemy._setup(
+            self.name,
+            self.description,
+            self.job_class,
+            self.level,
+            self.element,
+            self.portrait,
+            dict(self.stat_biases),
+            CharacterStats(**dict(self.base_stats), max_sp=self.max_sp),
+        )
+        # Spells and skills hold no per-enemy state and are shared; the loot
+        # is copied, since battles modify it (e.g. Steal takes items)
+        enemy.spells = list(self.spells)
+        enemy.skills = list(self.skills)
+        enemy._setup_rewards(
+            self.enemy_type,
+            self.currency,
+            self.experience,
+            [copy.copy(item) for item in self.loot],
+        )
+        return enemy
+
+
 def make_enemy(location_dict, level=1, is_boss=False, enemy_info=None, portrait=None):
     enemy_type = "boss" if is_boss else "regular"
     spell_manager = SpellManager()
@@ -63,10 +160,66 @@ def make_enemy(location_dict, level=1, is_boss=False, enemy_info=None, portrait=
         elements=ELEMENT_LIST,
         enemy_type=enemy_type,
     )
+    return build_enemy(generated_info, level, enemy_type, spell_manager, portrait)
+
+
+def make_enemy_roster(location_dict, enemy_infos: List[Dict]) -> List[EnemyCharacter]:
+    """
+    Generate the regular enemies of a location with a single LLM call.
+
+    enemy_infos holds the type ({"name", "description"}) and level of each
+    enemy. Entries are matched to the types by name, and the requested name
+    and description always win over the LLM's. Types the LLM leaves out or
+    gets wrong are generated one at a time with make_enemy instead.
+    """
+    spell_manager = SpellManager()
+    generated = get_llm().generate_enemy_roster(
+        enemies=[{**info["type"], "level": info["level"]} for info in enemy_infos],
+        location=location_dict,
+        spells=spell_manager.spell_list,
+        elements=ELEMENT_LIST,
+    )
+    entries = generated.get("enemies", []) if isinstance(generated, dict) else []
+    entries_by_name = {
+        entry["name"].strip().lower(): entry
+        for entry in entries
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str)
+    }
+
+    enemies = []
+    for info in enemy_infos:
+        entry = entries_by_name.get(info["type"]["name"].strip().lower())
+        if is_valid_enemy_info(entry):
+            entry = {**entry, **info["type"]}
+            enemies.append(build_enemy(entry, info["level"], "regular", spell_manager))
+        else:
+            print(f"Warning: Invalid roster entry for {info['type']['name']}")
+            enemies.append(
+                make_enemy(location_dict, info["level"], False, info["type"])
+            )
+    return enemies
+
+
+def is_valid_enemy_info(generated_info) -> bool:
+    if not isinstance(generated_info, dict):
+        return False
+    for key in ("job_class", "attack", "element"):
+        if not isinstance(generated_info.get(key), str) or not generated_info[key]:
+            return False
+    return isinstance(generated_info.get("spells"), list)
+
+
+def build_enemy(
+    generated_info: Dict,
+    level: int,
+    enemy_type: str,
+    spell_manager: SpellManager,
+    portrait=None,
+) -> EnemyCharacter:
     im = ItemManager()
     num_items = min(2, len(im.item_list))
     try:
-        selected_items = random.sample(im.item_list, num_items)
+        selected_items = get_rng().sample(im.item_list, num_items)
         items = [im.deserialize_item(item) for item in selected_items]
     except ValueError as e:
         items = []
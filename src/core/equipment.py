@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
 from src.battle.effects import StatusEffect
 from src.battle.elements import Element, NONE
 from src.battle.elements import ELEMENT_LIST, deserialize_element
@@ -46,19 +46,22 @@ class Equipment:
     element: Element = NONE
     portrait: str = None
 
+    @property
+    def modifier_source(self) -> str:
+        return f"equipment:{self.name}"
+
+    def stat_changes(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        return self.stat_modifiers, {}
+
     async def apply(self, character: Character):
-        for stat, value in self.stat_modifiers.items():
-            current_value = getattr(character.stats, stat)
-            setattr(character.stats, stat, current_value + value)
+        character.stats.set_modifiers(self.modifier_source, self.stat_modifiers)
 
         if self.status_effects:
             for effect in self.status_effects:
                 await character.add_status_effect(effect)
 
     async def remove(self, character: Character):
-        for stat, value in self.stat_modifiers.items():
-            current_value = getattr(character.stats, stat)
-            setattr(character.stats, stat, current_value - value)
+        character.stats.remove_modifiers(self.modifier_source)
 
         if self.status_effects:
             for effect in self.status_effects:
@@ -1,9 +1,8 @@
 from src.core.character import Character
 from src.core.spells import Spell
-from src.api.llm import get_llm
 from src.battle.effects import Poison, Sleep, Silence
-from src.game.response_manager import print_event_text
-from src.api.images import generate_item_portrait
+from src.battle.events import get_event_sink
+from src.api.images import generate_item_portrait, generate_spellbook_portrait
 from typing import Dict, Type, List
 
 
@@ -17,9 +16,8 @@ class Item:
         pass
 
     async def fancy_action_text(self, action_text):
-        fancy_text = get_llm().generate_action_text(action_text)
-        await print_event_text(
-            f"{self.name} used!", fancy_text, portrait_image_url=self.portrait
+        await get_event_sink().narrate(
+            f"{self.name} used!", action_text, portrait_image_url=self.portrait
         )
 
 
@@ -42,7 +40,7 @@ class SpellBook(Consumable):
         self.spell = spell
         name = f"Spellbook ({self.spell.name})"
         description = f"A spellbook containing instructions on how to cast the {self.spell.name} spell."
-        portrait = generate_item_portrait(name, description)
+        portrait = portrait or generate_spellbook_portrait(self.spell.name)
         super().__init__(name, description, tier, portrait)
 
     async def use(self, target: "Character"):
@@ -153,23 +151,31 @@ class ItemManager:
             self.initialized = True
 
     def initialize(self, item_set: Dict):
-        self.item_set = item_set
+        self.item_set = {}
         self.item_lookup = {}
-
-        for tier, items in self.item_set.items():
-            tier_num = int(tier.split("_")[1])
-            for item_type, item_info in items.items():
-                item_name = item_info["name"]
-                item_description = item_info["description"]
-                item_portrait = generate_item_portrait(item_name, item_description)
-                item_all = {
-                    "name": item_name,
-                    "description": item_description,
-                    "tier": tier_num,
-                    "item_type": item_type,
-                    "portrait": item_portrait,
-                }
-                self.item_lookup[item_name] = item_all
+        for tier, items in item_set.items():
+            self.add_tier(tier, items)
+
+    def add_tier(self, tier: str, items: Dict):
+        """
+        Register the items of one tier. Earlier tiers are left alone, so their
+        portraits aren't requested again. The new portraits are all queued
+        before any of them is needed and render in parallel.
+        """
+        self.item_set[tier] = items
+        tier_num = int(tier.split("_")[1])
+        for item_type, item_info in items.items():
+            item_name = item_info["name"]
+            item_description = item_info["description"]
+            item_portrait = generate_item_portrait(item_name, item_description)
+            item_all = {
+                "name": item_name,
+                "description": item_description,
+                "tier": tier_num,
+                "item_type": item_type,
+                "portrait": item_portrait,
+            }
+            self.item_lookup[item_name] = item_all
 
     def create_item_class(self, name, description, item_type, tier, portrait):
         if item_type == "healing":
@@ -1,13 +1,12 @@
 from __future__ import annotations
-from typing import List, Type, Dict, TYPE_CHECKING
+from typing import List, Type, Dict, Tuple, TYPE_CHECKING
 from src.battle.effects import (
     Sleep,
     StatusEffect,
 )
 import numpy as np
-from src.api.llm import get_llm
-from src.battle.elements import calculate_elemental_damage
-from src.game.response_manager import print_event_text
+from src.battle.events import get_event_sink
+from src.battle.combat_state import get_combat_state
 
 if TYPE_CHECKING:
     from src.core.character import Character
@@ -36,10 +35,9 @@ class Spell:
     async def fancy_text(
         self, action_text, caster: Character, target: Character = None
     ):
-        fancy_action_text = get_llm().generate_action_text(action_text)
-        await print_event_text(
+        await get_event_sink().narrate(
             f"{self.name} cast!",
-            fancy_action_text,
+            action_text,
             portrait_image_url=caster.portrait,
             npc_portrait_url=target.portrait,
             input_type="battle_message",
@@ -60,14 +58,16 @@ class ElementalSpell(Spell):
         self.element = element
         self.base_damage = base_damage
 
-    def calculate_damage(self, caster: Character, target: Character):
-        damage = self.base_damage * (caster.stats.intelligence / target.stats.wisdom)
-        damage = int(np.random.uniform(0.75, 1.25) * damage)
-        damage, explanation = calculate_elemental_damage(
-            damage, self.element, target.get_defense_element()
+    def calculate_damage(
+        self, caster: Character, targets: List[Character]
+    ) -> Tuple[np.ndarray, List[str]]:
+        """Deal this spell's damage to every target in one vectorized step."""
+        state = get_combat_state([caster, *targets])
+        rows = state.rows_of(targets)
+        damage, explanations = state.spell_damage(
+            caster, rows, self.base_damage, self.element
         )
-        true_damage = target.stats.hp_change(-damage)
-        return true_damage, explanation
+        return state.change_hp(rows, -damage), explanations
 
     async def _cast_effect(
         self, target: Character | List[Character], caster: Character
@@ -75,17 +75,20 @@ class ElementalSpell(Spell):
         targets = [target] if not isinstance(target, list) else target
         action_text = f"{caster.name} cast {self.name} ({self.description})!"
 
-        for target in targets:
-            if target.stats.alive:
-                true_damage, explanation = self.calculate_damage(caster, target)
+        alive_targets = [target for target in targets if target.stats.alive]
+        if alive_targets:
+            true_damage, explanations = self.calculate_damage(caster, alive_targets)
+            for target, damage, explanation in zip(
+                alive_targets, true_damage, explanations
+            ):
                 action_text += explanation
-                action_text += f" {target.name} took {abs(true_damage)} ({self.element}) damage from {self.name}"
+                action_text += f" {target.name} took {abs(damage)} ({self.element}) damage from {self.name}"
                 await target.remove_status_effect(Sleep(1))
                 if target.stats.hp == 0:
                     action_text += f" and was defeated!"
                 action_text += "\n"
 
-        await self.fancy_text(action_text.strip(), caster, target)
+        await self.fancy_text(action_text.strip(), caster, targets[-1])
 
 
 class HealingSpell(Spell):
@@ -108,16 +111,22 @@ class HealingSpell(Spell):
         targets = [target] if not isinstance(target, list) else target
         action_text = f"{caster.name} cast {self.name}!"
 
+        living = [target for target in targets if target.stats.hp > 0]
+        healed = {}
+        if living:
+            state = get_combat_state(living)
+            rows = state.rows_of(living)
+            true_heal = state.change_hp(rows, np.full(rows.size, self.heal_amount))
+            healed = dict(zip(living, true_heal))
+
         for target in targets:
-            if target.stats.hp == 0:
-                if self.revive:
-                    target.stats.hp = 1
-                    action_text += f" {target.name} was revived with 1 HP."
-                else:
-                    action_text += f" {target.name} is dead and cannot be healed."
+            if target in healed:
+                action_text += f" {target.name} healed for {abs(healed[target])} HP."
+            elif self.revive:
+                target.stats.hp = 1
+                action_text += f" {target.name} was revived with 1 HP."
             else:
-                true_heal = target.stats.hp_change(self.heal_amount)
-                action_text += f" {target.name} healed for {abs(true_heal)} HP."
+                action_text += f" {target.name} is dead and cannot be healed."
 
         await self.fancy_text(action_text.strip(), caster, target)
 
@@ -163,24 +172,28 @@ class SpellManager:
             self.initialized = True
 
     def initialize(self, spell_set: Dict):
-        self.spell_set = spell_set
+        self.spell_set = {}
         self.spell_lookup = {}
-
-        for tier, spells in self.spell_set.items():
-            tier_num = int(tier.split("_")[1])
-            for spell_type, spell_list in spells.items():
-                for spell in spell_list:
-                    spell_name = spell["name"]
-                    spell_description = spell["description"]
-                    spell_all = {
-                        "name": spell_name,
-                        "description": spell_description,
-                        "tier": tier_num,
-                        "spell_type": spell_type,
-                        "element": spell.get("element"),
-                        "effect": spell.get("effect"),
-                    }
-                    self.spell_lookup[spell_name] = spell_all
+        for tier, spells in spell_set.items():
+            self.add_tier(tier, spells)
+
+    def add_tier(self, tier: str, spells: Dict):
+        """Register the spells of one tier, leaving earlier tiers alone."""
+        self.spell_set[tier] = spells
+        tier_num = int(tier.split("_")[1])
+        for spell_type, spell_list in spells.items():
+            for spell in spell_list:
+                spell_name = spell["name"]
+                spell_description = spell["description"]
+                spell_all = {
+                    "name": spell_name,
+                    "description": spell_description,
+                    "tier": tier_num,
+                    "spell_type": spell_type,
+                    "element": spell.get("element"),
+                    "effect": spell.get("effect"),
+                }
+                self.spell_lookup[spell_name] = spell_all
 
     def create_spell_class(
         self,
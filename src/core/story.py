@@ -1,10 +1,12 @@
+import asyncio
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 from enum import Enum
 from src.game.response_manager import print_event_text
 from src.api.llm import get_llm
 from src.npc.cast import get_cast
-from src.core.cutscene import cutscene
+from src.core.cutscene import cutscene, generate_cutscene, run_cutscene
+from src.utils.background import submit
 from src.core.party import Party
 
 
@@ -218,6 +220,7 @@ class StoryManager:
             trigger_type == TriggerType.ALLY.value
             or trigger_type == TriggerType.BOSS.value
         ):
+            after_event = None
             if trigger_npc_obj and trigger_npc_obj.type == "ally":
                 result = await trigger_npc_obj.recruit(player_party, dialogue)
                 if result == "recruit_success":
@@ -225,6 +228,18 @@ class StoryManager:
                 elif result == "recruit_failure":
                     return
             elif trigger_npc_obj and trigger_npc_obj.type == "boss":
+                # The closing scene only depends on the boss being beaten, so
+                # it is written while the battle is fought. A loss or a retreat
+                # wastes that one call, which is cheaper than making every
+                # victory wait for it
+                after_event = submit(
+                    self._generate_after_event,
+                    event,
+                    location_name,
+                    location_description,
+                    scene_npcs,
+                    self.past_events + [StoryEvent(**trigger_npc_obj.defeat_event())],
+                )
                 result = await trigger_npc_obj.confront(player_party, False)
                 if result == "victory":
                     pass
@@ -233,21 +248,46 @@ class StoryManager:
                 elif result == "ran":
                     return
 
-            dialogue = await cutscene(
-                event,
-                location_name,
-                location_description,
-                scene_npcs,
-                background_image_url,
-                past_events=self.past_events,
-                thematic_style=self.thematic_style,
-                event_timing="after_event",
-                conversation_length="short",
+            narrative = None
+            if after_event is not None:
+                try:
+                    narrative = await asyncio.wrap_future(after_event)
+                except Exception as e:
+                    print(f"Warning: Background cutscene generation failed: {str(e)}")
+            if narrative is None:
+                narrative = self._generate_after_event(
+                    event,
+                    location_name,
+                    location_description,
+                    scene_npcs,
+                    self.past_events,
+                )
+            dialogue = await run_cutscene(
+                narrative, location_name, location_description, background_image_url
             )
 
         event.completed = True
         self.past_events.append(self.future_events.pop(0))
 
+    def _generate_after_event(
+        self,
+        event: StoryEvent,
+        location_name: str,
+        location_description: str,
+        scene_npcs: List[str],
+        past_events: List[StoryEvent],
+    ) -> dict:
+        return generate_cutscene(
+            event,
+            location_name,
+            location_description,
+            scene_npcs,
+            past_events=past_events,
+            thematic_style=self.thematic_style,
+            event_timing="after_event",
+            conversation_length="short",
+        )
+
     async def get_story_so_far(self) -> None:
         """Generate and display a summary of the story so far."""
         current_event_count = len(self.past_events)
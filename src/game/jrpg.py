@@ -1,5 +1,6 @@
 from src.game.response_manager import ResponseManager, choose_option
 from src.api.llm import get_llm
+from src.api.images import ImageStore
 from src.travel.world import World
 from src.game.seeding import collect_seed_answers, PROTAGONIST_QUESTIONS
 from src.core.spells import SpellManager
@@ -11,8 +12,11 @@ from src.game.save_manager import SaveManager
 from src.game.response_manager import print_event_text
 from src.core.character import equip_starter_gear
 from src.game.menu_manager import MenuManager
+from src.utils.rng import get_rng, seed_session
+from src.utils.utils import load_config
+import logging
 
-import random
+logger = logging.getLogger(__name__)
 
 
 class JRPG:
@@ -29,11 +33,21 @@ class JRPG:
         self.save_manager: SaveManager = SaveManager()
         self.menu_manager: MenuManager = MenuManager(self)
         self.title_screen_image = "./images/menu.png"
+        self.seed = None
 
     async def run_game(self):
         await self.menu_manager.show_main_menu()
 
+    def _seed_rng(self) -> None:
+        """
+        Seed the session RNG with the configured seed, or a fresh one. The seed
+        is kept in the save file, so the run can be replayed by configuring it.
+        """
+        self.seed = seed_session(load_config().get("seed")).seed
+        logger.info("Session seed: %s", self.seed)
+
     async def new_game(self):
+        self._seed_rng()
         self.cast.clear()
         game_data = await self._generate_game_data()
         await self._initialize_game_systems(game_data)
@@ -51,7 +65,7 @@ class JRPG:
         )
         possible_personalities = PROTAGONIST_QUESTIONS[1]["answers"]
         possible_personalities.remove(protagonist["chosen_class"])
-        random.shuffle(possible_personalities)
+        get_rng().shuffle(possible_personalities)
         story = get_llm().generate_story(
             setting,
             protagonist,
@@ -63,6 +77,7 @@ class JRPG:
 
     async def _initialize_game_systems(self, game_data):
         self.title = game_data["story"]["title"]
+        ImageStore().set_dream(self.title)
         self.brief_overview = game_data["story"]["brief_overview"]
         self.chapter_overviews = game_data["story"]["chapters"]
 
@@ -181,11 +196,8 @@ class JRPG:
             existing_item_names,
         )
 
-        self.spell_manager.spell_set[f"tier_{chapter_tier}"] = new_spell_data
-        self.item_manager.item_set[f"tier_{chapter_tier}"] = new_item_data
-
-        self.spell_manager.initialize(self.spell_manager.spell_set)
-        self.item_manager.initialize(self.item_manager.item_set)
+        self.spell_manager.add_tier(f"tier_{chapter_tier}", new_spell_data)
+        self.item_manager.add_tier(f"tier_{chapter_tier}", new_item_data)
 
     async def _setup_next_chapter(self):
         # Generate chapter data
@@ -269,6 +281,7 @@ class JRPG:
             "brief_overview": getattr(self, "brief_overview", None),
             "current_chapter": self.party.story_manager.current_chapter,
             "total_chapters": self.party.story_manager.total_chapters,
+            "seed": self.seed,
         }
         return self.save_manager.save_game_state(game_state, directory)
 
@@ -293,5 +306,7 @@ class JRPG:
 
         for key in required_keys:
             setattr(self, key, game_state[key])
+        ImageStore().set_dream(self.title)
+        self._seed_rng()
 
         self.chapter_overviews = game_state.get("chapter_overviews")
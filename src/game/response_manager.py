@@ -1,6 +1,13 @@
 from typing import Callable, List, Dict, Any, TYPE_CHECKING, Optional
 from dataclasses import dataclass, field
 import asyncio
+from src.api.images import (
+    IMAGE_VARIANTS,
+    add_image_listener,
+    image_placeholder,
+    prioritize_images,
+    variant_url,
+)
 
 if TYPE_CHECKING:
     from src.core.player_party import PlayerParty
@@ -28,31 +35,80 @@ class GameResponse:
     option_portraits: List[str] = field(default_factory=list)
     movement_text: Dict[str, str] = field(default_factory=dict)
 
+    def image_urls(self) -> List[str]:
+        urls = [
+            self.background_image_url,
+            self.portrait_image_url,
+            self.npc_portrait_url,
+            self.player_portrait_url,
+            *self.option_portraits,
+        ]
+        for party in (self.player_party, self.enemy_party):
+            if party:
+                urls.extend(char.portrait for char in party.characters)
+        return urls
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        response = {
             "input_type": self.input_type,
             "menu_options": self.menu_options,
             "option_details": self.option_details,
             "main_text": self.main_text,
             "sub_text": self.sub_text,
-            "player_party": (
-                self.player_party.to_dict() if self.player_party else {"characters": []}
-            ),
-            "enemy_party": (
-                self.enemy_party.to_dict() if self.enemy_party else {"characters": []}
-            ),
-            "background_image_url": self.background_image_url,
-            "portrait_image_url": self.portrait_image_url,
+            "player_party": self._party_dict(self.player_party),
+            "enemy_party": self._party_dict(self.enemy_party),
+            "background_image_url": variant_url(self.background_image_url, "full"),
+            "portrait_image_url": variant_url(self.portrait_image_url, "medium"),
             "npc_text": self.npc_text,
             "player_text": self.player_text,
-            "npc_portrait_url": self.npc_portrait_url,
-            "player_portrait_url": self.player_portrait_url,
-            "turn_order": [char.to_dict() for char in self.turn_order],
+            "npc_portrait_url": variant_url(self.npc_portrait_url, "medium"),
+            "player_portrait_url": variant_url(self.player_portrait_url, "medium"),
+            "turn_order": [
+                self._with_thumbnail(char.to_dict()) for char in self.turn_order
+            ],
             "character_info": self.character_info,
             "travel_position": self.travel_position,
-            "option_portraits": self.option_portraits,
+            "option_portraits": [
+                variant_url(url, "thumb") for url in self.option_portraits
+            ],
             "movement_text": self.movement_text,
         }
+        response["image_placeholders"] = self._placeholders(response)
+        return response
+
+    @staticmethod
+    def _placeholders(response: Dict[str, Any]) -> Dict[str, str]:
+        """Inline previews of the response's images, keyed by the URL sent."""
+        urls = [
+            response["background_image_url"],
+            response["portrait_image_url"],
+            response["npc_portrait_url"],
+            response["player_portrait_url"],
+            *response["option_portraits"],
+        ]
+        for party in (response["player_party"], response["enemy_party"]):
+            urls.extend(char.get("portrait") for char in party["characters"])
+        urls.extend(char.get("portrait") for char in response["turn_order"])
+        placeholders = {}
+        for url in urls:
+            placeholder = image_placeholder(url)
+            if placeholder:
+                placeholders[url] = placeholder
+        return placeholders
+
+    @classmethod
+    def _party_dict(cls, party) -> Dict[str, Any]:
+        if not party:
+            return {"characters": []}
+        party_dict = party.to_dict()
+        for char in party_dict["characters"]:
+            cls._with_thumbnail(char)
+        return party_dict
+
+    @staticmethod
+    def _with_thumbnail(char: Dict[str, Any]) -> Dict[str, Any]:
+        char["portrait"] = variant_url(char.get("portrait"), "thumb")
+        return char
 
 
 @dataclass
@@ -73,11 +129,31 @@ class ResponseManager:
         self.game_response = None
         self.player_response = None
         self.websocket = None
+        self.loop = None
         self.response_event = asyncio.Event()
         self.cached_background_image = None
+        add_image_listener(self.send_image_ready)
 
     def set_websocket(self, websocket):
         self.websocket = websocket
+        self.loop = asyncio.get_running_loop()
+
+    def send_image_ready(self, url: str):
+        """Tell the client an image URL it may already show now has a file behind it."""
+        # Called from the image worker threads
+        if self.websocket and self.loop:
+            asyncio.run_coroutine_threadsafe(
+                self.websocket.send_json(
+                    {
+                        "type": "image_ready",
+                        "url": url,
+                        "variants": [
+                            variant_url(url, variant) for variant in IMAGE_VARIANTS
+                        ],
+                    }
+                ),
+                self.loop,
+            )
 
     def set_game_response(self, **kwargs):
         if kwargs.get("background_image_url"):
@@ -85,6 +161,7 @@ class ResponseManager:
         else:
             kwargs["background_image_url"] = self.cached_background_image
         self.game_response = GameResponse(**kwargs)
+        prioritize_images(self.game_response.image_urls())
 
     def set_menu_options(self, menu_options: List[str]):
         self.game_response.menu_options = menu_options
@@ -110,6 +187,15 @@ class ResponseManager:
         self.player_response = None
         return response
 
+    def poll_player_response(self) -> Optional[str]:
+        """Take a response sent while nothing was waiting for one, if any."""
+        if not self.response_event.is_set():
+            return None
+        self.response_event.clear()
+        response = self.player_response.response
+        self.player_response = None
+        return response
+
 
 async def choose_option(
     choices: List[Any],
@@ -233,3 +319,36 @@ async def print_battle_menu(
     )
     rm.send_game_response()
     return await rm.get_player_response()
+
+
+async def print_battle_round(
+    player_party,
+    enemy_party,
+    title: str,
+    round_log: str,
+    options: List[str],
+    background_image_url: str = None,
+    wait: bool = True,
+):
+    """
+    Show the log of an auto-battle round. Without wait the round is only
+    streamed to the client; a button pressed meanwhile is picked up later
+    with poll_player_response.
+    """
+    rm = ResponseManager()
+    rm.set_game_response(
+        main_text=title,
+        sub_text=round_log,
+        player_party=player_party,
+        enemy_party=enemy_party,
+        input_type="battle_round",
+        menu_options=options,
+        background_image_url=background_image_url,
+    )
+    rm.send_game_response()
+    if wait:
+        return await rm.get_player_response()
+
+
+def poll_player_response() -> Optional[str]:
+    return ResponseManager().poll_player_response()
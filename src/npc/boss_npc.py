@@ -1,8 +1,11 @@
+from concurrent.futures import Future
+from typing import Optional
 from src.npc.npc import NPC
-from src.core.enemies import make_enemy, EnemyParty
+from src.core.enemies import make_enemy, EnemyParty, EnemyPrototype
 from src.battle.battle import Battle
 from src.game.response_manager import print_event_text
 from src.battle.effects import Intimidated
+from src.utils.background import submit
 
 
 class BossNPC(NPC):
@@ -15,19 +18,58 @@ class BossNPC(NPC):
             story_level=story_level + 5,
         )
         self.defeated = False
+        self.prototype: Optional[EnemyPrototype] = None
+        self.pending_prototype: Optional[Future] = None
 
-    async def confront(self, party, intimidated: bool = False):
-        boss_enemy = make_enemy(
-            location_dict={
-                "name": self.current_location,
-                "description": "",
-            },
-            level=self.story_level,
-            is_boss=True,
-            enemy_info={"name": self.name, "description": self.description},
-            portrait=self.portrait,
+    def prepare(self) -> None:
+        """
+        Build the boss in the background so the confrontation doesn't wait on
+        it. Called when the party enters the boss's location.
+        """
+        if self.prototype is None and self.pending_prototype is None:
+            if not self.defeated:
+                self.pending_prototype = submit(self._generate_prototype)
+
+    def _generate_prototype(self) -> EnemyPrototype:
+        return EnemyPrototype.from_enemy(
+            make_enemy(
+                location_dict={
+                    "name": self.current_location,
+                    "description": "",
+                },
+                level=self.story_level,
+                is_boss=True,
+                enemy_info={"name": self.name, "description": self.description},
+                portrait=self.portrait,
+            )
         )
 
+    def _collect_prototype(self, wait: bool = True) -> None:
+        future = self.pending_prototype
+        if future is None or not (wait or future.done()):
+            return
+        self.pending_prototype = None
+        try:
+            self.prototype = future.result()
+        except Exception as e:
+            print(f"Warning: Background boss generation failed: {str(e)}")
+
+    def get_prototype(self) -> EnemyPrototype:
+        self._collect_prototype()
+        if self.prototype is None:
+            self.prototype = self._generate_prototype()
+        return self.prototype
+
+    def defeat_event(self) -> dict:
+        return {
+            "location": self.current_location,
+            "event_text": f"{self.name} has been defeated!",
+            "trigger": {"type": "boss_defeated", "value": self.name},
+        }
+
+    async def confront(self, party, intimidated: bool = False):
+        boss_enemy = self.get_prototype().spawn()
+
         if intimidated:
             await Intimidated().apply(boss_enemy)
 
@@ -47,13 +89,7 @@ class BossNPC(NPC):
 
     async def confront_success(self, party):
         self.defeated = True
-
-        event_info = {
-            "location": self.current_location,
-            "event_text": f"{self.name} has been defeated!",
-            "trigger": {"type": "boss_defeated", "value": self.name},
-        }
-        party.story_manager.add_past_event(event_info)
+        party.story_manager.add_past_event(self.defeat_event())
         return "victory"
 
     async def confront_failure(self, party):
@@ -63,3 +99,14 @@ class BossNPC(NPC):
             portrait_image_url=self.portrait,
         )
         return "defeated"
+
+    def __getstate__(self):
+        self._collect_prototype(wait=False)
+        state = self.__dict__.copy()
+        state["pending_prototype"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault("prototype", None)
+        self.pending_prototype = None
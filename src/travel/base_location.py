@@ -1,20 +1,36 @@
 from abc import ABC, abstractmethod
 from src.core.player_party import PlayerParty
 from src.battle.battle import Battle
-from src.core.enemies import make_enemy, EnemyParty
-import numpy as np
-import copy
+from src.core.enemies import (
+    make_enemy,
+    make_enemy_roster,
+    EnemyCharacter,
+    EnemyParty,
+    EnemyPrototype,
+)
 from typing import Dict, Tuple, List, Optional, Any
+from collections import Counter
+from concurrent.futures import Future
 from src.travel.menu_handler import MenuHandler
-from src.api.images import generate_background_image, generate_landmark_image
+from src.api.images import (
+    NEXT_SCREEN,
+    cancel_image_group,
+    generate_background_image,
+    generate_landmark_image,
+    image_group,
+    prioritize_image_group,
+)
 from src.travel.location_grid import LocationGrid, GridNode
 from src.api.llm import get_llm
 from src.game.response_manager import print_event_text
-import random
 from src.core.items import ItemManager
 from src.npc.cast import get_cast
+from src.npc.boss_npc import BossNPC
 from src.core.cutscene import cutscene
 from src.core.story import StoryEvent
+from src.utils.rng import get_rng
+from src.utils.background import submit
+from src.battle.battle_log import BattleLog
 
 
 class Location(ABC):
@@ -32,7 +48,11 @@ class Location(ABC):
         self.party: PlayerParty = party
         self.story_level = story_level
         self.enemy_types = []
-        self.enemy_cache = {}  # New: cache for generated enemies
+        self.enemy_cache: Dict[frozenset, EnemyPrototype] = {}
+        # Battle intros by encounter (see get_encounter_key), with the names
+        # of the party members they were written for
+        self.encounter_intros: Dict[frozenset, Tuple[Tuple[str, ...], str]] = {}
+        self.pending_encounters: Dict[frozenset, Future] = {}
         self.menu_handler: Optional[MenuHandler] = None
         self.grid = LocationGrid()
         self.nav_text_cache = {}  # Cache for navigation text
@@ -41,9 +61,10 @@ class Location(ABC):
         self.unlock_exit = False
 
         # Generate background images for main location and sub-locations
-        self.background_image_url = generate_background_image(
-            self.name, self.description
-        )
+        with image_group(self.name):
+            self.background_image_url = generate_background_image(
+                self.name, self.description
+            )
 
     async def move(self, direction: str):
         """Handle movement and potential location transitions"""
@@ -88,7 +109,7 @@ class Location(ABC):
 
     async def open_treasure(self):
         item_manager = ItemManager()
-        item_name = random.choice(item_manager.item_list)
+        item_name = get_rng().choice(item_manager.item_list)
         item = item_manager.deserialize_item(item_name)
         self.party.inventory.append(item)
         base_text = f"The party of {self.party.list_names} open a treasure chest. Inside they find: {item.name} ({item.description})"
@@ -139,7 +160,7 @@ class Location(ABC):
 
         # Randomly select num_enemies coordinates
         if open_coords:
-            selected_coords = random.sample(
+            selected_coords = get_rng().sample(
                 open_coords, min(num_enemies, len(open_coords))
             )
 
@@ -178,9 +199,22 @@ class Location(ABC):
         pass
 
     async def visit(self, party):
+        # Images of this location (shops, items, NPCs) are rendered ahead of
+        # other locations' while the party is here, and set aside once it leaves
+        prioritize_image_group(self.name, NEXT_SCREEN)
+        try:
+            with image_group(self.name, NEXT_SCREEN):
+                return await self._visit(party)
+        finally:
+            cancel_image_group(self.name)
+
+    async def _visit(self, party):
         if not self.visited:
             self.visited = True
         self.party = party
+        # Saves don't keep background work, so resume it on arrival
+        self.prepare_encounters()
+        self.prepare_bosses()
 
         # check if there are any events to trigger
         event_triggered = await self.party.story_manager.check_location_trigger(
@@ -283,9 +317,9 @@ class Location(ABC):
 
     def generate_enemy_info(self, enemy_type: Dict) -> Dict:
         if self.type == "field":
-            enemy_lvl = random.randint(self.story_level - 4, self.story_level + 1)
+            enemy_lvl = get_rng().randint(self.story_level - 4, self.story_level + 1)
         else:
-            enemy_lvl = random.randint(self.story_level - 3, self.story_level + 2)
+            enemy_lvl = get_rng().randint(self.story_level - 3, self.story_level + 2)
         return {
             "type": enemy_type,
             "level": enemy_lvl,
@@ -295,31 +329,115 @@ class Location(ABC):
         """Create a hashable key from the enemy type dictionary"""
         return frozenset(enemy_type.items())
 
+    def get_encounter_key(self, enemy_types: List[Dict]) -> frozenset:
+        """Create a hashable key from the enemy types of an encounter and their counts"""
+        return frozenset(
+            Counter(self.get_enemy_key(enemy_type) for enemy_type in enemy_types).items()
+        )
+
+    @property
+    def encounter_context(self) -> str:
+        return f"Battle type: ambush; Location: {self.name} ({self.description})"
+
+    def prepare_bosses(self):
+        """Start building the bosses waiting in this location in the background."""
+        # Location names carry the side, e.g. " (West)"; NPC locations don't
+        for npc in get_cast().get_npcs_by_location(self.name.split(" (")[0]):
+            if isinstance(npc, BossNPC):
+                npc.prepare()
+
+    def prepare_encounters(self):
+        """
+        Generate the prototype of every enemy type in the background, along
+        with the battle intro of an encounter with a single enemy of that
+        type, so the first encounter with each doesn't wait on the LLM and the
+        image model. All missing enemy types share one roster call.
+        """
+        party = list(self.party.characters) if self.party else []
+        missing = [
+            enemy_type
+            for enemy_type in self.enemy_types
+            if self.get_enemy_key(enemy_type) not in self.enemy_cache
+            and self.get_enemy_key(enemy_type) not in self.pending_encounters
+        ]
+        if not missing:
+            return
+        # The roster is queued before the intros that wait on it, so it is
+        # always running by the time they do
+        roster = submit(self._generate_roster, missing)
+        for index, enemy_type in enumerate(missing):
+            self.pending_encounters[self.get_enemy_key(enemy_type)] = submit(
+                self._generate_encounter, roster, index, party
+            )
+
+    def _generate_roster(self, enemy_types: List[Dict]) -> List[EnemyPrototype]:
+        enemy_infos = [
+            self.generate_enemy_info(enemy_type) for enemy_type in enemy_types
+        ]
+        return [
+            EnemyPrototype.from_enemy(enemy)
+            for enemy in make_enemy_roster(self.basic_info, enemy_infos)
+        ]
+
+    def _generate_encounter(
+        self, roster: Future, index: int, party: List
+    ) -> Tuple[EnemyPrototype, Tuple[Tuple[str, ...], str]]:
+        prototype = roster.result()[index]
+        intro_text = get_llm().generate_action_text(
+            BattleLog.start_event("ambush", self.encounter_context, party, [prototype])
+        )
+        return prototype, (tuple(char.name for char in party), intro_text)
+
+    def _generate_prototype(self, enemy_type: Dict) -> EnemyPrototype:
+        enemy_info = self.generate_enemy_info(enemy_type)
+        return EnemyPrototype.from_enemy(
+            make_enemy(self.basic_info, enemy_info["level"], False, enemy_type)
+        )
+
+    def _collect_encounter(self, enemy_key: frozenset, wait: bool = True) -> None:
+        """Move a finished background generation into the caches."""
+        future = self.pending_encounters.get(enemy_key)
+        if future is None or not (wait or future.done()):
+            return
+        del self.pending_encounters[enemy_key]
+        try:
+            prototype, intro = future.result()
+        except Exception as e:
+            print(f"Warning: Background enemy generation failed: {str(e)}")
+            return
+        self.enemy_cache[enemy_key] = prototype
+        self.encounter_intros[frozenset({(enemy_key, 1)})] = intro
+
+    def get_encounter_intro(self, enemy_types: List[Dict]) -> Optional[str]:
+        """The pre-generated intro of exactly this encounter and party, if any."""
+        intro = self.encounter_intros.get(self.get_encounter_key(enemy_types))
+        party = tuple(char.name for char in self.party.characters)
+        if intro is None or intro[0] != party:
+            return None
+        return intro[1]
+
     def get_or_create_enemy(self, enemy_type: Dict):
         enemy_key = self.get_enemy_key(enemy_type)
+        self._collect_encounter(enemy_key)
         if enemy_key not in self.enemy_cache:
-            enemy_info = self.generate_enemy_info(enemy_type)
-            self.enemy_cache[enemy_key] = make_enemy(
-                self.basic_info, enemy_info["level"], False, enemy_type
-            )
-        return copy.deepcopy(self.enemy_cache[enemy_key])
+            self.enemy_cache[enemy_key] = self._generate_prototype(enemy_type)
+        return self.enemy_cache[enemy_key].spawn()
 
     async def random_encounter(self):
         if self.type == "field":
-            num_enemies = np.random.randint(1, 3)
+            num_enemies = get_rng().randint(1, 2)
         else:
-            num_enemies = np.random.randint(1, 4)
-        enemies = [
-            self.get_or_create_enemy(np.random.choice(self.enemy_types))
-            for _ in range(num_enemies)
-        ]
+            num_enemies = get_rng().randint(1, 3)
+        enemy_types = [get_rng().choice(self.enemy_types) for _ in range(num_enemies)]
+        enemies = [self.get_or_create_enemy(enemy_type) for enemy_type in enemy_types]
         enemy_party = EnemyParty(enemies)
-        context = f"Battle type: ambush; Location: {self.name} ({self.description})"
         result = await Battle(
             self.party,
             enemy_party,
             background_image_url=self.background_image_url,
-            context=context,
+            context=self.encounter_context,
+            fast_forward=True,
+            intro_text=self.get_encounter_intro(enemy_types),
         ).start()
         if result == "party_defeated":
             return "game_over"
@@ -330,13 +448,33 @@ class Location(ABC):
             pass
 
     def __getstate__(self):
+        # Keep whatever background generation has already finished
+        for enemy_key in list(self.pending_encounters):
+            self._collect_encounter(enemy_key, wait=False)
         state = self.__dict__.copy()
         state["party"] = None  # Don't pickle the party reference
+        state["pending_encounters"] = {}
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
         # The party will need to be re-assigned after unpickling
+        # Intros of older saves don't record their encounter or party
+        self.encounter_intros = {
+            key: intro
+            for key, intro in self.__dict__.get("encounter_intros", {}).items()
+            if isinstance(intro, tuple)
+        }
+        self.__dict__.setdefault("pending_encounters", {})
+        # Older saves cached whole enemies instead of prototypes
+        self.enemy_cache = {
+            key: (
+                EnemyPrototype.from_enemy(enemy)
+                if isinstance(enemy, EnemyCharacter)
+                else enemy
+            )
+            for key, enemy in self.enemy_cache.items()
+        }
 
     def _get_points_of_interest(self):
         """Get all points of interest in the grid"""
@@ -360,7 +498,7 @@ class Location(ABC):
         open_coords = self._get_available_coordinates()
 
         if open_coords:
-            selected_coords = random.sample(
+            selected_coords = get_rng().sample(
                 open_coords, min(num_nodes, len(open_coords))
             )
 
@@ -386,7 +524,7 @@ class Location(ABC):
 
         for npc in location_npcs:
             # Place boss at exit (1, 0), others at random spots
-            coords = (1, 0) if npc.type == "boss" else random.choice(open_coords)
+            coords = (1, 0) if npc.type == "boss" else get_rng().choice(open_coords)
 
             self.grid.add_node(
                 pos=coords,
@@ -13,6 +13,7 @@ class FieldLocation(Location):
         super().__init__(data, party, story_level)
         self.enemy_types = data["enemy_types"]
         self.menu_handler = MenuHandler(self)
+        self.prepare_encounters()
 
     def _setup_specific_nodes(self):
         self._add_enemy_nodes(self.num_enemies)
@@ -8,7 +8,7 @@ from src.core.equipment import make_weapon, make_armor, make_accessory
 from src.api.llm import get_llm
 from src.game.response_manager import choose_option
 from src.game.response_manager import print_event_text
-from src.api.images import generate_item_portrait, generate_shop_image
+from src.api.images import generate_shop_image, generate_spellbook_portrait
 import random
 from src.npc.cast import get_cast
 from src.npc.conversation import Conversation
@@ -202,7 +202,7 @@ class SpellShop(Shop):
     async def give_item(self, party: PlayerParty, item: Dict[str, Any]):
         spell_manager = SpellManager()
         spell = spell_manager.deserialize_spell(item["name"])
-        spellbook = SpellBook(spell)
+        spellbook = SpellBook(spell, portrait=item["portrait"])
         party.inventory.append(spellbook)
 
 
@@ -363,10 +363,7 @@ def make_spell_shop(
             "name": spell["name"],
             "price": spell["price"],
             "description": f"A spellbook which teaches {spell['name']}. \n\n{spell_manager.get_spell_description(spell['name'])}",
-            "portrait": generate_item_portrait(
-                spell["name"],
-                f"A magical spell book which teaches the spell: {spell['name']}.",
-            ),
+            "portrait": generate_spellbook_portrait(spell["name"]),
         }
         for spell in llm_shop_info["spells"]
     ]
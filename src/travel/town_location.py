@@ -4,7 +4,7 @@ from src.travel.inn import make_inn
 from src.travel.shop import make_item_shop, make_spell_shop, make_equipment_shop
 from src.travel.base_location import Location
 from typing import Dict
-import random
+from src.utils.rng import get_rng
 
 
 class TownLocation(Location):
@@ -58,6 +58,6 @@ class TownLocation(Location):
         """Add town-specific nodes to the grid"""
         if self.part == "A":
             coords = [(0, 0), (0, 2), (2, 0), (2, 2)]
-            random.shuffle(coords)
+            get_rng().shuffle(coords)
             for shop_type in ["inn", "item_shop", "spell_shop", "equipment_shop"]:
                 self._add_node(shop_type, self._data.get(shop_type), coords.pop(0))
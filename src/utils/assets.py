@@ -0,0 +1,168 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json")
+
+
+@dataclass
+class Asset:
+    body: bytes
+    media_type: str
+    digest: str
+    gzip: Optional[bytes] = None
+    br: Optional[bytes] = None
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str) -> "Asset":
+        asset = cls(body, media_type, hashlib.sha256(body).hexdigest()[:12])
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                asset.gzip = compressed
+            if brotli is not None:
+                compressed = brotli.compress(body, quality=11)
+                if len(compressed) < len(body):
+                    asset.br = compressed
+        return asset
+
+    def response(self, request: Request, cache_control: str) -> Response:
+        """
+        The best encoding the client accepts, or 304 when its cached copy
+        (sent back as If-None-Match) is still current.
+        """
+        accepted = accepted_encodings(request.headers.get("accept-encoding", ""))
+        encoding, body = None, self.body
+        if self.br is not None and "br" in accepted:
+            encoding, body = "br", self.br
+        elif self.gzip is not None and "gzip" in accepted:
+            encoding, body = "gzip", self.gzip
+
+        # Each encoding is a different representation, so it needs its own tag
+        etag = f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if self.gzip is not None or self.br is not None:
+            headers["Vary"] = "Accept-Encoding"
+        if_none_match = request.headers.get("if-none-match", "")
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(body, media_type=self.media_type, headers=headers)
+
+
+def accepted_encodings(header: str) -> Set[str]:
+    encodings = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if name and (not params or quality.strip() not in ("0", "0.0", "0.00")):
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+class FrontendAssets:
+    """
+    The frontend files under content-hashed URLs (e.g. /assets/game.1a2b3c.js)
+    that browsers may cache forever, with gzip and brotli copies built once.
+
+    Only index.html has to be revalidated: it loads game.js by its hashed URL
+    and carries an import map sending the modules' plain imports to their
+    hashed URLs, so editing one module only changes that module's URL. The
+    files are rebuilt when one of them changes on disk.
+    """
+
+    def __init__(self, directory: str = "frontend", prefix: str = "/assets"):
+        self.directory = directory
+        self.prefix = prefix
+        self.assets: Dict[str, Asset] = {}
+        self.hashed: Dict[str, str] = {}
+        self.index: Optional[Asset] = None
+        self.mtimes: Dict[str, float] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        mtimes = {
+            name: os.path.getmtime(os.path.join(self.directory, name))
+            for name in os.listdir(self.directory)
+            if os.path.isfile(os.path.join(self.directory, name))
+        }
+        if mtimes == self.mtimes:
+            return
+        self.mtimes = mtimes
+        self.assets, self.hashed = {}, {}
+        for name in mtimes:
+            if name == "index.html":
+                continue
+            with open(os.path.join(self.directory, name), "rb") as f:
+                body = f.read()
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            asset = Asset.build(body, media_type)
+            self.assets[name] = asset
+            self.hashed[self.hashed_name(name, asset.digest)] = name
+        self.index = self._build_index()
+
+    @staticmethod
+    def hashed_name(name: str, digest: str) -> str:
+        stem, ext = os.path.splitext(name)
+        return f"{stem}.{digest}{ext}"
+
+    def url(self, name: str) -> str:
+        return f"{self.prefix}/{self.hashed_name(name, self.assets[name].digest)}"
+
+    def lookup(self, name: str) -> Tuple[Optional[Asset], bool]:
+        """The asset behind a hashed or plain name, and whether it was hashed."""
+        if name in self.hashed:
+            return self.assets[self.hashed[name]], True
+        return self.assets.get(name), False
+
+    def _build_index(self) -> Asset:
+        with open(os.path.join(self.directory, "index.html"), "r") as f:
+            html = f.read()
+        import_map = {
+            "imports": {
+                f"{self.prefix}/{name}": self.url(name)
+                for name in sorted(self.assets)
+                if name.endswith(".js")
+            }
+        }
+        script = f'<script type="importmap">{json.dumps(import_map)}</script>\n    '
+        html = html.replace(
+            '<script type="module" src="game.js">',
+            script + f'<script type="module" src="{self.url("game.js")}">',
+        )
+        return Asset.build(html.encode(), "text/html")
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with a cache policy. Files under the immutable subdirectories
+    are named by their content and never change, so browsers keep them
+    without asking again; the rest are revalidated with their ETag.
+    """
+
+    def __init__(self, *args, immutable: Tuple[str, ...] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable = immutable
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        path = os.path.relpath(full_path, os.path.realpath(self.directory))
+        immutable = path.split(os.sep)[0] in self.immutable
+        response.headers["Cache-Control"] = IMMUTABLE if immutable else REVALIDATE
+        return response
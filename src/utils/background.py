@@ -0,0 +1,31 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+from src.utils.rng import get_rng, use_rng
+from src.utils.utils import load_config
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Shared pool for blocking LLM and image generation done ahead of time."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=load_config().get("background_workers", 4),
+            thread_name_prefix="background",
+        )
+    return _executor
+
+
+def submit(fn: Callable, *args, **kwargs) -> Future:
+    """
+    Run fn in the background. It gets its own RNG stream spawned from the
+    caller's, so background work never races the game's RNG.
+    """
+    rng = get_rng().spawn()
+
+    def run():
+        with use_rng(rng):
+            return fn(*args, **kwargs)
+
+    return get_executor().submit(run)
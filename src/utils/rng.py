@@ -0,0 +1,99 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, MutableSequence, Optional, Sequence, TypeVar
+import numpy as np
+
+T = TypeVar("T")
+
+
+class RNG:
+    """
+    Seeded random number service shared by skills, spells and locations.
+
+    Wraps one numpy Generator and records the seed it was created with, so a
+    battle or session can be reproduced. Scalar draws are served from a
+    pre-drawn batch of uniform floats instead of calling into NumPy for every
+    roll; array draws go to the generator directly.
+    """
+
+    def __init__(self, seed: int = None, buffer_size: int = 1024):
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        self.seed = seed
+        self.generator = np.random.default_rng(seed)
+        self.buffer_size = buffer_size
+        self._buffer: List[float] = []
+        self._index = 0
+
+    def spawn(self) -> RNG:
+        """Create a child RNG with its own seed drawn from this stream."""
+        return RNG(self.randint(0, 2**31 - 1), self.buffer_size)
+
+    def random(self) -> float:
+        """A uniform float in [0, 1)."""
+        if self._index >= len(self._buffer):
+            self._buffer = self.generator.random(self.buffer_size).tolist()
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def uniform(self, low: float = 0.0, high: float = 1.0, size: int = None):
+        if size is not None:
+            return self.generator.uniform(low, high, size)
+        return low + (high - low) * self.random()
+
+    def randint(self, low: int, high: int) -> int:
+        """A random integer in [low, high], both inclusive like random.randint."""
+        return low + int(self.random() * (high - low + 1))
+
+    def choice(self, items: Sequence[T]) -> T:
+        if not items:
+            raise IndexError("Cannot choose from an empty sequence")
+        return items[int(self.random() * len(items))]
+
+    def sample(self, items: Sequence[T], k: int) -> List[T]:
+        indices = self.generator.choice(len(items), k, replace=False)
+        return [items[i] for i in indices]
+
+    def shuffle(self, items: MutableSequence) -> None:
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+
+_session_rng: Optional[RNG] = None
+_active_rng: ContextVar[Optional[RNG]] = ContextVar("rng", default=None)
+
+
+def get_rng() -> RNG:
+    """Return the RNG of the running battle, or the session RNG outside of battles."""
+    rng = _active_rng.get()
+    if rng is not None:
+        return rng
+    return get_session_rng()
+
+
+def get_session_rng() -> RNG:
+    """The RNG of the current session, even while a battle is running."""
+    global _session_rng
+    if _session_rng is None:
+        _session_rng = RNG()
+    return _session_rng
+
+
+def seed_session(seed: int = None) -> RNG:
+    """Replace the session RNG, e.g. to make a whole run reproducible."""
+    global _session_rng
+    _session_rng = RNG(seed)
+    return _session_rng
+
+
+@contextmanager
+def use_rng(rng: RNG):
+    token = _active_rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _active_rng.reset(token)
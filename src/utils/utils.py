@@ -1,8 +1,8 @@
 from __future__ import annotations
 from collections import Counter
-import random
 import yaml
 from pathlib import Path
+from src.utils.rng import get_rng
 
 
 def create_unique_enemy_names(enemy_names):
@@ -64,7 +64,7 @@ def calculate_hit_outcome(
     miss_chance = max(0, min(miss_chance, 1))
 
     # Determine the outcome
-    roll = random.random()
+    roll = get_rng().random()
     if roll < miss_chance:
         return False, False  # Miss
     elif roll > (1 - crit_chance):
@@ -0,0 +1,15 @@
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The game reads .config.yaml from the working directory, some modules as soon
+# as they are imported, so run the tests from a directory holding the example
+_workdir = tempfile.mkdtemp(prefix="jrpg-tests-")
+shutil.copy(
+    os.path.join(ROOT, "config.yaml.example"), os.path.join(_workdir, ".config.yaml")
+)
+os.chdir(_workdir)
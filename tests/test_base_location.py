@@ -0,0 +1,39 @@
+import threading
+import pytest
+import src.npc.npc as npc_module
+from src.npc.boss_npc import BossNPC
+from src.npc.cast import get_cast
+from src.travel.field_location import FieldLocation
+
+
+@pytest.fixture
+def boss(monkeypatch):
+    monkeypatch.setattr(npc_module, "generate_npc_portrait", lambda *args: "x.png")
+    release = threading.Event()
+    monkeypatch.setattr(BossNPC, "_generate_prototype", lambda self: release.wait())
+    boss_data = {
+        "name": "Dread Knight",
+        "description": "A knight.",
+        "job_class": "Knight",
+        "backstory": "Fell.",
+    }
+    boss = BossNPC(boss_data, {"name": "Black Keep"}, 1)
+    get_cast().add_npc(boss)
+    yield boss
+    release.set()
+    get_cast().clear()
+
+
+def test_visiting_a_side_of_the_location_prepares_its_boss(boss):
+    location = FieldLocation.__new__(FieldLocation)
+    location.name = "Black Keep (West)"
+    assert boss.pending_prototype is None
+    location.prepare_bosses()
+    assert boss.pending_prototype is not None
+
+
+def test_other_locations_leave_the_boss_alone(boss):
+    location = FieldLocation.__new__(FieldLocation)
+    location.name = "Misty Woods (East)"
+    location.prepare_bosses()
+    assert boss.pending_prototype is None
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from src.battle.combat_state import CombatState
+from src.battle.simulate import make_hero, make_sim_enemy
+from src.battle.skills import Attack
+from src.utils.rng import RNG, use_rng
+
+
+@pytest.fixture
+def fighters():
+    with use_rng(RNG(0)):
+        return make_hero("Hero", 10), make_sim_enemy("Slime", 10, "regular")
+
+
+def test_duplicate_names_resolve_to_the_first_character():
+    with use_rng(RNG(0)):
+        first, second = [make_sim_enemy("Slime", 3, "regular") for _ in range(2)]
+    state = CombatState([first, second])
+    assert state.lookup("Slime") is first
+
+
+@pytest.mark.parametrize("defense", [0, 1, 7])
+def test_base_damage_matches_the_scalar_formula(fighters, defense):
+    hero, slime = fighters
+    slime.stats.defense = defense
+    state = CombatState([hero, slime])
+    rows = state.rows_of([slime])
+    with use_rng(RNG(5)):
+        vectorized = state.base_damage(hero, rows)
+    with use_rng(RNG(5)):
+        scalar = Attack().calculate_base_damage(hero, slime)
+    assert vectorized.tolist() == [scalar]
+    assert 0 < scalar < np.iinfo(np.int64).max
+
+
+def test_zero_defense_counts_as_one(fighters):
+    hero, slime = fighters
+    state = CombatState([hero, slime])
+    rows = state.rows_of([slime])
+    damage = {}
+    for defense in (0, 1):
+        slime.stats.defense = defense
+        state.refresh()
+        with use_rng(RNG(5)):
+            damage[defense] = state.base_damage(hero, rows).tolist()
+    assert damage[0] == damage[1]
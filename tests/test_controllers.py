@@ -0,0 +1,66 @@
+import pytest
+from src.battle.controllers import AIController
+from src.battle.simulate import make_hero, make_sim_enemy
+from src.core.enemies import EnemyParty
+from src.core.party import Party
+from src.core.spells import HealingSpell
+from src.utils.rng import RNG, use_rng
+
+
+@pytest.fixture
+def sides():
+    with use_rng(RNG(0)):
+        heroes = Party([make_hero(f"Hero {i}", 5) for i in range(3)], [])
+        enemies = EnemyParty(
+            [make_sim_enemy(f"Slime {i}", 5, "regular") for i in range(2)]
+        )
+    return heroes, enemies
+
+
+def knock_out(character):
+    character.stats.hp = 0
+    character.stats.alive = False
+
+
+def test_planned_attack_on_a_fallen_target_is_retargeted(sides):
+    heroes, enemies = sides
+    knock_out(heroes.characters[0])
+    controller = AIController(enemies.characters[0])
+    plan = {"action_type": "attack", "target": "Hero 0"}
+    with use_rng(RNG(0)):
+        action = controller.accept_planned_action(plan, enemies, heroes)
+    assert action["target"] in ("Hero 1", "Hero 2")
+
+
+def test_plan_is_dropped_when_no_target_is_left(sides):
+    heroes, enemies = sides
+    for hero in heroes.characters:
+        knock_out(hero)
+    controller = AIController(enemies.characters[0])
+    plan = {"action_type": "attack", "target": "Hero 0"}
+    assert controller.accept_planned_action(plan, enemies, heroes) is None
+
+
+def test_fallen_targets_are_invalid_except_for_revives(sides):
+    heroes, enemies = sides
+    knock_out(enemies.characters[1])
+    caster = enemies.characters[0]
+    caster.spells = [HealingSpell("Raise", "Revives.", 10, "ally", 10, revive=True)]
+    controller = AIController(caster)
+    attack = {"action_type": "attack", "target": "Slime 1"}
+    revive = {"action_type": "spell", "spell_name": "Raise", "target": "Slime 1"}
+    assert not controller.is_valid_action(attack, enemies, heroes)
+    assert controller.is_valid_action(revive, enemies, heroes)
+
+
+def test_random_fallback_only_picks_living_enemies(sides):
+    heroes, enemies = sides
+    knock_out(heroes.characters[1])
+    knock_out(heroes.characters[2])
+    controller = AIController(enemies.characters[0])
+    for seed in range(20):
+        with use_rng(RNG(seed)):
+            action = controller._validate_target(
+                {"action_type": "attack", "target": "nobody"}, enemies, heroes
+            )
+        assert action["target"] == "Hero 0"
@@ -0,0 +1,38 @@
+from src.battle.decision_cache import get_decision_cache
+from src.utils.rng import RNG, seed_session, use_rng
+
+
+class State:
+    def __init__(self, key):
+        self.key = key
+
+
+def test_sessions_do_not_share_decisions():
+    seed_session(1)
+    first = get_decision_cache()
+    first.put(State("two slimes"), {"action_type": "defend"})
+    assert get_decision_cache() is first
+
+    seed_session(1)
+    second = get_decision_cache()
+    assert second is not first
+    assert second.get(State("two slimes"), {}) is None
+    assert first.get(State("two slimes"), {}) == {"action_type": "defend"}
+
+
+def test_battles_use_their_session_cache():
+    seed_session(2)
+    cache = get_decision_cache()
+    with use_rng(RNG(7)):
+        assert get_decision_cache() is cache
+
+
+def test_least_recently_used_decisions_are_dropped_first():
+    seed_session(3)
+    cache = get_decision_cache()
+    cache.max_size = 2
+    for key in ("a", "b"):
+        cache.put(State(key), {"action_type": "defend"})
+    cache.get(State("a"), {})
+    cache.put(State("c"), {"action_type": "defend"})
+    assert list(cache.decisions) == ["a", "c"]
@@ -0,0 +1,90 @@
+from collections import Counter
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from src.battle.turn_scheduler import TurnScheduler
+
+
+class Combatant:
+    def __init__(self, name, speed):
+        self.name = name
+        self.stats = SimpleNamespace(speed=speed, alive=True)
+
+
+def baseline_turns(characters, count):
+    """The turn loop Battle ran before TurnScheduler."""
+    time_units = {char: 0 for char in characters}
+    turns = []
+    for _ in range(count):
+        alive = {char: tu for char, tu in time_units.items() if char.stats.alive}
+        for char in alive:
+            time_units[char] += np.log2(char.stats.speed + 1)
+        actor = max(alive, key=time_units.get)
+        time_units[actor] = 0
+        turns.append(actor.name)
+    return turns
+
+
+def scheduler_turns(characters, count):
+    scheduler = TurnScheduler(characters)
+    turns = []
+    for _ in range(count):
+        predicted = scheduler.predict_turn_order()
+        actor = scheduler.next_actor()
+        assert predicted[0] is actor
+        turns.append(actor.name)
+    return turns
+
+
+SPEED_MIXES = [(10, 30), (5, 10, 20), (10, 10, 10), (1, 7, 7, 50, 3), (12, 25, 40, 8)]
+
+
+@pytest.mark.parametrize("speeds", SPEED_MIXES)
+def test_turn_sequence_matches_baseline(speeds):
+    characters = [Combatant(f"c{i}", speed) for i, speed in enumerate(speeds)]
+    assert scheduler_turns(characters, 300) == baseline_turns(characters, 300)
+
+
+def test_two_characters_alternate_whatever_their_speeds():
+    characters = [Combatant("slow", 10), Combatant("fast", 30)]
+    assert Counter(scheduler_turns(characters, 100)) == {"slow": 50, "fast": 50}
+
+
+def test_speed_changes_and_deaths_match_baseline():
+    def play(turns_of):
+        characters = [Combatant(f"c{i}", s) for i, s in enumerate((8, 15, 30))]
+        turns = []
+        for step in range(120):
+            if step == 20:
+                characters[2].stats.speed = 60
+            if step == 50:
+                characters[1].stats.alive = False
+            if step == 80:
+                characters[1].stats.alive = True
+            turns.append(turns_of(characters, step))
+        return turns
+
+    baseline_units = {}
+
+    def baseline_step(characters, step):
+        for char in characters:
+            baseline_units.setdefault(char, 0)
+        alive = [char for char in characters if char.stats.alive]
+        for char in alive:
+            baseline_units[char] += np.log2(char.stats.speed + 1)
+        actor = max(alive, key=baseline_units.get)
+        baseline_units[actor] = 0
+        return actor.name
+
+    schedulers = {}
+
+    def scheduler_step(characters, step):
+        scheduler = schedulers.setdefault("s", TurnScheduler(characters))
+        if step == 20:
+            scheduler.update_speed(characters[2])
+        predicted = scheduler.predict_turn_order()
+        actor = scheduler.next_actor()
+        assert predicted[0] is actor
+        return actor.name
+
+    assert play(scheduler_step) == play(baseline_step)
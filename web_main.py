@@ -1,10 +1,9 @@
 import json
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
 from src.game.jrpg import JRPG
 from src.game.response_manager import ResponseManager
+from src.utils.assets import IMMUTABLE, REVALIDATE, CachedStaticFiles, FrontendAssets
 import os
 import asyncio
 import traceback
@@ -21,11 +20,17 @@ app.add_middleware(
 )
 
 # Serve static files
-app.mount("/static", StaticFiles(directory="frontend"), name="static")
+app.mount("/static", CachedStaticFiles(directory="frontend"), name="static")
 # check if images folder exists, if not create it
 if not os.path.exists("images"):
     os.makedirs("images")
-app.mount("/images", StaticFiles(directory="images"), name="images")
+# Stored images are named by a hash of what they show, so they never change
+app.mount(
+    "/images",
+    CachedStaticFiles(directory="images", immutable=("store",)),
+    name="images",
+)
+frontend_assets = FrontendAssets()
 
 # Initialize game instances
 response_manager = ResponseManager()
@@ -76,14 +81,24 @@ async def websocket_endpoint(websocket: WebSocket):
 
 # Serve index.html at the root
 @app.get("/")
-async def read_root():
-    return FileResponse("frontend/index.html")
+async def read_root(request: Request):
+    frontend_assets.refresh()
+    return frontend_assets.index.response(request, REVALIDATE)
+
+
+# Frontend files by hashed name, or by plain name for browsers without import maps
+@app.get("/assets/{name}")
+async def read_asset(name: str, request: Request):
+    asset, hashed = frontend_assets.lookup(name)
+    if asset is None:
+        raise HTTPException(status_code=404)
+    return asset.response(request, IMMUTABLE if hashed else REVALIDATE)
 
 
 # Fallback route for other paths
 @app.get("/{full_path:path}")
-async def catch_all(full_path: str):
-    frontend_path = os.path.join("frontend", full_path)
-    if os.path.exists(frontend_path):
-        return FileResponse(frontend_path)
-    return FileResponse("frontend/index.html")
+async def catch_all(full_path: str, request: Request):
+    asset, _ = frontend_assets.lookup(full_path)
+    if asset is not None:
+        return asset.response(request, REVALIDATE)
+    return await read_root(request)